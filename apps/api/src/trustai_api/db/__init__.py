@@ -1,3 +1,3 @@
-from trustai_api.db.models import Base, IdempotencyKey, Job, Proof
+from trustai_api.db.models import Base, IdempotencyKey, Job, Proof, ProofBlob
 
-__all__ = ["Base", "IdempotencyKey", "Job", "Proof"]
+__all__ = ["Base", "IdempotencyKey", "Job", "Proof", "ProofBlob"]
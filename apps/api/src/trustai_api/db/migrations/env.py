@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+from trustai_api.db.models import Base
+from trustai_api.settings import get_settings
+
+target_metadata = Base.metadata
+
+
+def _database_url() -> str:
+    return context.config.get_main_option("sqlalchemy.url") or get_settings().database_url
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    engine = create_engine(_database_url(), poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        # Batch mode lets SQLite recreate tables for ALTER COLUMN; Postgres alters in place.
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=True,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,50 @@
+"""Store proofs as compressed cores plus deduplicated blobs.
+
+Revision ID: 0001_proof_storage
+Revises:
+Create Date: 2026-10-19
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0001_proof_storage"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "proof_blobs",
+        sa.Column("content_hash", sa.String(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("codec", sa.String(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+    )
+    with op.batch_alter_table("proofs") as batch:
+        batch.add_column(sa.Column("evidence_manifest_hash", sa.String(), nullable=True))
+        batch.add_column(sa.Column("final_answer", sa.Text(), nullable=True))
+        batch.add_column(sa.Column("iteration_count", sa.Integer(), nullable=True))
+        batch.add_column(sa.Column("payload_blob", sa.LargeBinary(), nullable=True))
+        batch.add_column(sa.Column("payload_codec", sa.String(), nullable=True))
+        batch.alter_column("payload_json", existing_type=sa.Text(), nullable=True)
+
+
+def downgrade() -> None:
+    blob_rows = op.get_bind().scalar(
+        sa.text("SELECT COUNT(*) FROM proofs WHERE payload_json IS NULL")
+    )
+    if blob_rows:
+        # Blob-format rows have no payload_json to fall back to; refuse rather than drop proofs.
+        raise RuntimeError(f"{blob_rows} proofs are stored as blobs; cannot downgrade")
+    with op.batch_alter_table("proofs") as batch:
+        batch.alter_column("payload_json", existing_type=sa.Text(), nullable=False)
+        batch.drop_column("payload_codec")
+        batch.drop_column("payload_blob")
+        batch.drop_column("iteration_count")
+        batch.drop_column("final_answer")
+        batch.drop_column("evidence_manifest_hash")
+    op.drop_table("proof_blobs")
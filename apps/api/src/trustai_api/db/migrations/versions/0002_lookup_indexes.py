@@ -0,0 +1,26 @@
+"""Index the columns hot lookups filter on.
+
+Revision ID: 0002_lookup_indexes
+Revises: 0001_proof_storage
+Create Date: 2026-10-19
+"""
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0002_lookup_indexes"
+down_revision = "0001_proof_storage"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Sync verify replays stored proofs by request hash.
+    op.create_index("ix_proofs_request_hash", "proofs", ["request_hash"])
+    # The idempotency sweeper deletes by expires_at <= now.
+    op.create_index("ix_idempotency_keys_expires_at", "idempotency_keys", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_idempotency_keys_expires_at", table_name="idempotency_keys")
+    op.drop_index("ix_proofs_request_hash", table_name="proofs")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, LargeBinary, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -19,11 +19,27 @@ class Proof(Base):
     pack_fingerprint: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False)
     score: Mapped[float] = mapped_column(Float, nullable=False)
-    payload_json: Mapped[str] = mapped_column(Text, nullable=False)
-    request_hash: Mapped[str | None] = mapped_column(String, nullable=True)
+    evidence_manifest_hash: Mapped[str | None] = mapped_column(String, nullable=True)
+    final_answer: Mapped[str | None] = mapped_column(Text, nullable=True)
+    iteration_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Legacy rows keep the full payload here; new rows store a compressed core in payload_blob.
+    payload_json: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
+    payload_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    payload_codec: Mapped[str | None] = mapped_column(String, nullable=True)
+    request_hash: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
     metadata_json: Mapped[dict | None] = mapped_column("metadata", JSON, nullable=True)
 
 
+class ProofBlob(Base):
+    __tablename__ = "proof_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    codec: Mapped[str] = mapped_column(String, nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
 class Job(Base):
     __tablename__ = "jobs"
 
@@ -53,4 +69,4 @@ class IdempotencyKey(Base):
     job_id: Mapped[str | None] = mapped_column(String, nullable=True)
     proof_id: Mapped[str | None] = mapped_column(String, nullable=True)
     response_json: Mapped[str | None] = mapped_column(Text, nullable=True)
-    expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
+from starlette.concurrency import run_in_threadpool
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+T = TypeVar("T")
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
 
 
 def create_engine_from_url(database_url: str) -> Engine:
@@ -20,3 +35,64 @@ def create_engine_from_url(database_url: str) -> Engine:
 
 def create_sessionmaker(engine: Engine) -> sessionmaker:
     return sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+def async_database_url(database_url: str) -> str:
+    scheme, separator, rest = database_url.partition("://")
+    driver = _ASYNC_DRIVERS.get(scheme.split("+", 1)[0])
+    if not separator or driver is None:
+        raise ValueError(f"No async driver configured for database URL scheme '{scheme}'")
+    return f"{driver}://{rest}"
+
+
+def create_async_engine_from_url(database_url: str) -> AsyncEngine:
+    if database_url.startswith("sqlite:///:memory:"):
+        # A second engine would open its own empty in-memory database, not share the sync one.
+        raise ValueError("Native async mode needs a file or server database, not sqlite :memory:")
+    # Imported lazily: the asyncio extension requires greenlet plus an async driver.
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    return create_async_engine(async_database_url(database_url))
+
+
+def create_async_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+class AsyncDB(Protocol):
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class ThreadpoolDB:
+    """Runs sync session work off the event loop, one call at a time."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        self._lock = asyncio.Lock()
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        # Sessions are not thread-safe; concurrent tasks sharing one must take turns.
+        async with self._lock:
+            return await run_in_threadpool(fn, self.session, *args, **kwargs)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.session.close)
+
+
+class NativeAsyncDB:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self._lock = asyncio.Lock()
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        async with self._lock:
+            return await self.session.run_sync(fn, *args, **kwargs)
+
+    async def close(self) -> None:
+        await self.session.close()
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 from fastapi import Request
 from sqlalchemy.orm import Session
+from trustai_core.duty.base import DutyCalculator
+from trustai_core.packs.tariff_ca.duty.calculator import CADutyCalculator
+from trustai_core.packs.tariff_us.duty.calculator import USDutyCalculator
 
 from trustai_api.db.models import Base
-from trustai_api.db.session import create_engine_from_url, create_sessionmaker
-from trustai_api.queue.rq import create_queue
+from trustai_api.db.session import (
+    AsyncDB,
+    NativeAsyncDB,
+    ThreadpoolDB,
+    create_async_engine_from_url,
+    create_async_sessionmaker,
+    create_engine_from_url,
+    create_sessionmaker,
+)
+from trustai_api.queue.rq import QueueLayout, create_queue
+from trustai_api.services.idempotency import AsyncIdempotencyStore, IdempotencyStore
+from trustai_api.services.idempotency_cache import create_idempotency_cache
+from trustai_api.services.job_events import JobEventBus, create_job_event_bus
+from trustai_api.services.result_cache import VerifyResultCache
 from trustai_api.services.verifier_service import VerifierService
 from trustai_api.settings import Settings, get_settings
 
@@ -22,8 +37,25 @@ def init_app_state(app) -> None:
     app.state.settings = settings
     app.state.engine = engine
     app.state.SessionLocal = SessionLocal
-    app.state.queue = create_queue(settings.redis_url)
+    app.state.AsyncSessionLocal = None
+    if settings.db_async_mode == "native":
+        app.state.async_engine = create_async_engine_from_url(settings.database_url)
+        app.state.AsyncSessionLocal = create_async_sessionmaker(app.state.async_engine)
+    app.state.queue = create_queue(settings.redis_url, QueueLayout.from_settings(settings))
+    app.state.job_events = create_job_event_bus(settings.redis_url)
+    app.state.idempotency_store = AsyncIdempotencyStore(
+        IdempotencyStore(ttl_s=settings.idempotency_ttl_s),
+        cache=create_idempotency_cache(settings.redis_url, settings.idempotency_cache_max_entries),
+    )
     app.state.verifier_service = VerifierService(settings)
+    app.state.verify_result_cache = VerifyResultCache(
+        ttl_s=settings.verify_cache_ttl_s,
+        max_entries=settings.verify_cache_max_entries,
+    )
+    app.state.duty_calculators = {
+        "US": USDutyCalculator(settings.storage_root / "tariff_us" / "rates"),
+        "CA": CADutyCalculator(settings.storage_root / "tariff_ca" / "rates"),
+    }
 
 
 def get_settings_dep(request: Request) -> Settings:
@@ -39,9 +71,40 @@ def get_db(request: Request) -> Generator[Session, None, None]:
         db.close()
 
 
+def open_async_db(app) -> AsyncDB:
+    async_session_local = app.state.AsyncSessionLocal
+    if async_session_local is not None:
+        return NativeAsyncDB(async_session_local())
+    return ThreadpoolDB(app.state.SessionLocal())
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncDB, None]:
+    db = open_async_db(request.app)
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
 def get_queue(request: Request) -> Any:
     return request.app.state.queue
 
 
 def get_verifier_service(request: Request) -> VerifierService:
     return request.app.state.verifier_service
+
+
+def get_job_events(request: Request) -> JobEventBus:
+    return request.app.state.job_events
+
+
+def get_idempotency_store(request: Request) -> AsyncIdempotencyStore:
+    return request.app.state.idempotency_store
+
+
+def get_verify_result_cache(request: Request) -> VerifyResultCache:
+    return request.app.state.verify_result_cache
+
+
+def get_duty_calculators(request: Request) -> dict[str, DutyCalculator]:
+    return request.app.state.duty_calculators
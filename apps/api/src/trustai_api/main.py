@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 
 from fastapi import FastAPI
@@ -7,12 +8,15 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from trustai_api.deps import init_app_state
 from trustai_api.routes import (
+    duty_router,
     health_router,
     jobs_router,
     packs_router,
     proofs_router,
+    verify_batch_router,
     verify_router,
 )
+from trustai_api.services.idempotency import sweep_expired_keys
 
 
 def create_app() -> FastAPI:
@@ -33,12 +37,30 @@ def create_app() -> FastAPI:
 
     app.include_router(health_router)
     app.include_router(verify_router)
+    app.include_router(verify_batch_router)
     app.include_router(jobs_router)
     app.include_router(proofs_router)
     app.include_router(packs_router)
+    app.include_router(duty_router)
 
     @app.on_event("startup")
-    def startup() -> None:
+    async def startup() -> None:
         init_app_state(app)
+        app.state.idempotency_sweeper = None
+        interval_s = app.state.settings.idempotency_sweep_interval_s
+        if interval_s > 0:
+            app.state.idempotency_sweeper = asyncio.create_task(
+                sweep_expired_keys(app.state.SessionLocal, interval_s)
+            )
+
+    @app.on_event("shutdown")
+    async def shutdown() -> None:
+        sweeper = getattr(app.state, "idempotency_sweeper", None)
+        if sweeper is not None:
+            sweeper.cancel()
+            await asyncio.gather(sweeper, return_exceptions=True)
+        async_engine = getattr(app.state, "async_engine", None)
+        if async_engine is not None:
+            await async_engine.dispose()
 
     return app
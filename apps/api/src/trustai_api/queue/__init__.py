@@ -1,3 +1,3 @@
-from trustai_api.queue.rq import create_queue, enqueue_verify
+from trustai_api.queue.rq import LaneQueue, QueueLayout, create_queue, enqueue_verify
 
-__all__ = ["create_queue", "enqueue_verify"]
+__all__ = ["LaneQueue", "QueueLayout", "create_queue", "enqueue_verify"]
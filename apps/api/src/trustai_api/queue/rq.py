@@ -1,25 +1,142 @@
 from __future__ import annotations
 
+import itertools
+import threading
+import zlib
+from dataclasses import dataclass
 from typing import Any
 
 from redis import Redis
 from redis.exceptions import RedisError
 from rq import Queue
 
+from trustai_api.settings import Settings
 
-def create_queue(redis_url: str) -> Queue | None:
+VERIFY_FUNC = "trustai_worker.tasks.run_deep_verify"
+LEGACY_QUEUE = "trustai"
+LANES = ("interactive", "bulk")
+
+
+@dataclass(frozen=True)
+class QueueLayout:
+    """Maps (lane, fairness key) to RQ queue names and decides the dequeue order.
+
+    Each lane is split into ``shards`` queues; a tenant or pack always lands on
+    the same shard, and workers rotate through shards so one busy key cannot
+    monopolise its lane. Interactive work goes first except on every
+    ``interactive_weight + 1``-th dequeue, which gives bulk a guaranteed share.
+    """
+
+    shards: int = 4
+    interactive_weight: int = 4
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> QueueLayout:
+        return cls(
+            shards=settings.queue_fair_shards,
+            interactive_weight=settings.queue_interactive_weight,
+        )
+
+    def queue_name(self, lane: str, fairness_key: str | None) -> str:
+        if lane not in LANES:
+            raise ValueError(f"Unknown queue lane: {lane}")
+        shard = zlib.crc32((fairness_key or "").encode()) % max(self.shards, 1)
+        return f"trustai-{lane}-{shard}"
+
+    def lane_queue_names(self, lane: str) -> list[str]:
+        return [f"trustai-{lane}-{shard}" for shard in range(max(self.shards, 1))]
+
+    def dequeue_order(self, tick: int) -> list[str]:
+        lanes = list(LANES)
+        if self.interactive_weight >= 0 and tick % (self.interactive_weight + 1) == (
+            self.interactive_weight
+        ):
+            lanes.reverse()
+        names: list[str] = []
+        for lane in lanes:
+            shard_names = self.lane_queue_names(lane)
+            offset = tick % len(shard_names)
+            names.extend(shard_names[offset:] + shard_names[:offset])
+        # Jobs enqueued before lanes existed still drain, after everything else.
+        names.append(LEGACY_QUEUE)
+        return names
+
+
+class LaneQueue:
+    """Routes verify jobs onto lane/shard RQ queues and dedupes them by request hash."""
+
+    def __init__(self, connection: Redis, layout: QueueLayout | None = None) -> None:
+        self.connection = connection
+        self.layout = layout or QueueLayout()
+        self._queues: dict[str, Queue] = {}
+        self._ticks = itertools.count()
+        self._lock = threading.Lock()
+
+    def queue(self, name: str) -> Queue:
+        with self._lock:
+            if name not in self._queues:
+                self._queues[name] = Queue(name, connection=self.connection)
+            return self._queues[name]
+
+    def all_queues(self) -> list[Queue]:
+        return [self.queue(name) for name in self.layout.dequeue_order(0)]
+
+    def ordered_queues(self) -> list[Queue]:
+        return [self.queue(name) for name in self.layout.dequeue_order(next(self._ticks))]
+
+    def enqueue(
+        self,
+        func: str,
+        *args: Any,
+        lane: str = "interactive",
+        fairness_key: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        queue = self.queue(self.layout.queue_name(lane, fairness_key))
+        return queue.enqueue(func, *args, **kwargs)
+
+    def claim(self, request_hash: str, job_id: str, ttl_s: int) -> str | None:
+        """Registers ``job_id`` for ``request_hash``; returns the job already holding it."""
+        if ttl_s <= 0:
+            return None
+        key = _dedupe_key(request_hash)
+        if self.connection.set(key, job_id, nx=True, ex=ttl_s):
+            return None
+        existing = self.connection.get(key)
+        if existing is None:
+            return None
+        return existing.decode() if isinstance(existing, bytes) else existing
+
+    def reclaim(self, request_hash: str, job_id: str, ttl_s: int) -> None:
+        if ttl_s > 0:
+            self.connection.set(_dedupe_key(request_hash), job_id, ex=ttl_s)
+
+
+def _dedupe_key(request_hash: str) -> str:
+    return f"trustai:dedupe:{request_hash}"
+
+
+def create_queue(redis_url: str, layout: QueueLayout | None = None) -> LaneQueue | None:
     try:
         connection = Redis.from_url(redis_url)
         connection.ping()
     except RedisError:
         return None
-    return Queue("trustai", connection=connection)
+    return LaneQueue(connection, layout)
 
 
-def enqueue_verify(queue: Queue, job_id: str, payload: dict[str, Any]) -> str:
+def enqueue_verify(
+    queue: Any,
+    job_id: str,
+    payload: dict[str, Any],
+    lane: str = "interactive",
+    fairness_key: str | None = None,
+) -> str:
     queue.enqueue(
-        "trustai_worker.tasks.run_deep_verify",
+        VERIFY_FUNC,
         job_id,
         payload,
+        lane=lane,
+        fairness_key=fairness_key,
     )
     return job_id
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from trustai_core.duty.base import DutyCalculator
+from trustai_core.duty.models import DutyBreakdown, DutyFlow
+from trustai_core.duty.scenarios import DutyScenario, calculate_scenario
+
+from trustai_api.deps import get_duty_calculators, get_settings_dep
+from trustai_api.schemas import DutyBatchRequest, DutyBatchRow
+from trustai_api.settings import Settings
+
+router = APIRouter()
+
+_CHUNK_ROWS = 256
+
+
+@router.post("/v1/duty/batch")
+def duty_batch(
+    body: DutyBatchRequest,
+    settings: Settings = Depends(get_settings_dep),
+    calculators: dict[str, DutyCalculator] = Depends(get_duty_calculators),
+) -> StreamingResponse:
+    if len(body.rows) > settings.duty_batch_max_rows:
+        raise HTTPException(
+            status_code=413,
+            detail={
+                "message": "Too many rows",
+                "max_rows": settings.duty_batch_max_rows,
+            },
+        )
+    return StreamingResponse(
+        _stream_rows(body, calculators),
+        media_type="application/x-ndjson",
+    )
+
+
+def _stream_rows(
+    body: DutyBatchRequest,
+    calculators: dict[str, DutyCalculator],
+) -> Iterator[bytes]:
+    memo: dict[tuple[str, DutyScenario], DutyBreakdown] = {}
+    flows = {
+        jurisdiction: DutyFlow(importing_country=jurisdiction)
+        for jurisdiction in calculators
+    }
+    chunk: list[bytes] = []
+    for index, row in enumerate(body.rows):
+        jurisdiction = row.jurisdiction or body.jurisdiction
+        payload = _evaluate_row(
+            index,
+            row,
+            jurisdiction,
+            calculators[jurisdiction],
+            flows[jurisdiction],
+            memo,
+            body.include_breakdown,
+        )
+        chunk.append(orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE))
+        if len(chunk) >= _CHUNK_ROWS:
+            yield b"".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"".join(chunk)
+
+
+def _evaluate_row(
+    index: int,
+    row: DutyBatchRow,
+    jurisdiction: str,
+    calculator: DutyCalculator,
+    flow: DutyFlow,
+    memo: dict[tuple[str, DutyScenario], DutyBreakdown],
+    include_breakdown: bool,
+) -> dict[str, object]:
+    payload: dict[str, object] = {
+        "index": index,
+        "jurisdiction": jurisdiction,
+        "line_id": row.line_id,
+        "origin_country": row.origin_country,
+        "preference_program": row.preference_program,
+    }
+    has_line = getattr(calculator, "has_line", None)
+    if has_line is not None and not has_line(row.line_id):
+        payload["status"] = "unknown_line"
+        payload["effective_date"] = row.effective_date
+        return payload
+    scenario = DutyScenario(
+        line_id=row.line_id,
+        origin_country=row.origin_country,
+        preference_program=row.preference_program,
+        effective_date=row.effective_date,
+    )
+    key = (jurisdiction, scenario)
+    breakdown = memo.get(key)
+    if breakdown is None:
+        try:
+            breakdown = calculate_scenario(calculator, flow, scenario)
+        except ValueError as exc:
+            payload["status"] = "error"
+            payload["effective_date"] = row.effective_date
+            payload["error"] = str(exc)
+            return payload
+        memo[key] = breakdown
+    payload["status"] = "ok"
+    payload["effective_date"] = breakdown.effective_date
+    payload["total_rate_pct"] = breakdown.total_rate_pct
+    payload["applied_layer_ids"] = breakdown.applied_layer_ids
+    if row.customs_value is not None:
+        payload["customs_value"] = row.customs_value
+        payload["duty_amount"] = round(row.customs_value * breakdown.total_rate_pct / 100, 2)
+    if include_breakdown:
+        payload["breakdown"] = breakdown.model_dump()
+    return payload
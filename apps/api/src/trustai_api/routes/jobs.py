@@ -1,22 +1,36 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from typing import Any
+
 import orjson
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
-from trustai_api.deps import get_db
+from trustai_api.db.models import Job
+from trustai_api.db.session import AsyncDB
+from trustai_api.deps import get_async_db, get_job_events, open_async_db
+from trustai_api.routes.utils import parse_fields
 from trustai_api.schemas import JobStatusResponse
-from trustai_api.services.job_store import JobStore
-from trustai_api.services.proof_store import ProofStore
+from trustai_api.services.job_events import TERMINAL_EVENTS, JobEvent, JobEventBus
+from trustai_api.services.job_store import AsyncJobStore
+from trustai_api.services.proof_store import AsyncProofStore
 
 router = APIRouter()
 
+_EVENTS_BLOCK_MS = 15000
+
 
 @router.get("/v1/jobs/{job_id}", response_model=JobStatusResponse, response_model_exclude_none=True)
-def get_job(job_id: str, db: Session = Depends(get_db)) -> dict:
-    job_store = JobStore()
-    proof_store = ProofStore()
-    job = job_store.get(db, job_id)
+async def get_job(
+    job_id: str,
+    fields: str | None = Query(default=None),
+    db: AsyncDB = Depends(get_async_db),
+) -> dict:
+    selected = parse_fields(fields)
+    job_store = AsyncJobStore()
+    proof_store = AsyncProofStore()
+    job = await job_store.get(db, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     payload = {
@@ -26,7 +40,68 @@ def get_job(job_id: str, db: Session = Depends(get_db)) -> dict:
         "error": job.error,
     }
     if job.proof_id:
-        proof = proof_store.get(db, job.proof_id)
-        if proof:
-            payload["result"] = orjson.loads(proof.payload_json)
+        result = await proof_store.get_payload(db, job.proof_id, selected)
+        if result is not None:
+            payload["result"] = result
     return payload
+
+
+@router.get("/v1/jobs/{job_id}/events")
+async def get_job_events_stream(
+    job_id: str,
+    request: Request,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    db: AsyncDB = Depends(get_async_db),
+    bus: JobEventBus = Depends(get_job_events),
+) -> StreamingResponse:
+    job = await AsyncJobStore().get(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        _stream_job_events(request, bus, job_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_job_events(
+    request: Request,
+    bus: JobEventBus,
+    job_id: str,
+    after: str | None,
+) -> AsyncIterator[bytes]:
+    events = await bus.read(job_id, after)
+    while True:
+        for event in events:
+            yield _format_sse(event.id, event.kind, event.data)
+            after = event.id
+            if event.kind in TERMINAL_EVENTS:
+                return
+        if await request.is_disconnected():
+            return
+        if not events:
+            # The worker may have finished before publishing (or without a shared bus).
+            terminal = await _terminal_event(request.app, job_id)
+            if terminal is not None:
+                yield _format_sse(None, terminal.kind, terminal.data)
+                return
+            yield b": keepalive\n\n"
+        events = await bus.read(job_id, after, block_ms=_EVENTS_BLOCK_MS)
+
+
+async def _terminal_event(app: Any, job_id: str) -> JobEvent | None:
+    db = open_async_db(app)
+    try:
+        job: Job | None = await AsyncJobStore().get(db, job_id)
+    finally:
+        await db.close()
+    if job is None or job.status not in TERMINAL_EVENTS:
+        return None
+    if job.status == "done":
+        return JobEvent(id="", kind="done", data={"proof_id": job.proof_id})
+    return JobEvent(id="", kind="failed", data={"error": job.error})
+
+
+def _format_sse(event_id: str | None, kind: str, data: dict[str, Any]) -> bytes:
+    prefix = f"id: {event_id}\n" if event_id else ""
+    return f"{prefix}event: {kind}\n".encode() + b"data: " + orjson.dumps(data) + b"\n\n"
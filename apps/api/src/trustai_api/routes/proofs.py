@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import orjson
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
 
-from trustai_api.deps import get_db
+from trustai_api.db.session import AsyncDB
+from trustai_api.deps import get_async_db
+from trustai_api.routes.utils import parse_fields
 from trustai_api.schemas import ProofResponse
-from trustai_api.services.proof_store import ProofStore
+from trustai_api.services.proof_store import AsyncProofStore
 
 router = APIRouter()
 
@@ -16,9 +16,14 @@ router = APIRouter()
     response_model=ProofResponse,
     response_model_exclude_none=True,
 )
-def get_proof(proof_id: str, db: Session = Depends(get_db)) -> dict:
-    proof_store = ProofStore()
-    proof = proof_store.get(db, proof_id)
-    if not proof:
+async def get_proof(
+    proof_id: str,
+    fields: str | None = Query(default=None),
+    db: AsyncDB = Depends(get_async_db),
+) -> dict:
+    selected = parse_fields(fields)
+    proof_store = AsyncProofStore()
+    payload = await proof_store.get_payload(db, proof_id, selected)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Proof not found")
-    return {"proof_id": proof.proof_id, "payload": orjson.loads(proof.payload_json)}
+    return {"proof_id": proof_id, "payload": payload}
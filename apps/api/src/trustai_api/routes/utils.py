@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import HTTPException
 from pydantic import ValidationError
 from trustai_core.schemas.atoms import AtomModel
 from trustai_core.packs.tariff.models import TariffVerificationResult
 from trustai_core.schemas.proof import VerificationResult
+from trustai_core.utils.hashing import sha256_canonical_json
 
+from trustai_api.services.proof_store import PAYLOAD_FIELDS
 from trustai_api.settings import Settings
 
 
@@ -26,6 +30,45 @@ def resolve_pack(settings: Settings, pack_header: str | None) -> str:
     return pack
 
 
+def verify_request_hash(
+    input_text: str,
+    pack: str,
+    mode: str,
+    options: dict[str, Any] | None,
+    evidence: list[str] | None,
+) -> str:
+    return sha256_canonical_json(
+        {
+            "input": input_text,
+            "pack": pack,
+            "mode": mode,
+            "options": options,
+            "evidence": evidence,
+        }
+    )
+
+
+def parse_fields(raw: str | None) -> set[str] | None:
+    if raw is None:
+        return None
+    fields = {item.strip() for item in raw.split(",") if item.strip()}
+    unknown = sorted(
+        name
+        for name in fields
+        if name not in PAYLOAD_FIELDS and not (name.startswith("proof.") and len(name) > 6)
+    )
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": "Unknown fields",
+                "fields": unknown,
+                "allowed": list(PAYLOAD_FIELDS),
+            },
+        )
+    return fields
+
+
 def _atom_to_text(atom: AtomModel) -> str:
     truth = "true" if atom.is_true else "false"
     return f"{atom.subject} {atom.predicate} {atom.obj} ({truth})"
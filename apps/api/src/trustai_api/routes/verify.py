@@ -7,18 +7,34 @@ from uuid import uuid4
 import orjson
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from trustai_core.llm.base import LLMError
-from trustai_core.utils.hashing import sha256_canonical_json
 
-from trustai_api.deps import get_db, get_queue, get_settings_dep, get_verifier_service
+from trustai_api.db.session import AsyncDB
+from trustai_api.deps import (
+    get_async_db,
+    get_idempotency_store,
+    get_queue,
+    get_settings_dep,
+    get_verifier_service,
+    get_verify_result_cache,
+)
 from trustai_api.queue.rq import enqueue_verify
-from trustai_api.routes.utils import normalize_verification_result, resolve_pack
+from trustai_api.routes.utils import (
+    normalize_verification_result,
+    resolve_pack,
+    verify_request_hash,
+)
 from trustai_api.schemas import VerificationResultResponse, VerifyAsyncResponse, VerifyRequest
-from trustai_api.services.idempotency import IdempotencyStore
-from trustai_api.services.job_store import JobStore
-from trustai_api.services.proof_store import ProofStore
-from trustai_api.services.verifier_service import VerifierService, VerifyOptions
+from trustai_api.services.idempotency import AsyncIdempotencyStore
+from trustai_api.services.job_store import AsyncJobStore
+from trustai_api.services.proof_store import AsyncProofStore
+from trustai_api.services.result_cache import VerifyResultCache
+from trustai_api.services.verifier_service import (
+    VerifierService,
+    VerifyOptions,
+    pack_fingerprint,
+)
 from trustai_api.settings import Settings
 
 router = APIRouter()
@@ -36,10 +52,13 @@ async def verify(
     x_request_id: str | None = Header(default=None, alias="X-Request-Id"),
     x_pack: str | None = Header(default=None, alias="X-TrustAI-Pack"),
     x_trustai_debug: str | None = Header(default=None, alias="X-TrustAI-Debug"),
-    db: Session = Depends(get_db),
+    x_tenant: str | None = Header(default=None, alias="X-TrustAI-Tenant"),
+    db: AsyncDB = Depends(get_async_db),
     settings: Settings = Depends(get_settings_dep),
     queue: Any = Depends(get_queue),
     verifier: VerifierService = Depends(get_verifier_service),
+    result_cache: VerifyResultCache = Depends(get_verify_result_cache),
+    idempotency_store: AsyncIdempotencyStore = Depends(get_idempotency_store),
 ) -> dict[str, Any] | JSONResponse:
     if mode and body.mode and mode != body.mode:
         raise HTTPException(status_code=400, detail="Mode mismatch between query and body")
@@ -49,34 +68,31 @@ async def verify(
 
     pack = resolve_pack(settings, x_pack or body.pack)
 
-    idempotency_store = IdempotencyStore()
-    job_store = JobStore()
-    proof_store = ProofStore()
+    job_store = AsyncJobStore()
+    proof_store = AsyncProofStore()
 
     if x_request_id:
-        record = idempotency_store.get(db, x_request_id)
+        record = await idempotency_store.get(db, x_request_id)
         if record:
             if record.mode != resolved_mode or record.pack != pack:
                 raise HTTPException(status_code=409, detail="Idempotency key reuse mismatch")
             if record.response_json:
                 return orjson.loads(record.response_json)
             if record.proof_id:
-                proof = proof_store.get(db, record.proof_id)
-                if proof:
-                    return orjson.loads(proof.payload_json)
+                proof_payload = await proof_store.get_payload(db, record.proof_id)
+                if proof_payload is not None:
+                    return proof_payload
             if record.job_id:
-                job = job_store.get(db, record.job_id)
+                job = await job_store.get(db, record.job_id)
                 if job:
                     return {"job_id": job.job_id, "status": job.status}
 
-    request_hash = sha256_canonical_json(
-        {
-            "input": body.input,
-            "pack": pack,
-            "mode": resolved_mode,
-            "options": body.options.model_dump() if body.options else None,
-            "evidence": body.evidence,
-        }
+    request_hash = verify_request_hash(
+        body.input,
+        pack,
+        resolved_mode,
+        body.options.model_dump() if body.options else None,
+        body.evidence,
     )
 
     if resolved_mode == "async":
@@ -92,7 +108,8 @@ async def verify(
             "options": body.options.model_dump() if body.options else None,
             "evidence": body.evidence,
         }
-        job_store.create(
+        # The row is committed before the claim, so whoever loses the claim can read the winner.
+        await job_store.create(
             db,
             job_id=job_id,
             pack=pack,
@@ -100,15 +117,46 @@ async def verify(
             request_id=x_request_id,
             payload_json=orjson.dumps(async_payload).decode(),
         )
+        # Queue calls use the blocking Redis client, so keep them off the event loop.
+        existing_job_id = await run_in_threadpool(
+            queue.claim, request_hash, job_id, settings.queue_dedupe_ttl_s
+        )
+        if existing_job_id:
+            existing_job = await job_store.get(db, existing_job_id)
+            if existing_job is not None and existing_job.status != "failed":
+                await job_store.delete(db, job_id)
+                if x_request_id:
+                    await idempotency_store.create(
+                        db,
+                        request_id=x_request_id,
+                        mode=resolved_mode,
+                        pack=pack,
+                        job_id=existing_job.job_id,
+                    )
+                logger.info(
+                    "verify_request_deduped",
+                    extra={"pack": pack, "job_id": existing_job.job_id},
+                )
+                return {"job_id": existing_job.job_id, "status": existing_job.status}
+            await run_in_threadpool(
+                queue.reclaim, request_hash, job_id, settings.queue_dedupe_ttl_s
+            )
         if x_request_id:
-            idempotency_store.create(
+            await idempotency_store.create(
                 db,
                 request_id=x_request_id,
                 mode=resolved_mode,
                 pack=pack,
                 job_id=job_id,
             )
-        enqueue_verify(queue, job_id=job_id, payload=async_payload)
+        await run_in_threadpool(
+            enqueue_verify,
+            queue,
+            job_id=job_id,
+            payload=async_payload,
+            lane=body.priority or settings.queue_default_lane,
+            fairness_key=x_tenant or pack,
+        )
         logger.info(
             "verify_request",
             extra={
@@ -122,18 +170,33 @@ async def verify(
         )
         return {"job_id": job_id, "status": "queued"}
 
+    debug_enabled = x_trustai_debug == "1" or (x_trustai_debug is None and settings.debug_default)
+    resolved_fingerprint = None if debug_enabled else pack_fingerprint(pack)
+    cached = await result_cache.get(db, request_hash, resolved_fingerprint)
+    if cached is not None:
+        if x_request_id:
+            await idempotency_store.create(
+                db,
+                request_id=x_request_id,
+                mode=resolved_mode,
+                pack=pack,
+                proof_id=cached.get("proof_id"),
+                response_json=orjson.dumps(cached, option=orjson.OPT_SORT_KEYS).decode(),
+            )
+        return cached
+
     options = None
     if body.options:
         options = VerifyOptions(
             max_iters=body.options.max_iters,
             threshold=body.options.threshold,
             min_mutations=body.options.min_mutations,
+            num_candidates=body.options.num_candidates,
         )
     try:
         result = await verifier.verify_sync(body.input, pack, options, evidence=body.evidence)
     except LLMError as exc:
         raise HTTPException(status_code=503, detail=f"Upstream LLM error: {exc}") from exc
-    debug_enabled = x_trustai_debug == "1" or (x_trustai_debug is None and settings.debug_default)
     debug_info = verifier.debug_info() if debug_enabled else None
     payload = normalize_verification_result(
         result, include_debug=debug_enabled, debug_info=debug_info
@@ -155,16 +218,18 @@ async def verify(
             "model_routing": model_routing,
         },
     )
-    create_result = proof_store.create(
+    create_result = await proof_store.create(
         db,
         payload=payload,
         request_hash=request_hash,
         metadata_json={"options": body.options.model_dump() if body.options else None},
     )
     payload = create_result.payload
+    if resolved_fingerprint:
+        result_cache.put(request_hash, payload.get("pack_fingerprint") or "", payload)
     payload_json = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
     if x_request_id:
-        idempotency_store.create(
+        await idempotency_store.create(
             db,
             request_id=x_request_id,
             mode=resolved_mode,
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from trustai_core.llm.base import LLMError
+
+from trustai_api.deps import (
+    get_settings_dep,
+    get_verifier_service,
+    get_verify_result_cache,
+    open_async_db,
+)
+from trustai_api.routes.utils import (
+    normalize_verification_result,
+    parse_fields,
+    resolve_pack,
+    verify_request_hash,
+)
+from trustai_api.schemas import VerifyBatchItem, VerifyBatchRequest
+from trustai_api.services.proof_codec import project_payload
+from trustai_api.services.proof_store import AsyncProofStore, ProofWrite
+from trustai_api.services.result_cache import VerifyResultCache
+from trustai_api.services.verifier_service import (
+    PackSession,
+    VerifierService,
+    VerifyOptions,
+    pack_fingerprint,
+)
+from trustai_api.settings import Settings
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+_PROOF_CHUNK = 32
+_DEFAULT_FIELDS = {"status", "proof_id", "final_answer"}
+
+
+@router.post("/v1/verify:batch")
+async def verify_batch(
+    body: VerifyBatchRequest,
+    request: Request,
+    x_pack: str | None = Header(default=None, alias="X-TrustAI-Pack"),
+    settings: Settings = Depends(get_settings_dep),
+    verifier: VerifierService = Depends(get_verifier_service),
+    result_cache: VerifyResultCache = Depends(get_verify_result_cache),
+) -> StreamingResponse:
+    if len(body.items) > settings.verify_batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail={
+                "message": "Too many items",
+                "max_items": settings.verify_batch_max_items,
+            },
+        )
+    pack = resolve_pack(settings, x_pack or body.pack)
+    fields = parse_fields(body.fields) or _DEFAULT_FIELDS
+    options_payload = body.options.model_dump() if body.options else None
+    groups: dict[str, list[tuple[int, VerifyBatchItem]]] = {}
+    for index, item in enumerate(body.items):
+        request_hash = verify_request_hash(item.input, pack, "sync", options_payload, item.evidence)
+        groups.setdefault(request_hash, []).append((index, item))
+    batch = _BatchRun(
+        app=request.app,
+        session=verifier.pack_session(pack),
+        fingerprint=pack_fingerprint(pack),
+        result_cache=result_cache,
+        options=_verify_options(body),
+        options_payload=options_payload,
+        fields=fields,
+        concurrency=body.concurrency or settings.verify_batch_concurrency,
+    )
+    logger.info(
+        "verify_batch_request",
+        extra={"pack": pack, "items": len(body.items), "unique_items": len(groups)},
+    )
+    media_type = "text/event-stream" if body.format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        _encode(batch.stream(groups), body.format, len(body.items), len(groups)),
+        media_type=media_type,
+    )
+
+
+def _verify_options(body: VerifyBatchRequest) -> VerifyOptions | None:
+    if not body.options:
+        return None
+    return VerifyOptions(
+        max_iters=body.options.max_iters,
+        threshold=body.options.threshold,
+        min_mutations=body.options.min_mutations,
+        num_candidates=body.options.num_candidates,
+    )
+
+
+async def _encode(
+    results: AsyncIterator[dict[str, Any]],
+    output_format: str,
+    total: int,
+    unique: int,
+) -> AsyncIterator[bytes]:
+    async for line in results:
+        if output_format == "sse":
+            yield b"event: result\ndata: " + orjson.dumps(line) + b"\n\n"
+        else:
+            yield orjson.dumps(line, option=orjson.OPT_APPEND_NEWLINE)
+    if output_format == "sse":
+        yield b"event: done\ndata: " + orjson.dumps({"items": total, "unique": unique}) + b"\n\n"
+
+
+class _BatchRun:
+    def __init__(
+        self,
+        app: Any,
+        session: PackSession,
+        fingerprint: str | None,
+        result_cache: VerifyResultCache,
+        options: VerifyOptions | None,
+        options_payload: dict[str, Any] | None,
+        fields: set[str],
+        concurrency: int,
+    ) -> None:
+        self._app = app
+        self._session = session
+        self._fingerprint = fingerprint
+        self._result_cache = result_cache
+        self._options = options
+        self._options_payload = options_payload
+        self._fields = fields
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._proof_store = AsyncProofStore()
+
+    async def stream(
+        self,
+        groups: dict[str, list[tuple[int, VerifyBatchItem]]],
+    ) -> AsyncIterator[dict[str, Any]]:
+        db = open_async_db(self._app)
+        tasks = [
+            asyncio.ensure_future(self._verify_one(db, request_hash, items[0][1]))
+            for request_hash, items in groups.items()
+        ]
+        remaining = set(tasks)
+        try:
+            while remaining:
+                done, remaining = await asyncio.wait(
+                    remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                results = [task.result() for task in done]
+                # Proofs are committed before their ids reach the client or the result cache.
+                await self._persist(db, results)
+                for request_hash, payload, cached, error in results:
+                    for index, item in groups[request_hash]:
+                        line: dict[str, Any] = {"index": index, "id": item.id}
+                        if error is not None:
+                            line["error"] = error
+                        else:
+                            line["cached"] = cached
+                            line["result"] = project_payload(payload or {}, self._fields)
+                        yield line
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await db.close()
+
+    async def _persist(
+        self,
+        db: Any,
+        results: list[tuple[str, dict[str, Any] | None, bool, str | None]],
+    ) -> None:
+        fresh = [
+            (request_hash, payload)
+            for request_hash, payload, cached, _ in results
+            if payload is not None and not cached
+        ]
+        for start in range(0, len(fresh), _PROOF_CHUNK):
+            chunk = fresh[start : start + _PROOF_CHUNK]
+            await self._proof_store.create_many(
+                db,
+                [
+                    ProofWrite(
+                        payload=payload,
+                        request_hash=request_hash,
+                        metadata_json={"options": self._options_payload},
+                    )
+                    for request_hash, payload in chunk
+                ],
+            )
+        if self._fingerprint:
+            for request_hash, payload in fresh:
+                self._result_cache.put(request_hash, payload.get("pack_fingerprint") or "", payload)
+
+    async def _verify_one(
+        self,
+        db: Any,
+        request_hash: str,
+        item: VerifyBatchItem,
+    ) -> tuple[str, dict[str, Any] | None, bool, str | None]:
+        async with self._semaphore:
+            cached = await self._result_cache.get(db, request_hash, self._fingerprint)
+            if cached is not None:
+                return request_hash, cached, True, None
+            try:
+                result = await self._session.verify(item.input, self._options, item.evidence)
+            except LLMError as exc:
+                return request_hash, None, False, f"Upstream LLM error: {exc}"
+        return request_hash, normalize_verification_result(result), False, None
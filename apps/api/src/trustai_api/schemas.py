@@ -9,6 +9,7 @@ class VerifyOptions(BaseModel):
     max_iters: int | None = Field(default=None, ge=1)
     threshold: float | None = Field(default=None, ge=0.0, le=1.0)
     min_mutations: int | None = Field(default=None, ge=1)
+    num_candidates: int | None = Field(default=None, ge=1, le=8)
 
 
 class VerifyRequest(BaseModel):
@@ -17,6 +18,22 @@ class VerifyRequest(BaseModel):
     options: VerifyOptions | None = None
     pack: str | None = None
     evidence: list[str] | None = None
+    priority: Literal["interactive", "bulk"] | None = None
+
+
+class VerifyBatchItem(BaseModel):
+    id: str | None = None
+    input: str
+    evidence: list[str] | None = None
+
+
+class VerifyBatchRequest(BaseModel):
+    items: list[VerifyBatchItem] = Field(min_length=1)
+    pack: str | None = None
+    options: VerifyOptions | None = None
+    concurrency: int | None = Field(default=None, ge=1, le=64)
+    fields: str | None = None
+    format: Literal["ndjson", "sse"] = "ndjson"
 
 
 class IterationTraceResponse(BaseModel):
@@ -78,3 +95,18 @@ class ProofResponse(BaseModel):
 
 class PacksResponse(BaseModel):
     packs: list[str]
+
+
+class DutyBatchRow(BaseModel):
+    line_id: str = Field(min_length=1)
+    origin_country: str | None = None
+    preference_program: str | None = None
+    effective_date: str | None = None
+    customs_value: float | None = Field(default=None, ge=0.0)
+    jurisdiction: Literal["US", "CA"] | None = None
+
+
+class DutyBatchRequest(BaseModel):
+    jurisdiction: Literal["US", "CA"] = "US"
+    include_breakdown: bool = False
+    rows: list[DutyBatchRow]
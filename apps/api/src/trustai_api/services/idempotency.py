@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from trustai_api.db.models import IdempotencyKey
+from trustai_api.db.session import AsyncDB
+
+if TYPE_CHECKING:
+    from trustai_api.services.idempotency_cache import IdempotencyCache
+
+logger = logging.getLogger(__name__)
+
+_PURGE_BATCH = 1000
 
 
 @dataclass
@@ -16,11 +30,36 @@ class IdempotencyRecord:
     job_id: str | None
     proof_id: str | None
     response_json: str | None
+    expires_at: datetime | None = None
+
+    @classmethod
+    def from_model(cls, record: IdempotencyKey) -> IdempotencyRecord:
+        return cls(
+            request_id=record.request_id,
+            mode=record.mode,
+            pack=record.pack,
+            job_id=record.job_id,
+            proof_id=record.proof_id,
+            response_json=record.response_json,
+            expires_at=record.expires_at,
+        )
+
+
+def _expired(expires_at: datetime | None, now: datetime | None = None) -> bool:
+    # expires_at is stored as naive UTC, like the other timestamp columns.
+    return expires_at is not None and expires_at <= (now or datetime.utcnow())
 
 
 class IdempotencyStore:
+    def __init__(self, ttl_s: float | None = None) -> None:
+        # Non-positive TTLs keep keys forever, matching the behaviour before expiry existed.
+        self._ttl_s = ttl_s if ttl_s and ttl_s > 0 else None
+
     def get(self, session: Session, request_id: str) -> IdempotencyKey | None:
-        return session.get(IdempotencyKey, request_id)
+        record = session.get(IdempotencyKey, request_id)
+        if record is not None and _expired(record.expires_at):
+            return None
+        return record
 
     def create(
         self,
@@ -32,6 +71,12 @@ class IdempotencyStore:
         proof_id: str | None = None,
         response_json: str | None = None,
     ) -> IdempotencyKey:
+        created_at = datetime.utcnow()
+        stale = session.get(IdempotencyKey, request_id)
+        if stale is not None and _expired(stale.expires_at, created_at):
+            # The key expired but the sweeper has not purged it yet.
+            session.delete(stale)
+            session.flush()
         record = IdempotencyKey(
             request_id=request_id,
             mode=mode,
@@ -39,7 +84,8 @@ class IdempotencyStore:
             job_id=job_id,
             proof_id=proof_id,
             response_json=response_json,
-            created_at=datetime.utcnow(),
+            created_at=created_at,
+            expires_at=created_at + timedelta(seconds=self._ttl_s) if self._ttl_s else None,
         )
         session.add(record)
         session.commit()
@@ -57,3 +103,131 @@ class IdempotencyStore:
         session.commit()
         session.refresh(record)
         return record
+
+    def purge_expired(
+        self,
+        session: Session,
+        now: datetime | None = None,
+        batch_size: int = _PURGE_BATCH,
+    ) -> int:
+        """Deletes expired keys in bounded batches so each transaction stays short."""
+        now = now or datetime.utcnow()
+        purged = 0
+        while True:
+            request_ids = list(
+                session.scalars(
+                    select(IdempotencyKey.request_id)
+                    .where(IdempotencyKey.expires_at <= now)
+                    .limit(batch_size)
+                )
+            )
+            if not request_ids:
+                return purged
+            session.execute(
+                delete(IdempotencyKey)
+                .where(IdempotencyKey.request_id.in_(request_ids))
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            purged += len(request_ids)
+            if len(request_ids) < batch_size:
+                return purged
+
+
+class AsyncIdempotencyStore:
+    """Answers lookups from ``cache`` when possible and falls back to SQL.
+
+    Only settled records (with a stored response or proof) are cached; records
+    still pointing at a queued job are re-read until the worker attaches a proof.
+    Cache calls run in the threadpool because the Redis backend is blocking.
+    """
+
+    def __init__(
+        self,
+        store: IdempotencyStore | None = None,
+        cache: IdempotencyCache | None = None,
+        cache_ttl_s: float = 3600.0,
+    ) -> None:
+        self._store = store or IdempotencyStore()
+        self._cache = cache
+        self._cache_ttl_s = cache_ttl_s
+
+    async def _remember(self, record: IdempotencyRecord) -> None:
+        if self._cache is None or not (record.response_json or record.proof_id):
+            return
+        ttl_s = self._cache_ttl_s
+        if record.expires_at is not None:
+            ttl_s = min(ttl_s, (record.expires_at - datetime.utcnow()).total_seconds())
+        await run_in_threadpool(self._cache.put, record, ttl_s)
+
+    async def get(self, db: AsyncDB, request_id: str) -> IdempotencyRecord | None:
+        if self._cache is not None:
+            cached = await run_in_threadpool(self._cache.get, request_id)
+            if cached is not None and not _expired(cached.expires_at):
+                return cached
+        record = await db.run(self._get_record, request_id)
+        if record is not None:
+            await self._remember(record)
+        return record
+
+    def _get_record(self, session: Session, request_id: str) -> IdempotencyRecord | None:
+        record = self._store.get(session, request_id)
+        return IdempotencyRecord.from_model(record) if record is not None else None
+
+    async def create(
+        self,
+        db: AsyncDB,
+        request_id: str,
+        mode: str,
+        pack: str,
+        job_id: str | None = None,
+        proof_id: str | None = None,
+        response_json: str | None = None,
+    ) -> IdempotencyKey:
+        record = await db.run(
+            self._store.create,
+            request_id=request_id,
+            mode=mode,
+            pack=pack,
+            job_id=job_id,
+            proof_id=proof_id,
+            response_json=response_json,
+        )
+        await self._remember(IdempotencyRecord.from_model(record))
+        return record
+
+    async def set_response(
+        self,
+        db: AsyncDB,
+        record: IdempotencyKey,
+        response_json: str,
+    ) -> IdempotencyKey:
+        updated = await db.run(self._store.set_response, record, response_json)
+        await self._remember(IdempotencyRecord.from_model(updated))
+        return updated
+
+
+async def sweep_expired_keys(
+    session_factory: Callable[[], Session],
+    interval_s: float,
+    store: IdempotencyStore | None = None,
+) -> None:
+    """Purges expired idempotency keys every ``interval_s`` until cancelled."""
+    store = store or IdempotencyStore()
+    while True:
+        await asyncio.sleep(interval_s)
+        try:
+            purged = await run_in_threadpool(_purge_once, session_factory, store)
+        except Exception:
+            logger.exception("idempotency_sweep_failed")
+            continue
+        if purged:
+            logger.info("idempotency_sweep", extra={"purged": purged})
+
+
+def _purge_once(session_factory: Callable[[], Session], store: IdempotencyStore) -> int:
+    session = session_factory()
+    try:
+        return store.purge_expired(session)
+    finally:
+        session.close()
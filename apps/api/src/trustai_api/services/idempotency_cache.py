@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Protocol
+
+import orjson
+from redis import Redis
+from redis.exceptions import RedisError
+
+from trustai_api.services.idempotency import IdempotencyRecord
+
+
+class IdempotencyCache(Protocol):
+    def get(self, request_id: str) -> IdempotencyRecord | None:
+        ...
+
+    def put(self, record: IdempotencyRecord, ttl_s: float) -> None:
+        ...
+
+    def delete(self, request_id: str) -> None:
+        ...
+
+
+def _cache_key(request_id: str) -> str:
+    return f"trustai:idempotency:{request_id}"
+
+
+def _dumps(record: IdempotencyRecord) -> bytes:
+    return orjson.dumps(record)
+
+
+def _loads(data: bytes | str) -> IdempotencyRecord:
+    values = orjson.loads(data)
+    expires_at = values.get("expires_at")
+    values["expires_at"] = datetime.fromisoformat(expires_at) if expires_at else None
+    return IdempotencyRecord(**values)
+
+
+class RedisIdempotencyCache:
+    """Shared record cache; Redis errors degrade to misses so SQL stays authoritative."""
+
+    def __init__(self, connection: Redis) -> None:
+        self._connection = connection
+
+    def get(self, request_id: str) -> IdempotencyRecord | None:
+        try:
+            data = self._connection.get(_cache_key(request_id))
+        except RedisError:
+            return None
+        return _loads(data) if data is not None else None
+
+    def put(self, record: IdempotencyRecord, ttl_s: float) -> None:
+        if ttl_s < 1:
+            return
+        try:
+            self._connection.set(_cache_key(record.request_id), _dumps(record), ex=int(ttl_s))
+        except RedisError:
+            pass
+
+    def delete(self, request_id: str) -> None:
+        try:
+            self._connection.delete(_cache_key(request_id))
+        except RedisError:
+            pass
+
+
+class InMemoryIdempotencyCache:
+    """Process-local LRU used when Redis is unavailable."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, request_id: str) -> IdempotencyRecord | None:
+        with self._lock:
+            entry = self._entries.get(request_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[request_id]
+                return None
+            self._entries.move_to_end(request_id)
+            data = entry[1]
+        return _loads(data)
+
+    def put(self, record: IdempotencyRecord, ttl_s: float) -> None:
+        if self._max_entries <= 0 or ttl_s <= 0:
+            return
+        data = _dumps(record)
+        with self._lock:
+            self._entries[record.request_id] = (time.monotonic() + ttl_s, data)
+            self._entries.move_to_end(record.request_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, request_id: str) -> None:
+        with self._lock:
+            self._entries.pop(request_id, None)
+
+
+def create_idempotency_cache(redis_url: str, max_entries: int = 1024) -> IdempotencyCache:
+    try:
+        connection = Redis.from_url(redis_url)
+        connection.ping()
+    except RedisError:
+        return InMemoryIdempotencyCache(max_entries)
+    return RedisIdempotencyCache(connection)
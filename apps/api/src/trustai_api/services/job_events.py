@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import orjson
+from redis import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_EVENTS = frozenset({"done", "failed"})
+_STREAM_MAXLEN = 1000
+_STREAM_TTL_S = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    id: str
+    kind: str
+    data: dict[str, Any]
+
+
+class JobEventBus(Protocol):
+    def publish(self, job_id: str, kind: str, data: dict[str, Any]) -> None:
+        ...
+
+    async def read(
+        self,
+        job_id: str,
+        after: str | None,
+        block_ms: int | None = None,
+    ) -> list[JobEvent]:
+        ...
+
+
+def _stream_key(job_id: str) -> str:
+    return f"trustai:job:{job_id}:events"
+
+
+class RedisJobEventBus:
+    """Job progress on a capped Redis stream per job, so late subscribers can replay."""
+
+    def __init__(self, redis_url: str, connection: Redis | None = None) -> None:
+        self._redis_url = redis_url
+        self._connection = connection or Redis.from_url(redis_url)
+        self._async_connection: Any = None
+
+    def publish(self, job_id: str, kind: str, data: dict[str, Any]) -> None:
+        key = _stream_key(job_id)
+        pipeline = self._connection.pipeline()
+        pipeline.xadd(
+            key,
+            {"kind": kind, "data": orjson.dumps(data)},
+            maxlen=_STREAM_MAXLEN,
+            approximate=True,
+        )
+        pipeline.expire(key, _STREAM_TTL_S)
+        pipeline.execute()
+
+    async def read(
+        self,
+        job_id: str,
+        after: str | None,
+        block_ms: int | None = None,
+    ) -> list[JobEvent]:
+        if self._async_connection is None:
+            from redis.asyncio import Redis as AsyncRedis
+
+            self._async_connection = AsyncRedis.from_url(self._redis_url)
+        response = await self._async_connection.xread(
+            {_stream_key(job_id): after or "0-0"},
+            count=100,
+            block=block_ms,
+        )
+        events: list[JobEvent] = []
+        for _, entries in response or []:
+            for entry_id, fields in entries:
+                events.append(
+                    JobEvent(
+                        id=_decode(entry_id),
+                        kind=_decode(fields[b"kind"]),
+                        data=orjson.loads(fields[b"data"]),
+                    )
+                )
+        return events
+
+
+class InMemoryJobEventBus:
+    """Process-local bus for tests and single-process development without Redis."""
+
+    def __init__(self, poll_interval_s: float = 0.05) -> None:
+        self._lock = threading.Lock()
+        self._events: dict[str, list[JobEvent]] = {}
+        # Ids keep counting past trimmed events so SSE cursors always move forward.
+        self._last_ids: dict[str, int] = {}
+        self._poll_interval_s = poll_interval_s
+
+    def publish(self, job_id: str, kind: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            events = self._events.setdefault(job_id, [])
+            event_id = self._last_ids.get(job_id, 0) + 1
+            self._last_ids[job_id] = event_id
+            events.append(JobEvent(id=str(event_id), kind=kind, data=data))
+            del events[:-_STREAM_MAXLEN]
+
+    def _since(self, job_id: str, after: str | None) -> list[JobEvent]:
+        cursor = int(after) if after and after.isdigit() else 0
+        with self._lock:
+            return [event for event in self._events.get(job_id, []) if int(event.id) > cursor]
+
+    async def read(
+        self,
+        job_id: str,
+        after: str | None,
+        block_ms: int | None = None,
+    ) -> list[JobEvent]:
+        deadline = time.monotonic() + (block_ms or 0) / 1000
+        while True:
+            events = self._since(job_id, after)
+            if events or time.monotonic() >= deadline:
+                return events
+            await asyncio.sleep(self._poll_interval_s)
+
+
+class BackgroundEventPublisher:
+    """Hands events to one daemon thread so publishers on an event loop never wait on Redis.
+
+    Events keep their order; when ``max_pending`` events are queued, new ones are
+    dropped rather than blocking the caller.
+    """
+
+    def __init__(self, resolve_bus: Callable[[], JobEventBus], max_pending: int = 10000) -> None:
+        self._resolve_bus = resolve_bus
+        self._pending: queue.Queue[tuple[str, str, dict[str, Any]] | None] = queue.Queue(
+            maxsize=max_pending
+        )
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def publish(self, job_id: str, kind: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._drain, name="job-event-publisher", daemon=True
+                )
+                self._thread.start()
+        try:
+            self._pending.put_nowait((job_id, kind, data))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("job_event_dropped", extra={"job_id": job_id, "kind": kind})
+
+    def close(self, timeout_s: float | None = 5.0) -> None:
+        """Publishes what is still queued, then stops the thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._pending.put(None)
+        thread.join(timeout_s)
+
+    def _drain(self) -> None:
+        bus: JobEventBus | None = None
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            try:
+                bus = bus or self._resolve_bus()
+                bus.publish(*item)
+            except Exception:  # progress reporting must never break verification
+                logger.warning("job_event_publish_failed", exc_info=True)
+
+
+def create_job_event_bus(redis_url: str) -> JobEventBus:
+    try:
+        connection = Redis.from_url(redis_url)
+        connection.ping()
+    except RedisError:
+        return InMemoryJobEventBus()
+    return RedisJobEventBus(redis_url, connection)
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
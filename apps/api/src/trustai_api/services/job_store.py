@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Collection
 from dataclasses import dataclass
 from datetime import datetime
 
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from trustai_api.db.models import Job
+from trustai_api.db.models import IdempotencyKey, Job
+from trustai_api.db.session import AsyncDB
+from trustai_api.services.proof_store import ProofStore, ProofWrite
 
 
 @dataclass
@@ -36,6 +42,12 @@ class JobStore:
         session.refresh(job)
         return JobCreateResult(job=job)
 
+    def delete(self, session: Session, job_id: str) -> None:
+        job = session.get(Job, job_id)
+        if job is not None:
+            session.delete(job)
+            session.commit()
+
     def set_running(self, session: Session, job: Job) -> Job:
         job.status = "running"
         job.updated_at = datetime.utcnow()
@@ -53,6 +65,56 @@ class JobStore:
         session.refresh(job)
         return job
 
+    def mark_running(self, session: Session, job_ids: Collection[str]) -> int:
+        """Moves queued jobs to running with one UPDATE and no reload."""
+        if not job_ids:
+            return 0
+        result = session.execute(
+            update(Job)
+            .where(Job.job_id.in_(list(job_ids)), Job.status == "queued")
+            .values(status="running", updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+        return result.rowcount
+
+    def complete(
+        self,
+        session: Session,
+        job_id: str,
+        proof: ProofWrite,
+        request_id: str | None = None,
+        proof_store: ProofStore | None = None,
+    ) -> str:
+        """Stores the proof, finishes the job and links the idempotency key in one transaction."""
+        proof_store = proof_store or ProofStore()
+        proof_id = proof.payload["proof_id"]
+        for attempt in range(2):
+            try:
+                proof_store.stage(session, proof)
+                session.flush()
+                session.execute(
+                    update(Job)
+                    .where(Job.job_id == job_id)
+                    .values(status="done", proof_id=proof_id, updated_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                if request_id:
+                    session.execute(
+                        update(IdempotencyKey)
+                        .where(IdempotencyKey.request_id == request_id)
+                        .values(proof_id=proof_id)
+                        .execution_options(synchronize_session=False)
+                    )
+                session.commit()
+                return proof_id
+            except IntegrityError:
+                # A concurrent writer stored the same proof or blob; retry against its rows.
+                session.rollback()
+                if attempt:
+                    raise
+        return proof_id
+
     def set_failed(self, session: Session, job: Job, error: str) -> Job:
         job.status = "failed"
         job.error = error
@@ -64,3 +126,85 @@ class JobStore:
 
     def get(self, session: Session, job_id: str) -> Job | None:
         return session.get(Job, job_id)
+
+
+class JobStatusBuffer:
+    """Write-behind buffer that coalesces ``running`` transitions across jobs.
+
+    Jobs that finish before the next flush skip the intermediate write entirely.
+    """
+
+    def __init__(self, store: JobStore | None = None) -> None:
+        self._store = store or JobStore()
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+
+    def mark_running(self, job_id: str) -> None:
+        with self._lock:
+            self._pending.add(job_id)
+
+    def discard(self, job_id: str) -> bool:
+        with self._lock:
+            if job_id in self._pending:
+                self._pending.remove(job_id)
+                return True
+            return False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, session: Session) -> int:
+        with self._lock:
+            job_ids, self._pending = self._pending, set()
+        return self._store.mark_running(session, job_ids)
+
+
+class AsyncJobStore:
+    def __init__(self, store: JobStore | None = None) -> None:
+        self._store = store or JobStore()
+
+    async def create(
+        self,
+        db: AsyncDB,
+        job_id: str,
+        pack: str,
+        input_text: str,
+        request_id: str | None = None,
+        payload_json: str | None = None,
+    ) -> JobCreateResult:
+        return await db.run(
+            self._store.create,
+            job_id=job_id,
+            pack=pack,
+            input_text=input_text,
+            request_id=request_id,
+            payload_json=payload_json,
+        )
+
+    async def delete(self, db: AsyncDB, job_id: str) -> None:
+        await db.run(self._store.delete, job_id)
+
+    async def set_running(self, db: AsyncDB, job: Job) -> Job:
+        return await db.run(self._store.set_running, job)
+
+    async def set_done(self, db: AsyncDB, job: Job, proof_id: str) -> Job:
+        return await db.run(self._store.set_done, job, proof_id)
+
+    async def mark_running(self, db: AsyncDB, job_ids: Collection[str]) -> int:
+        return await db.run(self._store.mark_running, job_ids)
+
+    async def complete(
+        self,
+        db: AsyncDB,
+        job_id: str,
+        proof: ProofWrite,
+        request_id: str | None = None,
+    ) -> str:
+        return await db.run(self._store.complete, job_id, proof, request_id)
+
+    async def set_failed(self, db: AsyncDB, job: Job, error: str) -> Job:
+        return await db.run(self._store.set_failed, job, error)
+
+    async def get(self, db: AsyncDB, job_id: str) -> Job | None:
+        return await db.run(self._store.get, job_id)
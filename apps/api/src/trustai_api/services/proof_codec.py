@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+from trustai_core.utils.hashing import sha256_canonical_json
+
+try:  # zstandard is optional; zlib keeps proofs compressible without it.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+BLOB_REF_KEY = "$blob"
+_ZSTD_LEVEL = 3
+_ZLIB_LEVEL = 6
+# Sections of the stored ``proof`` dump that are large and repeat across proofs.
+_SPLIT_LIST_SECTIONS = ("evidence_bundle",)
+_SPLIT_WHOLE_SECTIONS = ("proposal_history", "lever_proof")
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to write zstd proof blobs")
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+    if codec == "zlib":
+        return zlib.compress(data, _ZLIB_LEVEL)
+    raise ValueError(f"Unknown proof codec: {codec}")
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd proof blobs")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown proof codec: {codec}")
+
+
+def encode_json(value: Any, codec: str) -> bytes:
+    return compress(orjson.dumps(value, option=orjson.OPT_SORT_KEYS), codec)
+
+
+def decode_json(data: bytes, codec: str) -> Any:
+    return orjson.loads(decompress(data, codec))
+
+
+def _blob_ref(value: Any, blobs: dict[str, Any]) -> dict[str, str]:
+    content_hash = sha256_canonical_json(value)
+    blobs[content_hash] = value
+    return {BLOB_REF_KEY: content_hash}
+
+
+def _is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and BLOB_REF_KEY in value
+
+
+@dataclass(frozen=True)
+class SplitPayload:
+    core: dict[str, Any]
+    blobs: dict[str, Any]
+
+
+def split_payload(payload: dict[str, Any]) -> SplitPayload:
+    """Moves large proof sections into content-addressed blobs.
+
+    Evidence items are split one by one so identical passages are stored once
+    even when the surrounding bundles differ.
+    """
+    blobs: dict[str, Any] = {}
+    proof = payload.get("proof")
+    if not isinstance(proof, dict):
+        return SplitPayload(core=payload, blobs=blobs)
+    split_proof = dict(proof)
+    for key in _SPLIT_LIST_SECTIONS:
+        items = split_proof.get(key)
+        if isinstance(items, list) and items:
+            split_proof[key] = [_blob_ref(item, blobs) for item in items]
+    for key in _SPLIT_WHOLE_SECTIONS:
+        section = split_proof.get(key)
+        if section:
+            split_proof[key] = _blob_ref(section, blobs)
+    return SplitPayload(core={**payload, "proof": split_proof}, blobs=blobs)
+
+
+def blob_refs(core: dict[str, Any]) -> set[str]:
+    proof = core.get("proof")
+    if not isinstance(proof, dict):
+        return set()
+    refs: set[str] = set()
+    for key in _SPLIT_LIST_SECTIONS:
+        items = proof.get(key)
+        if isinstance(items, list):
+            refs.update(item[BLOB_REF_KEY] for item in items if _is_blob_ref(item))
+    for key in _SPLIT_WHOLE_SECTIONS:
+        if _is_blob_ref(proof.get(key)):
+            refs.add(proof[key][BLOB_REF_KEY])
+    return refs
+
+
+def join_payload(core: dict[str, Any], blobs: dict[str, Any]) -> dict[str, Any]:
+    proof = core.get("proof")
+    if not isinstance(proof, dict):
+        return core
+    joined = dict(proof)
+    for key in _SPLIT_LIST_SECTIONS:
+        items = joined.get(key)
+        if isinstance(items, list):
+            joined[key] = [
+                blobs[item[BLOB_REF_KEY]] if _is_blob_ref(item) else item for item in items
+            ]
+    for key in _SPLIT_WHOLE_SECTIONS:
+        section = joined.get(key)
+        if _is_blob_ref(section):
+            joined[key] = blobs[section[BLOB_REF_KEY]]
+    return {**core, "proof": joined}
+
+
+def project_payload(payload: dict[str, Any], fields: set[str]) -> dict[str, Any]:
+    """Keeps top-level ``fields``; ``proof.<section>`` selects one section of the proof."""
+    projected: dict[str, Any] = {}
+    proof_sections: dict[str, Any] = {}
+    proof = payload.get("proof")
+    for field_name in fields:
+        head, _, section = field_name.partition(".")
+        if section:
+            if head == "proof" and isinstance(proof, dict) and section in proof:
+                proof_sections[section] = proof[section]
+        elif field_name in payload:
+            projected[field_name] = payload[field_name]
+    if proof_sections and "proof" not in projected:
+        projected["proof"] = proof_sections
+    return projected
@@ -1,12 +1,45 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 import orjson
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from trustai_api.db.models import Proof
+from trustai_api.db.models import Proof, ProofBlob
+from trustai_api.db.session import AsyncDB
+from trustai_api.services.proof_codec import (
+    blob_refs,
+    decode_json,
+    default_codec,
+    encode_json,
+    join_payload,
+    project_payload,
+    split_payload,
+)
+
+PAYLOAD_FIELDS = (
+    "status",
+    "proof_id",
+    "pack",
+    "pack_fingerprint",
+    "evidence_manifest_hash",
+    "final_answer",
+    "iterations",
+    "similarity_history",
+    "explain",
+    "proof",
+    "debug",
+)
+# Served straight from Proof columns, without touching the payload blob.
+SUMMARY_FIELDS = frozenset(
+    {"status", "proof_id", "pack", "pack_fingerprint", "evidence_manifest_hash", "final_answer"}
+)
+# Column values _build_proof writes when the payload lacks the field.
+_COLUMN_DEFAULTS = {"pack": "", "pack_fingerprint": "", "status": "unknown"}
 
 
 @dataclass
@@ -15,7 +48,17 @@ class ProofCreateResult:
     payload: dict[str, Any]
 
 
+@dataclass
+class ProofWrite:
+    payload: dict[str, Any]
+    request_hash: str | None = None
+    metadata_json: dict[str, Any] | None = None
+
+
 class ProofStore:
+    def __init__(self, codec: str | None = None) -> None:
+        self._codec = codec or default_codec()
+
     def create(
         self,
         session: Session,
@@ -23,32 +66,253 @@ class ProofStore:
         request_hash: str | None = None,
         metadata_json: dict[str, Any] | None = None,
     ) -> ProofCreateResult:
-        proof_id = payload.get("proof_id")
-        if not proof_id:
-            raise ValueError("Payload missing proof_id")
+        write = ProofWrite(payload=payload, request_hash=request_hash, metadata_json=metadata_json)
+        proof_id = _proof_id(write)
         existing = session.get(Proof, proof_id)
         if existing:
-            return ProofCreateResult(proof=existing, payload=orjson.loads(existing.payload_json))
+            return ProofCreateResult(proof=existing, payload=self.load_payload(session, existing))
+        proof, blobs = self._build_proof(write)
+        try:
+            self._add_blobs(session, blobs)
+            session.add(proof)
+            session.commit()
+        except IntegrityError:
+            # A concurrent writer stored the same proof or blob first.
+            session.rollback()
+            existing = session.get(Proof, proof_id)
+            if existing is None:
+                self._add_blobs(session, blobs)
+                session.add(proof)
+                session.commit()
+            else:
+                proof = existing
+        session.refresh(proof)
+        return ProofCreateResult(proof=proof, payload=payload)
+
+    def stage(self, session: Session, write: ProofWrite) -> Proof | None:
+        """Adds the proof and its new blobs to ``session`` without committing.
+
+        Returns None when the proof is already stored.
+        """
+        if session.get(Proof, _proof_id(write)) is not None:
+            return None
+        proof, blobs = self._build_proof(write)
+        self._add_blobs(session, blobs)
+        session.add(proof)
+        return proof
+
+    def create_many(self, session: Session, writes: list[ProofWrite]) -> list[ProofCreateResult]:
+        """Stores a chunk of proofs in one transaction, sharing blob dedupe across the chunk."""
+        proof_ids = [_proof_id(write) for write in writes]
+        existing = {
+            proof.proof_id: proof
+            for proof in session.scalars(select(Proof).where(Proof.proof_id.in_(proof_ids)))
+        }
+        pending: dict[str, Proof] = {}
+        blobs: dict[str, Any] = {}
+        results: list[ProofCreateResult] = []
+        for proof_id, write in zip(proof_ids, writes):
+            if proof_id in existing:
+                stored = existing[proof_id]
+                results.append(ProofCreateResult(stored, self.load_payload(session, stored)))
+                continue
+            if proof_id not in pending:
+                pending[proof_id], proof_blobs = self._build_proof(write)
+                blobs.update(proof_blobs)
+            results.append(ProofCreateResult(proof=pending[proof_id], payload=write.payload))
+        if not pending:
+            return results
+        try:
+            self._add_blobs(session, blobs)
+            session.add_all(pending.values())
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            return [
+                self.create(session, write.payload, write.request_hash, write.metadata_json)
+                for write in writes
+            ]
+        return results
+
+    def _build_proof(self, write: ProofWrite) -> tuple[Proof, dict[str, Any]]:
+        payload = write.payload
         iterations = payload.get("iterations") or []
         score = 0.0
         if iterations:
             last_score = iterations[-1].get("score")
             if isinstance(last_score, (int, float)):
                 score = float(last_score)
+        split = split_payload(payload)
         proof = Proof(
-            proof_id=proof_id,
+            proof_id=payload["proof_id"],
             pack=payload.get("pack") or "",
             pack_fingerprint=payload.get("pack_fingerprint") or "",
             status=payload.get("status") or "unknown",
             score=score,
-            payload_json=orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode(),
-            request_hash=request_hash,
-            metadata_json=metadata_json,
+            evidence_manifest_hash=payload.get("evidence_manifest_hash"),
+            final_answer=payload.get("final_answer"),
+            iteration_count=len(iterations),
+            payload_blob=encode_json(split.core, self._codec),
+            payload_codec=self._codec,
+            request_hash=write.request_hash,
+            metadata_json=write.metadata_json,
         )
-        session.add(proof)
-        session.commit()
-        session.refresh(proof)
-        return ProofCreateResult(proof=proof, payload=payload)
+        return proof, split.blobs
+
+    def _add_blobs(self, session: Session, blobs: dict[str, Any]) -> None:
+        if not blobs:
+            return
+        known = set(
+            session.scalars(
+                select(ProofBlob.content_hash).where(ProofBlob.content_hash.in_(list(blobs)))
+            )
+        )
+        for content_hash, value in blobs.items():
+            if content_hash in known:
+                continue
+            data = encode_json(value, self._codec)
+            session.add(
+                ProofBlob(
+                    content_hash=content_hash,
+                    codec=self._codec,
+                    size=len(data),
+                    data=data,
+                )
+            )
+
+    def load_payload(
+        self,
+        session: Session,
+        proof: Proof,
+        fields: set[str] | None = None,
+    ) -> dict[str, Any]:
+        if fields is not None and proof.payload_codec is not None and fields <= SUMMARY_FIELDS:
+            summary = _summary_from_columns(proof, fields)
+            if summary is not None:
+                return summary
+        if proof.payload_blob is None:
+            payload = orjson.loads(proof.payload_json or "{}")
+            return project_payload(payload, fields) if fields is not None else payload
+        core = decode_json(proof.payload_blob, proof.payload_codec or "zlib")
+        if fields is not None:
+            core = project_payload(core, fields)
+        refs = blob_refs(core)
+        if not refs:
+            return core
+        rows = session.scalars(select(ProofBlob).where(ProofBlob.content_hash.in_(list(refs))))
+        blobs = {row.content_hash: decode_json(row.data, row.codec) for row in rows}
+        missing = refs - blobs.keys()
+        if missing:
+            raise LookupError(f"Proof {proof.proof_id} references missing blobs: {sorted(missing)}")
+        return join_payload(core, blobs)
+
+    def get_payload(
+        self,
+        session: Session,
+        proof_id: str,
+        fields: set[str] | None = None,
+    ) -> dict[str, Any] | None:
+        proof = self.get(session, proof_id)
+        if proof is None:
+            return None
+        return self.load_payload(session, proof, fields)
 
     def get(self, session: Session, proof_id: str) -> Proof | None:
         return session.get(Proof, proof_id)
+
+    def find_by_request_hash(
+        self,
+        session: Session,
+        request_hash: str,
+        pack_fingerprint: str,
+        created_after: datetime,
+    ) -> Proof | None:
+        statement = (
+            select(Proof)
+            .where(
+                Proof.request_hash == request_hash,
+                Proof.pack_fingerprint == pack_fingerprint,
+                Proof.created_at >= created_after,
+                Proof.status != "failed",
+            )
+            .order_by(Proof.created_at.desc())
+            .limit(1)
+        )
+        return session.scalars(statement).first()
+
+
+def _summary_from_columns(proof: Proof, fields: set[str]) -> dict[str, Any] | None:
+    # A None or defaulted column cannot tell a missing field from a null one; the blob can.
+    summary: dict[str, Any] = {}
+    for field_name in sorted(fields):
+        value = getattr(proof, field_name)
+        if value is None or value == _COLUMN_DEFAULTS.get(field_name):
+            return None
+        summary[field_name] = value
+    return summary
+
+
+def _proof_id(write: ProofWrite) -> str:
+    proof_id = write.payload.get("proof_id")
+    if not proof_id:
+        raise ValueError("Payload missing proof_id")
+    return proof_id
+
+
+class AsyncProofStore:
+    def __init__(self, store: ProofStore | None = None) -> None:
+        self._store = store or ProofStore()
+
+    async def create(
+        self,
+        db: AsyncDB,
+        payload: dict[str, Any],
+        request_hash: str | None = None,
+        metadata_json: dict[str, Any] | None = None,
+    ) -> ProofCreateResult:
+        return await db.run(
+            self._store.create,
+            payload=payload,
+            request_hash=request_hash,
+            metadata_json=metadata_json,
+        )
+
+    async def create_many(
+        self,
+        db: AsyncDB,
+        writes: list[ProofWrite],
+    ) -> list[ProofCreateResult]:
+        return await db.run(self._store.create_many, writes)
+
+    async def get(self, db: AsyncDB, proof_id: str) -> Proof | None:
+        return await db.run(self._store.get, proof_id)
+
+    async def get_payload(
+        self,
+        db: AsyncDB,
+        proof_id: str,
+        fields: set[str] | None = None,
+    ) -> dict[str, Any] | None:
+        return await db.run(self._store.get_payload, proof_id, fields)
+
+    async def load_payload(
+        self,
+        db: AsyncDB,
+        proof: Proof,
+        fields: set[str] | None = None,
+    ) -> dict[str, Any]:
+        return await db.run(self._store.load_payload, proof, fields)
+
+    async def find_by_request_hash(
+        self,
+        db: AsyncDB,
+        request_hash: str,
+        pack_fingerprint: str,
+        created_after: datetime,
+    ) -> Proof | None:
+        return await db.run(
+            self._store.find_by_request_hash,
+            request_hash,
+            pack_fingerprint,
+            created_after,
+        )
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+import orjson
+
+from trustai_api.db.session import AsyncDB
+from trustai_api.services.proof_store import AsyncProofStore
+
+_UNCACHEABLE_STATUSES = frozenset({"failed"})
+_TRANSIENT_REJECTIONS = frozenset({"llm_unavailable"})
+
+
+def is_cacheable(payload: dict[str, Any]) -> bool:
+    """Failed results, including provider outages, must not be replayed to later requests."""
+    if payload.get("status") in _UNCACHEABLE_STATUSES:
+        return False
+    for iteration in payload.get("iterations") or []:
+        if _TRANSIENT_REJECTIONS.intersection(iteration.get("rejected_because") or []):
+            return False
+    return True
+
+
+@dataclass(frozen=True)
+class _CachedResult:
+    pack_fingerprint: str
+    stored_at: float
+    payload_json: str
+
+
+@dataclass
+class VerifyResultCache:
+    """Reuses stored sync proofs for identical requests within ``ttl_s``.
+
+    An in-process LRU answers repeat requests without a query; misses fall back
+    to the indexed ``proofs.request_hash`` lookup and warm the LRU.
+    """
+
+    ttl_s: float
+    max_entries: int = 256
+    proof_store: AsyncProofStore = field(default_factory=AsyncProofStore)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, _CachedResult] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_s > 0
+
+    def _memory_get(self, request_hash: str, pack_fingerprint: str) -> dict[str, Any] | None:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(request_hash)
+            if entry is None:
+                return None
+            if entry.stored_at + self.ttl_s <= now or entry.pack_fingerprint != pack_fingerprint:
+                del self._memory[request_hash]
+                return None
+            self._memory.move_to_end(request_hash)
+            return orjson.loads(entry.payload_json)
+
+    def _memory_put(
+        self,
+        request_hash: str,
+        pack_fingerprint: str,
+        stored_at: float,
+        payload_json: str,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._memory[request_hash] = _CachedResult(pack_fingerprint, stored_at, payload_json)
+            self._memory.move_to_end(request_hash)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    async def get(
+        self,
+        db: AsyncDB,
+        request_hash: str,
+        pack_fingerprint: str | None,
+    ) -> dict[str, Any] | None:
+        if not self.enabled or not pack_fingerprint:
+            return None
+        payload = self._memory_get(request_hash, pack_fingerprint)
+        if payload is not None:
+            return payload
+        # created_at is stored as naive UTC by the Proof model default.
+        created_after = datetime.utcnow() - timedelta(seconds=self.ttl_s)
+        proof = await self.proof_store.find_by_request_hash(
+            db, request_hash, pack_fingerprint, created_after
+        )
+        if proof is None:
+            return None
+        payload = await self.proof_store.load_payload(db, proof)
+        if not is_cacheable(payload):
+            return None
+        age_s = (datetime.utcnow() - proof.created_at).total_seconds()
+        payload_json = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
+        self._memory_put(request_hash, pack_fingerprint, time.time() - age_s, payload_json)
+        return payload
+
+    def put(self, request_hash: str, pack_fingerprint: str, payload: dict[str, Any]) -> None:
+        if not self.enabled or not pack_fingerprint or not is_cacheable(payload):
+            return
+        payload_json = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
+        self._memory_put(request_hash, pack_fingerprint, time.time(), payload_json)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Awaitable, Callable
 
 from trustai_core.agents.perceiver import Perceiver
 from trustai_core.agents.reasoner import Reasoner
 from trustai_core.arbiter.evaluator import SCORE_THRESHOLD
-from trustai_core.llm.anthropic_client import AnthropicClient
+from trustai_core.core.memory import ItemMemory, ItemMemoryConfig
 from trustai_core.llm.base import LLMClient
-from trustai_core.llm.openai_client import OpenAIClient
+from trustai_core.llm.cache import with_llm_cache
+from trustai_core.llm.pool import get_llm_client_pool
+from trustai_core.llm.retry import with_single_flight
 from trustai_core.orchestrator.loop import VerificationFailure, verify_and_fix
+from trustai_core.packs.loader import load_pack
 from trustai_core.packs.registry import PackContext, get_pack_runner
 from trustai_core.packs.tariff.models import TariffVerificationResult
 from trustai_core.schemas.proof import VerificationResult
@@ -25,6 +30,49 @@ class VerifyOptions:
     max_iters: int | None = None
     threshold: float | None = None
     min_mutations: int | None = None
+    num_candidates: int | None = None
+
+
+_PACK_FILES = ("ontology.json", "axioms.json")
+
+
+def pack_fingerprint(pack: str) -> str | None:
+    return _pack_fingerprint(pack, _pack_files_signature(pack))
+
+
+def _pack_files_signature(pack: str) -> tuple[tuple[str, int, int], ...]:
+    # Part of the memo key, so editing a pack's files yields a fresh fingerprint.
+    pack_path = Path("storage/packs") / pack
+    signature = []
+    for name in _PACK_FILES:
+        try:
+            stat = (pack_path / name).stat()
+        except OSError:
+            signature.append((name, -1, -1))
+            continue
+        signature.append((name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+@lru_cache(maxsize=64)
+def _pack_fingerprint(pack: str, files_signature: tuple[tuple[str, int, int], ...]) -> str | None:
+    pack_runner = get_pack_runner(
+        pack,
+        PackContext(
+            llm_mode="fixture",
+            openai_model="",
+            claude_model="",
+            openai_client_factory=MockLLMClient,
+            anthropic_client_factory=MockLLMClient,
+        ),
+    )
+    if pack_runner:
+        return pack_runner.fingerprint
+    try:
+        # The fingerprint only covers ontology and axioms, so a tiny memory suffices.
+        return load_pack(pack, ItemMemory(ItemMemoryConfig(dim=1))).fingerprint
+    except (FileNotFoundError, ValueError):
+        return None
 
 
 class VerifierService:
@@ -45,12 +93,12 @@ class VerifierService:
     def _default_perceiver(self) -> LLMClient:
         if self._settings.llm_mode != "live":
             return MockLLMClient()
-        return OpenAIClient(model=self._settings.openai_model)
+        return self._live_openai_client()
 
     def _default_reasoner(self) -> LLMClient:
         if self._settings.llm_mode != "live":
             return MockLLMClient()
-        return AnthropicClient(model=self._settings.claude_model)
+        return self._live_anthropic_client()
 
     def _get_perceiver(self) -> Perceiver:
         if self._perceiver is None:
@@ -77,6 +125,9 @@ class VerifierService:
         if self._reasoner and hasattr(self._reasoner, "reset_debug"):
             self._reasoner.reset_debug()
 
+    def pack_session(self, pack: str) -> PackSession:
+        return PackSession(self, pack)
+
     async def verify_sync(
         self,
         input_text: str,
@@ -85,30 +136,16 @@ class VerifierService:
         evidence: list[str] | None = None,
     ) -> VerificationResult | TariffVerificationResult:
         self.reset_debug()
-        resolved_options = options or VerifyOptions()
-        max_iters = resolved_options.max_iters or 5
-        threshold = (
-            resolved_options.threshold
-            if resolved_options.threshold is not None
-            else SCORE_THRESHOLD
-        )
-        pack_runner = get_pack_runner(
-            pack,
-            PackContext(
-                llm_mode=self._settings.llm_mode,
-                openai_model=self._settings.openai_model,
-                claude_model=self._settings.claude_model,
-                openai_client_factory=self._openai_client,
-                anthropic_client_factory=self._anthropic_client,
-            ),
-        )
-        if pack_runner:
-            options_payload: dict[str, object] = {"max_iters": max_iters, "threshold": threshold}
-            if resolved_options.min_mutations is not None:
-                options_payload["min_mutations"] = resolved_options.min_mutations
-            if evidence:
-                options_payload["evidence"] = evidence
-            return await pack_runner.run(input_text, options_payload)
+        return await self.pack_session(pack).verify(input_text, options, evidence)
+
+    async def _run_general(
+        self,
+        input_text: str,
+        pack: str,
+        max_iters: int,
+        threshold: float,
+        num_candidates: int = 1,
+    ) -> VerificationResult:
         try:
             return await self._verifier_fn(
                 user_text=input_text,
@@ -118,6 +155,7 @@ class VerifierService:
                 arbiter=None,
                 max_iters=max_iters,
                 threshold=threshold,
+                num_candidates=num_candidates,
             )
         except VerificationFailure as exc:
             return exc.result
@@ -125,9 +163,75 @@ class VerifierService:
     def _openai_client(self) -> LLMClient:
         if self._settings.llm_mode != "live":
             return MockLLMClient()
-        return OpenAIClient(model=self._settings.openai_model)
+        return self._live_openai_client()
 
     def _anthropic_client(self) -> LLMClient:
         if self._settings.llm_mode != "live":
             return MockLLMClient()
-        return AnthropicClient(model=self._settings.claude_model)
+        return self._live_anthropic_client()
+
+    def _live_openai_client(self) -> LLMClient:
+        client = get_llm_client_pool().openai(model=self._settings.openai_model)
+        return with_single_flight(with_llm_cache(client))
+
+    def _live_anthropic_client(self) -> LLMClient:
+        client = get_llm_client_pool().anthropic(model=self._settings.claude_model)
+        return with_single_flight(with_llm_cache(client))
+
+
+class PackSession:
+    """One pack runner and LLM client set, shared by every verification in a batch."""
+
+    def __init__(self, service: VerifierService, pack: str) -> None:
+        self._service = service
+        self.pack = pack
+        self._clients: dict[str, LLMClient] = {}
+        settings = service._settings
+        self._runner = get_pack_runner(
+            pack,
+            PackContext(
+                llm_mode=settings.llm_mode,
+                openai_model=settings.openai_model,
+                claude_model=settings.claude_model,
+                openai_client_factory=lambda: self._client("openai"),
+                anthropic_client_factory=lambda: self._client("anthropic"),
+            ),
+        )
+
+    def _client(self, provider: str) -> LLMClient:
+        client = self._clients.get(provider)
+        if client is None:
+            if provider == "openai":
+                client = self._service._openai_client()
+            else:
+                client = self._service._anthropic_client()
+            self._clients[provider] = client
+        return client
+
+    async def verify(
+        self,
+        input_text: str,
+        options: VerifyOptions | None = None,
+        evidence: list[str] | None = None,
+    ) -> VerificationResult | TariffVerificationResult:
+        resolved_options = options or VerifyOptions()
+        max_iters = resolved_options.max_iters or 5
+        threshold = (
+            resolved_options.threshold
+            if resolved_options.threshold is not None
+            else SCORE_THRESHOLD
+        )
+        if self._runner is None:
+            return await self._service._run_general(
+                input_text,
+                self.pack,
+                max_iters,
+                threshold,
+                num_candidates=resolved_options.num_candidates or 1,
+            )
+        options_payload: dict[str, object] = {"max_iters": max_iters, "threshold": threshold}
+        if resolved_options.min_mutations is not None:
+            options_payload["min_mutations"] = resolved_options.min_mutations
+        if evidence:
+            options_payload["evidence"] = evidence
+        return await self._runner.run(input_text, options_payload)
@@ -18,6 +18,19 @@ class Settings:
     auto_create_tables: bool
     llm_mode: str
     debug_default: bool
+    duty_batch_max_rows: int = 10000
+    db_async_mode: str = "threadpool"
+    verify_cache_ttl_s: float = 3600.0
+    verify_cache_max_entries: int = 256
+    verify_batch_max_items: int = 500
+    verify_batch_concurrency: int = 4
+    queue_default_lane: str = "interactive"
+    queue_fair_shards: int = 4
+    queue_interactive_weight: int = 4
+    queue_dedupe_ttl_s: int = 600
+    idempotency_ttl_s: float = 86400.0
+    idempotency_cache_max_entries: int = 1024
+    idempotency_sweep_interval_s: float = 300.0
 
 
 def _normalize_database_url(database_url: str) -> str:
@@ -44,6 +57,20 @@ def _validate_live_keys(llm_mode: str) -> None:
         )
 
 
+def _resolve_db_async_mode() -> str:
+    mode = os.getenv("TRUSTAI_DB_ASYNC_MODE", "threadpool").strip().lower()
+    if mode not in {"threadpool", "native"}:
+        raise ValueError("TRUSTAI_DB_ASYNC_MODE must be 'threadpool' or 'native'")
+    return mode
+
+
+def _resolve_queue_default_lane() -> str:
+    lane = os.getenv("TRUSTAI_QUEUE_DEFAULT_LANE", "interactive").strip().lower()
+    if lane not in {"interactive", "bulk"}:
+        raise ValueError("TRUSTAI_QUEUE_DEFAULT_LANE must be 'interactive' or 'bulk'")
+    return lane
+
+
 @lru_cache
 def get_settings() -> Settings:
     raw_database_url = os.getenv("DATABASE_URL")
@@ -66,6 +93,21 @@ def get_settings() -> Settings:
     llm_mode = get_llm_mode()
     _validate_live_keys(llm_mode)
     debug_default = os.getenv("TRUSTAI_DEBUG_DEFAULT", "0") == "1"
+    duty_batch_max_rows = int(os.getenv("TRUSTAI_DUTY_BATCH_MAX_ROWS", "10000"))
+    db_async_mode = _resolve_db_async_mode()
+    verify_cache_ttl_s = float(os.getenv("TRUSTAI_VERIFY_CACHE_TTL_S", "3600"))
+    verify_cache_max_entries = int(os.getenv("TRUSTAI_VERIFY_CACHE_MAX_ENTRIES", "256"))
+    verify_batch_max_items = int(os.getenv("TRUSTAI_VERIFY_BATCH_MAX_ITEMS", "500"))
+    verify_batch_concurrency = int(os.getenv("TRUSTAI_VERIFY_BATCH_CONCURRENCY", "4"))
+    queue_default_lane = _resolve_queue_default_lane()
+    queue_fair_shards = int(os.getenv("TRUSTAI_QUEUE_FAIR_SHARDS", "4"))
+    queue_interactive_weight = int(os.getenv("TRUSTAI_QUEUE_INTERACTIVE_WEIGHT", "4"))
+    queue_dedupe_ttl_s = int(os.getenv("TRUSTAI_QUEUE_DEDUPE_TTL_S", "600"))
+    idempotency_ttl_s = float(os.getenv("TRUSTAI_IDEMPOTENCY_TTL_S", "86400"))
+    idempotency_cache_max_entries = int(
+        os.getenv("TRUSTAI_IDEMPOTENCY_CACHE_MAX_ENTRIES", "1024")
+    )
+    idempotency_sweep_interval_s = float(os.getenv("TRUSTAI_IDEMPOTENCY_SWEEP_INTERVAL_S", "300"))
     return Settings(
         database_url=database_url,
         redis_url=redis_url,
@@ -75,4 +117,17 @@ def get_settings() -> Settings:
         auto_create_tables=auto_create_tables,
         llm_mode=llm_mode,
         debug_default=debug_default,
+        duty_batch_max_rows=duty_batch_max_rows,
+        db_async_mode=db_async_mode,
+        verify_cache_ttl_s=verify_cache_ttl_s,
+        verify_cache_max_entries=verify_cache_max_entries,
+        verify_batch_max_items=verify_batch_max_items,
+        verify_batch_concurrency=verify_batch_concurrency,
+        queue_default_lane=queue_default_lane,
+        queue_fair_shards=queue_fair_shards,
+        queue_interactive_weight=queue_interactive_weight,
+        queue_dedupe_ttl_s=queue_dedupe_ttl_s,
+        idempotency_ttl_s=idempotency_ttl_s,
+        idempotency_cache_max_entries=idempotency_cache_max_entries,
+        idempotency_sweep_interval_s=idempotency_sweep_interval_s,
     )
@@ -12,9 +12,23 @@ from trustai_api.settings import get_settings
 class DummyQueue:
     def __init__(self) -> None:
         self.enqueued: list[tuple[str, dict[str, Any]]] = []
+        self.routes: list[dict[str, Any]] = []
+        self.claims: dict[str, str] = {}
 
     def enqueue(self, func: str, job_id: str, payload: dict[str, Any], **kwargs: Any) -> None:
         self.enqueued.append((job_id, payload))
+        self.routes.append(kwargs)
+
+    def claim(self, request_hash: str, job_id: str, ttl_s: int) -> str | None:
+        if ttl_s <= 0:
+            return None
+        if request_hash in self.claims:
+            return self.claims[request_hash]
+        self.claims[request_hash] = job_id
+        return None
+
+    def reclaim(self, request_hash: str, job_id: str, ttl_s: int) -> None:
+        self.claims[request_hash] = job_id
 
 
 @pytest.fixture(autouse=True)
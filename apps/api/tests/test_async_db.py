@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from trustai_api.db.session import (
+    NativeAsyncDB,
+    ThreadpoolDB,
+    async_database_url,
+    create_async_engine_from_url,
+)
+from trustai_api.deps import open_async_db
+from trustai_api.main import create_app
+from trustai_api.services.idempotency import AsyncIdempotencyStore
+from trustai_api.services.job_store import AsyncJobStore
+from trustai_api.settings import get_settings
+
+
+def test_async_database_url_maps_drivers() -> None:
+    assert async_database_url("sqlite:///./trustai_dev.db") == "sqlite+aiosqlite:///./trustai_dev.db"
+    assert (
+        async_database_url("postgresql+psycopg://user:pass@db:5432/trustai")
+        == "postgresql+asyncpg://user:pass@db:5432/trustai"
+    )
+    with pytest.raises(ValueError):
+        async_database_url("mysql://user@db/trustai")
+
+
+def test_async_engine_rejects_in_memory_sqlite() -> None:
+    with pytest.raises(ValueError):
+        create_async_engine_from_url("sqlite:///:memory:")
+
+
+async def _round_trip_stores(db) -> tuple[str, str | None]:
+    try:
+        job_store = AsyncJobStore()
+        idempotency_store = AsyncIdempotencyStore()
+        created = await job_store.create(db, job_id="job-async", pack="general", input_text="x")
+        await job_store.set_running(db, created.job)
+        await idempotency_store.create(
+            db, request_id="req-async", mode="async", pack="general", job_id="job-async"
+        )
+        job = await job_store.get(db, "job-async")
+        record = await idempotency_store.get(db, "req-async")
+        return job.status, record.job_id
+    finally:
+        await db.close()
+
+
+def test_threadpool_db_round_trips_stores(client, app) -> None:
+    status, job_id = asyncio.run(_round_trip_stores(ThreadpoolDB(app.state.SessionLocal())))
+
+    assert status == "running"
+    assert job_id == "job-async"
+    response = client.get("/v1/jobs/job-async")
+    assert response.json()["status"] == "running"
+
+
+def test_native_db_round_trips_stores(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    pytest.importorskip("greenlet")
+    pytest.importorskip("aiosqlite")
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'trustai.db'}")
+    monkeypatch.setenv("TRUSTAI_DB_ASYNC_MODE", "native")
+    get_settings.cache_clear()
+    app = create_app()
+
+    with TestClient(app) as client:
+        async def _exercise() -> tuple[str, str | None]:
+            db = open_async_db(app)
+            assert isinstance(db, NativeAsyncDB)
+            try:
+                return await _round_trip_stores(db)
+            finally:
+                # Pooled aiosqlite connections belong to this loop, not the client's.
+                await app.state.async_engine.dispose()
+
+        status, job_id = asyncio.run(_exercise())
+
+        assert status == "running"
+        assert job_id == "job-async"
+        response = client.get("/v1/jobs/job-async")
+        assert response.json()["status"] == "running"
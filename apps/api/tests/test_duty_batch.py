@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import orjson
+from trustai_api.settings import get_settings
+
+
+def _read_ndjson(response) -> list[dict]:
+    return [orjson.loads(line) for line in response.content.splitlines() if line]
+
+
+def test_duty_batch_streams_ndjson_rows(client) -> None:
+    response = client.post(
+        "/v1/duty/batch",
+        json={
+            "rows": [
+                {
+                    "line_id": "7318.15",
+                    "origin_country": "CN",
+                    "effective_date": "2024-06-01",
+                    "customs_value": 1000.0,
+                },
+                {"line_id": "9999.99", "origin_country": "CN"},
+                {
+                    "line_id": "7318.15",
+                    "origin_country": "CN",
+                    "effective_date": "2024-06-01",
+                    "jurisdiction": "CA",
+                },
+                {"line_id": "7318.15", "effective_date": "not-a-date"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = _read_ndjson(response)
+    assert [row["index"] for row in rows] == [0, 1, 2, 3]
+    assert rows[0]["status"] == "ok"
+    assert rows[0]["total_rate_pct"] == 33.0
+    assert rows[0]["duty_amount"] == 330.0
+    assert rows[0]["applied_layer_ids"] == ["US.301.CN.V1"]
+    assert "breakdown" not in rows[0]
+    assert rows[1]["status"] == "unknown_line"
+    assert rows[2]["jurisdiction"] == "CA"
+    assert rows[2]["applied_layer_ids"] == ["CA.SURTAX.CN.V1"]
+    assert rows[3]["status"] == "error"
+
+
+def test_duty_batch_includes_breakdown_when_requested(client) -> None:
+    response = client.post(
+        "/v1/duty/batch",
+        json={
+            "include_breakdown": True,
+            "rows": [
+                {"line_id": "8544.11", "origin_country": "MX", "effective_date": "2024-06-01"}
+            ],
+        },
+    )
+
+    rows = _read_ndjson(response)
+    assert rows[0]["breakdown"]["total_rate_pct"] == rows[0]["total_rate_pct"]
+
+
+def test_duty_batch_rejects_oversized_batches(client, monkeypatch) -> None:
+    monkeypatch.setenv("TRUSTAI_DUTY_BATCH_MAX_ROWS", "1")
+    get_settings.cache_clear()
+    client.app.state.settings = get_settings()
+    response = client.post(
+        "/v1/duty/batch",
+        json={"rows": [{"line_id": "8544.11"}, {"line_id": "8544.11"}]},
+    )
+    assert response.status_code == 413
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timedelta
 from typing import Any
 
+from sqlalchemy import delete
+from trustai_api.db.models import IdempotencyKey
+from trustai_api.services.idempotency import (
+    AsyncIdempotencyStore,
+    IdempotencyRecord,
+    IdempotencyStore,
+)
+from trustai_api.services.idempotency_cache import InMemoryIdempotencyCache
 from trustai_core.schemas.proof import IterationTrace, MismatchReport, VerificationResult
 
 
@@ -79,3 +89,95 @@ def test_idempotency_reuses_response(client, app):
     assert response1.json()["proof_id"] == result.proof_id
     assert response2.json()["proof_id"] == result.proof_id
     assert len(verifier.calls) == 1
+
+
+def test_idempotency_replays_cached_response_without_sql(client, app):
+    verifier = FakeVerifier(_build_result())
+    app.state.verifier_service = verifier
+    headers = {"X-Request-Id": "req-cached"}
+    first = client.post("/v1/verify", json={"input": "Hello"}, headers=headers)
+
+    session = app.state.SessionLocal()
+    try:
+        session.execute(delete(IdempotencyKey))
+        session.commit()
+    finally:
+        session.close()
+    second = client.post("/v1/verify", json={"input": "Hello"}, headers=headers)
+
+    assert second.json() == first.json()
+    assert len(verifier.calls) == 1
+
+
+class _LoopCheckingCache(InMemoryIdempotencyCache):
+    """Records whether each call ran on a thread with a running event loop."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.on_loop: list[bool] = []
+
+    def _record_loop(self) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.on_loop.append(False)
+        else:
+            self.on_loop.append(True)
+
+    def get(self, request_id: str) -> IdempotencyRecord | None:
+        self._record_loop()
+        return super().get(request_id)
+
+    def put(self, record: IdempotencyRecord, ttl_s: float) -> None:
+        self._record_loop()
+        super().put(record, ttl_s)
+
+
+def test_idempotency_cache_calls_run_off_the_event_loop(client, app):
+    cache = _LoopCheckingCache()
+    app.state.idempotency_store = AsyncIdempotencyStore(cache=cache)
+    app.state.verifier_service = FakeVerifier(_build_result())
+    headers = {"X-Request-Id": "req-threadpool"}
+
+    client.post("/v1/verify", json={"input": "Hello"}, headers=headers)
+    client.post("/v1/verify", json={"input": "Hello"}, headers=headers)
+
+    assert cache.on_loop
+    assert not any(cache.on_loop)
+
+
+def test_idempotency_keys_expire_and_are_purged(client, app):
+    store = IdempotencyStore(ttl_s=60)
+    session = app.state.SessionLocal()
+    try:
+        for request_id in ("req-old-1", "req-old-2", "req-live"):
+            store.create(session, request_id=request_id, mode="sync", pack="general")
+        for request_id in ("req-old-1", "req-old-2"):
+            session.get(IdempotencyKey, request_id).expires_at = datetime.utcnow() - timedelta(
+                seconds=1
+            )
+        session.commit()
+
+        assert store.get(session, "req-old-1") is None
+        assert store.get(session, "req-live") is not None
+        # An expired key can be reused before the sweeper runs.
+        store.create(session, request_id="req-old-1", mode="async", pack="general")
+        assert store.get(session, "req-old-1").mode == "async"
+
+        assert store.purge_expired(session, batch_size=1) == 1
+        assert session.get(IdempotencyKey, "req-old-2") is None
+        assert session.get(IdempotencyKey, "req-live") is not None
+    finally:
+        session.close()
+
+
+def test_in_memory_idempotency_cache_evicts_and_expires():
+    cache = InMemoryIdempotencyCache(max_entries=1)
+    record = IdempotencyRecord("req-1", "sync", "general", None, "proof", "{}")
+
+    cache.put(record, ttl_s=60)
+    assert cache.get("req-1") == record
+    cache.put(IdempotencyRecord("req-2", "sync", "general", None, "proof", "{}"), ttl_s=60)
+    assert cache.get("req-1") is None
+    cache.put(record, ttl_s=0)
+    assert cache.get("req-1") is None
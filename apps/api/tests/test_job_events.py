@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+
+from trustai_api.services.job_events import (
+    _STREAM_MAXLEN,
+    BackgroundEventPublisher,
+    InMemoryJobEventBus,
+)
+from trustai_api.services.job_store import JobStore
+
+
+def _create_job(app, job_id: str) -> None:
+    session = app.state.SessionLocal()
+    try:
+        JobStore().create(session, job_id=job_id, pack="general", input_text="Hello")
+    finally:
+        session.close()
+
+
+class SlowBus(InMemoryJobEventBus):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.threads: set[str] = set()
+
+    def publish(self, job_id: str, kind: str, data: dict) -> None:
+        self.release.wait(5)
+        self.threads.add(threading.current_thread().name)
+        super().publish(job_id, kind, data)
+
+
+def _parse(body: str) -> list[dict[str, str]]:
+    events = []
+    for block in body.split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if line and not line.startswith(":")
+        )
+        if fields:
+            events.append(fields)
+    return events
+
+
+def test_job_events_stream_relays_and_resumes(client, app):
+    bus = InMemoryJobEventBus()
+    app.state.job_events = bus
+    _create_job(app, "job-sse")
+    bus.publish("job-sse", "running", {})
+    bus.publish("job-sse", "iteration", {"i": 1, "score": 0.5, "rejected_because": ["missing"]})
+    bus.publish("job-sse", "done", {"proof_id": "proof-1"})
+
+    response = client.get("/v1/jobs/job-sse/events")
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse(response.text)
+    assert [event["event"] for event in events] == ["running", "iteration", "done"]
+    assert events[1]["data"] == '{"i":1,"score":0.5,"rejected_because":["missing"]}'
+
+    resumed = client.get("/v1/jobs/job-sse/events", headers={"Last-Event-ID": "2"})
+    assert [event["event"] for event in _parse(resumed.text)] == ["done"]
+
+
+def test_in_memory_bus_ids_keep_increasing_after_trimming():
+    bus = InMemoryJobEventBus()
+    for index in range(_STREAM_MAXLEN + 5):
+        bus.publish("job-long", "iteration", {"i": index})
+
+    events = bus._since("job-long", None)
+    assert len(events) == _STREAM_MAXLEN
+    assert events[-1].id == str(_STREAM_MAXLEN + 5)
+    assert [event.data["i"] for event in bus._since("job-long", events[-2].id)] == [
+        _STREAM_MAXLEN + 4
+    ]
+    bus.publish("job-long", "done", {})
+    assert [event.kind for event in bus._since("job-long", events[-1].id)] == ["done"]
+
+
+def test_job_events_falls_back_to_job_row(client, app):
+    app.state.job_events = InMemoryJobEventBus()
+    _create_job(app, "job-failed")
+    session = app.state.SessionLocal()
+    try:
+        store = JobStore()
+        store.set_failed(session, store.get(session, "job-failed"), error="boom")
+    finally:
+        session.close()
+
+    response = client.get("/v1/jobs/job-failed/events")
+
+    assert _parse(response.text) == [{"event": "failed", "data": '{"error":"boom"}'}]
+    assert client.get("/v1/jobs/missing/events").status_code == 404
+
+
+def test_background_publisher_does_not_block_and_keeps_order():
+    bus = SlowBus()
+    publisher = BackgroundEventPublisher(lambda: bus)
+
+    for index in range(3):
+        publisher.publish("job-bg", "iteration", {"i": index})
+    assert bus._since("job-bg", None) == []
+
+    bus.release.set()
+    publisher.close()
+
+    assert [event.data["i"] for event in bus._since("job-bg", None)] == [0, 1, 2]
+    assert bus.threads == {"job-event-publisher"}
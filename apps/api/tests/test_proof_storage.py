@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import orjson
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, func, inspect, select, text
+from sqlalchemy.orm import sessionmaker
+from trustai_api.db.models import Proof, ProofBlob
+from trustai_api.services.proof_codec import decode_json, encode_json, project_payload
+from trustai_api.services.proof_store import ProofStore
+
+API_ROOT = Path(__file__).resolve().parents[1]
+
+EVIDENCE = [
+    {"source_id": "HTSUS-6404", "text": "Footwear with outer soles of rubber or plastics " * 20},
+    {"source_id": "GRI-3", "text": "Essential character governs composite goods " * 20},
+]
+
+
+def _payload(proof_id: str, evidence: list[dict[str, str]]) -> dict[str, object]:
+    return {
+        "status": "verified",
+        "proof_id": proof_id,
+        "pack": "tariff",
+        "pack_fingerprint": "fingerprint",
+        "evidence_manifest_hash": "evidence",
+        "final_answer": "6404.19.3960",
+        "iterations": [{"i": 1, "score": 0.97}],
+        "proof": {
+            "proof_id": proof_id,
+            "evidence_bundle": evidence,
+            "proposal_history": [{"baseline": {"hts_code": "6404.19.3960"}}],
+            "lever_proof": {"levers": [{"lever_id": "material_swap", "audit": "ok"}]},
+            "citations": None,
+        },
+    }
+
+
+def test_proof_payload_round_trips_and_dedupes_evidence(client, app):
+    session = app.state.SessionLocal()
+    try:
+        store = ProofStore(codec="zlib")
+        first = _payload("proof-a", EVIDENCE)
+        second = _payload("proof-b", EVIDENCE + [{"source_id": "CBP", "text": "Ruling"}])
+        store.create(session, payload=first)
+        store.create(session, payload=second)
+
+        assert store.get_payload(session, "proof-a") == first
+        assert store.get_payload(session, "proof-b") == second
+        blob_count = session.scalar(select(func.count()).select_from(ProofBlob))
+        # 3 distinct evidence items + shared proposal history + shared lever proof.
+        assert blob_count == 5
+        row = store.get(session, "proof-a")
+        assert row.payload_json is None
+        assert row.final_answer == "6404.19.3960"
+        assert row.iteration_count == 1
+        assert len(row.payload_blob) < len(orjson.dumps(first))
+    finally:
+        session.close()
+
+
+def test_legacy_payload_json_rows_still_load(client, app):
+    legacy = _payload("proof-legacy", EVIDENCE)
+    session = app.state.SessionLocal()
+    try:
+        session.add(
+            Proof(
+                proof_id="proof-legacy",
+                pack="tariff",
+                pack_fingerprint="fingerprint",
+                status="verified",
+                score=0.97,
+                payload_json=orjson.dumps(legacy).decode(),
+            )
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    response = client.get("/v1/proofs/proof-legacy")
+
+    assert response.status_code == 200
+    assert response.json()["payload"]["proof"]["evidence_bundle"] == EVIDENCE
+
+
+def test_zlib_codec_round_trip():
+    value = {"text": "evidence " * 100}
+    encoded = encode_json(value, "zlib")
+    assert decode_json(encoded, "zlib") == value
+    assert len(encoded) < len(orjson.dumps(value))
+
+
+def test_fields_projection_for_proofs_and_jobs(client, app, monkeypatch):
+    from trustai_api.services import proof_store as proof_store_module
+    from trustai_api.services.job_store import JobStore
+
+    payload = _payload("proof-fields", EVIDENCE)
+    session = app.state.SessionLocal()
+    try:
+        ProofStore().create(session, payload=payload)
+        job_store = JobStore()
+        job = job_store.create(session, job_id="job-fields", pack="tariff", input_text="x").job
+        job_store.set_done(session, job, proof_id="proof-fields")
+    finally:
+        session.close()
+
+    def _fail_decode(*args, **kwargs):
+        raise AssertionError("summary fields must not decode the payload blob")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(proof_store_module, "decode_json", _fail_decode)
+        summary = client.get("/v1/jobs/job-fields", params={"fields": "status,final_answer"})
+    assert summary.json()["result"] == {"final_answer": "6404.19.3960", "status": "verified"}
+
+    section = client.get(
+        "/v1/proofs/proof-fields", params={"fields": "iterations,proof.evidence_bundle"}
+    )
+    assert section.json()["payload"] == {
+        "iterations": payload["iterations"],
+        "proof": {"evidence_bundle": EVIDENCE},
+    }
+
+    full = client.get("/v1/proofs/proof-fields")
+    assert full.json()["payload"] == payload
+
+    unknown = client.get("/v1/proofs/proof-fields", params={"fields": "status,blob"})
+    assert unknown.status_code == 400
+    assert unknown.json()["detail"]["fields"] == ["blob"]
+
+
+def test_summary_fields_match_blob_path_for_missing_values(client, app):
+    payload = _payload("proof-sparse", EVIDENCE)
+    del payload["evidence_manifest_hash"]
+    del payload["pack"]
+    payload["final_answer"] = None
+    session = app.state.SessionLocal()
+    try:
+        store = ProofStore(codec="zlib")
+        store.create(session, payload=payload)
+        for fields in (
+            {"status", "evidence_manifest_hash"},
+            {"pack", "proof_id"},
+            {"final_answer"},
+        ):
+            expected = project_payload(payload, fields)
+            assert store.get_payload(session, "proof-sparse", fields) == expected
+    finally:
+        session.close()
+
+
+def test_migration_upgrades_legacy_proofs_table(tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    engine = create_engine(database_url)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE proofs (proof_id VARCHAR PRIMARY KEY, created_at DATETIME, "
+                "pack VARCHAR NOT NULL, pack_fingerprint VARCHAR NOT NULL, "
+                "status VARCHAR NOT NULL, score FLOAT NOT NULL, payload_json TEXT NOT NULL, "
+                "request_hash VARCHAR, metadata JSON)"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE TABLE idempotency_keys (request_id VARCHAR PRIMARY KEY, "
+                "created_at DATETIME, mode VARCHAR NOT NULL, pack VARCHAR NOT NULL, "
+                "job_id VARCHAR, proof_id VARCHAR, response_json TEXT, expires_at DATETIME)"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO proofs (proof_id, pack, pack_fingerprint, status, score, "
+                "payload_json) VALUES ('legacy', 'tariff', 'fp', 'verified', 0.9, :payload)"
+            ),
+            {"payload": orjson.dumps(_payload("legacy", EVIDENCE)).decode()},
+        )
+
+    config = Config(str(API_ROOT / "alembic.ini"))
+    config.set_main_option("sqlalchemy.url", database_url)
+    command.upgrade(config, "head")
+    proof_indexes = {index["name"] for index in inspect(engine).get_indexes("proofs")}
+    assert "ix_proofs_request_hash" in proof_indexes
+    key_indexes = {index["name"] for index in inspect(engine).get_indexes("idempotency_keys")}
+    assert "ix_idempotency_keys_expires_at" in key_indexes
+
+    session = sessionmaker(bind=engine)()
+    try:
+        store = ProofStore(codec="zlib")
+        store.create(session, payload=_payload("proof-new", EVIDENCE))
+        assert store.get_payload(session, "legacy")["proof_id"] == "legacy"
+        assert store.get_payload(session, "proof-new")["proof"]["evidence_bundle"] == EVIDENCE
+    finally:
+        session.close()
+        engine.dispose()
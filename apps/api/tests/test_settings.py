@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pytest
 from trustai_api.settings import get_settings
 
 
@@ -60,3 +61,16 @@ def test_debug_default_env(monkeypatch) -> None:
     get_settings.cache_clear()
     settings = get_settings()
     assert settings.debug_default is True
+
+
+def test_db_async_mode_env(monkeypatch) -> None:
+    monkeypatch.delenv("TRUSTAI_DB_ASYNC_MODE", raising=False)
+    get_settings.cache_clear()
+    assert get_settings().db_async_mode == "threadpool"
+    monkeypatch.setenv("TRUSTAI_DB_ASYNC_MODE", "native")
+    get_settings.cache_clear()
+    assert get_settings().db_async_mode == "native"
+    monkeypatch.setenv("TRUSTAI_DB_ASYNC_MODE", "greenthreads")
+    get_settings.cache_clear()
+    with pytest.raises(ValueError):
+        get_settings()
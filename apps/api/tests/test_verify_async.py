@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import orjson
 from trustai_api.db.models import Job
+from trustai_api.queue import QueueLayout
 
 
 def test_verify_async_enqueues_job(client, app):
@@ -21,3 +22,82 @@ def test_verify_async_enqueues_job(client, app):
         assert orjson.loads(job.payload_json)["input"] == "Hello"
     finally:
         session.close()
+
+
+def test_verify_async_routes_by_priority_and_tenant(client, app):
+    response = client.post(
+        "/v1/verify?mode=async",
+        json={"input": "Backfill", "priority": "bulk"},
+        headers={"X-TrustAI-Tenant": "acme"},
+    )
+
+    assert response.status_code == 200
+    assert app.state.queue.routes == [{"lane": "bulk", "fairness_key": "acme"}]
+
+
+def test_verify_async_dedupes_identical_requests(client, app):
+    first = client.post("/v1/verify?mode=async", json={"input": "Hello"}).json()
+    second = client.post("/v1/verify?mode=async", json={"input": "Hello"}).json()
+    other = client.post("/v1/verify?mode=async", json={"input": "Other"}).json()
+
+    assert second == first
+    assert other["job_id"] != first["job_id"]
+    assert len(app.state.queue.enqueued) == 2
+
+
+def test_verify_async_claims_after_job_row_exists(client, app):
+    queue = app.state.queue
+    claim = queue.claim
+    rows_at_claim: list[Job | None] = []
+
+    def _claim(request_hash: str, job_id: str, ttl_s: int) -> str | None:
+        session = app.state.SessionLocal()
+        try:
+            rows_at_claim.append(session.get(Job, job_id))
+        finally:
+            session.close()
+        return claim(request_hash, job_id, ttl_s)
+
+    queue.claim = _claim
+    first = client.post("/v1/verify?mode=async", json={"input": "Hello"}).json()
+    second = client.post("/v1/verify?mode=async", json={"input": "Hello"}).json()
+
+    assert all(row is not None for row in rows_at_claim)
+    assert second == first
+    session = app.state.SessionLocal()
+    try:
+        assert session.query(Job).count() == 1
+    finally:
+        session.close()
+
+
+def test_verify_async_requeues_after_failed_job(client, app):
+    first = client.post("/v1/verify?mode=async", json={"input": "Hello"}).json()
+    session = app.state.SessionLocal()
+    try:
+        session.get(Job, first["job_id"]).status = "failed"
+        session.commit()
+    finally:
+        session.close()
+
+    retry = client.post("/v1/verify?mode=async", json={"input": "Hello"}).json()
+
+    assert retry["job_id"] != first["job_id"]
+    assert retry["status"] == "queued"
+    assert len(app.state.queue.enqueued) == 2
+
+
+def test_queue_layout_interleaves_lanes_and_shards():
+    layout = QueueLayout(shards=2, interactive_weight=2)
+
+    assert layout.queue_name("bulk", "acme") == layout.queue_name("bulk", "acme")
+    assert layout.dequeue_order(0) == [
+        "trustai-interactive-0",
+        "trustai-interactive-1",
+        "trustai-bulk-0",
+        "trustai-bulk-1",
+        "trustai",
+    ]
+    assert layout.dequeue_order(1)[:2] == ["trustai-interactive-1", "trustai-interactive-0"]
+    # Every third dequeue gives bulk first pick.
+    assert layout.dequeue_order(2)[0].startswith("trustai-bulk-")
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from typing import Any
+
+import orjson
+from trustai_api.routes.verify_batch import _BatchRun
+from trustai_api.schemas import VerifyBatchItem
+from trustai_api.services.proof_store import ProofStore
+from trustai_api.services.verifier_service import VerifierService, pack_fingerprint
+from trustai_core.schemas.proof import IterationTrace, MismatchReport, VerificationResult
+
+
+def _build_result(answer: str) -> VerificationResult:
+    mismatch = MismatchReport(
+        score=0.95,
+        threshold=0.92,
+        unsupported_claims=[],
+        missing_required=[],
+        ontology_conflicts=[],
+        contradictions=[],
+    )
+    iteration = IterationTrace(
+        i=1,
+        answer_preview=answer,
+        score=0.95,
+        mismatch=mismatch,
+        feedback_summary="",
+        claim_manifest_hash="hash",
+        top_conflicts=[],
+        unsupported_claims=[],
+        missing_required=[],
+        feedback_text="",
+        answer_delta_summary="initial_answer",
+    )
+    fingerprint = pack_fingerprint("general")
+    payload = {
+        "status": "verified",
+        "pack": "general",
+        "pack_fingerprint": fingerprint,
+        "evidence_manifest_hash": "evidence",
+        "final_answer": answer,
+        "iterations": [iteration.model_dump()],
+        "explain": {"score": 0.95, "threshold": 0.92},
+    }
+    return VerificationResult(
+        proof_id=VerificationResult.compute_proof_id(payload),
+        status="verified",
+        pack="general",
+        pack_fingerprint=fingerprint,
+        evidence_manifest_hash="evidence",
+        final_answer=answer,
+        iterations=[iteration],
+        explain={"score": 0.95, "threshold": 0.92},
+    )
+
+
+def _install_verifier(app) -> list[str]:
+    calls: list[str] = []
+
+    async def _verify(user_text: str, **kwargs: Any) -> VerificationResult:
+        calls.append(user_text)
+        return _build_result(f"answer for {user_text}")
+
+    app.state.verifier_service = VerifierService(app.state.settings, verifier_fn=_verify)
+    return calls
+
+
+def test_verify_batch_dedupes_and_persists_proofs(client, app):
+    calls = _install_verifier(app)
+    items = [
+        {"id": "a", "input": "Hello"},
+        {"id": "b", "input": "World"},
+        {"id": "c", "input": "Hello"},
+    ]
+
+    response = client.post("/v1/verify:batch", json={"items": items, "concurrency": 2})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [orjson.loads(line) for line in response.text.splitlines()]
+    by_id = {line["id"]: line for line in lines}
+    assert sorted(by_id) == ["a", "b", "c"]
+    assert sorted(calls) == ["Hello", "World"]
+    assert by_id["a"]["result"] == by_id["c"]["result"]
+    assert set(by_id["b"]["result"]) == {"status", "proof_id", "final_answer"}
+    session = app.state.SessionLocal()
+    try:
+        stored = ProofStore().get_payload(session, by_id["b"]["result"]["proof_id"])
+    finally:
+        session.close()
+    assert stored["final_answer"] == "answer for World"
+
+    again = client.post(
+        "/v1/verify:batch",
+        json={"items": [{"input": "World"}], "format": "sse", "fields": "final_answer"},
+    )
+    assert again.headers["content-type"].startswith("text/event-stream")
+    events = [chunk for chunk in again.text.split("\n\n") if chunk]
+    assert events[0].startswith("event: result")
+    result = orjson.loads(events[0].split("data: ", 1)[1])
+    assert result == {
+        "index": 0,
+        "id": None,
+        "cached": True,
+        "result": {"final_answer": "answer for World"},
+    }
+    assert events[-1].startswith("event: done")
+    assert sorted(calls) == ["Hello", "World"]
+
+
+def test_verify_batch_commits_proofs_before_yielding_them(client, app):
+    _install_verifier(app)
+    batch = _BatchRun(
+        app=app,
+        session=app.state.verifier_service.pack_session("general"),
+        fingerprint=pack_fingerprint("general"),
+        result_cache=app.state.verify_result_cache,
+        options=None,
+        options_payload=None,
+        fields={"proof_id"},
+        concurrency=1,
+    )
+    groups = {
+        f"hash-{index}": [(index, VerifyBatchItem(input=f"item {index}"))] for index in range(3)
+    }
+
+    async def _first_line_then_disconnect() -> dict[str, Any]:
+        lines = batch.stream(groups)
+        line = await lines.__anext__()
+        await lines.aclose()
+        return line
+
+    line = asyncio.run(_first_line_then_disconnect())
+
+    session = app.state.SessionLocal()
+    try:
+        assert ProofStore().get(session, line["result"]["proof_id"]) is not None
+    finally:
+        session.close()
+
+
+def test_verify_batch_rejects_oversized_batches(client, app):
+    _install_verifier(app)
+    app.state.settings = replace(app.state.settings, verify_batch_max_items=1)
+
+    response = client.post(
+        "/v1/verify:batch", json={"items": [{"input": "Hello"}, {"input": "World"}]}
+    )
+
+    assert response.status_code == 413
+
+
+def test_verify_passes_num_candidates_to_general_verifier(client, app):
+    seen: list[Any] = []
+
+    async def _verify(user_text: str, **kwargs: Any) -> VerificationResult:
+        seen.append(kwargs["num_candidates"])
+        return _build_result(f"answer for {user_text}")
+
+    app.state.verifier_service = VerifierService(app.state.settings, verifier_fn=_verify)
+
+    response = client.post(
+        "/v1/verify", json={"input": "Candidates", "options": {"num_candidates": 3}}
+    )
+    batch = client.post(
+        "/v1/verify:batch",
+        json={"items": [{"input": "Batch"}], "options": {"num_candidates": 2}},
+    )
+
+    assert response.status_code == 200
+    assert batch.status_code == 200
+    assert seen == [3, 2]
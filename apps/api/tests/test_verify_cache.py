@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import Any
+
+from trustai_api.services.result_cache import VerifyResultCache, is_cacheable
+from trustai_api.services.verifier_service import pack_fingerprint
+from trustai_core.schemas.proof import IterationTrace, MismatchReport, VerificationResult
+
+
+def _build_result(fingerprint: str, status: str = "verified") -> VerificationResult:
+    mismatch = MismatchReport(
+        score=0.95,
+        threshold=0.92,
+        unsupported_claims=[],
+        missing_required=[],
+        ontology_conflicts=[],
+        contradictions=[],
+    )
+    iteration = IterationTrace(
+        i=1,
+        answer_preview="Answer",
+        score=0.95,
+        mismatch=mismatch,
+        feedback_summary="",
+        claim_manifest_hash="hash",
+        top_conflicts=[],
+        unsupported_claims=[],
+        missing_required=[],
+        feedback_text="",
+        answer_delta_summary="initial_answer",
+    )
+    payload = {
+        "status": status,
+        "pack": "general",
+        "pack_fingerprint": fingerprint,
+        "evidence_manifest_hash": "evidence",
+        "final_answer": "Answer",
+        "iterations": [iteration.model_dump()],
+        "explain": {"score": 0.95, "threshold": 0.92},
+    }
+    return VerificationResult(
+        proof_id=VerificationResult.compute_proof_id(payload),
+        status=status,
+        pack="general",
+        pack_fingerprint=fingerprint,
+        evidence_manifest_hash="evidence",
+        final_answer="Answer",
+        iterations=[iteration],
+        explain={"score": 0.95, "threshold": 0.92},
+    )
+
+
+class FakeVerifier:
+    def __init__(self, result: VerificationResult) -> None:
+        self._result = result
+        self.calls: list[tuple[str, str, Any, Any]] = []
+
+    async def verify_sync(
+        self,
+        input_text: str,
+        pack: str,
+        options: Any = None,
+        evidence: Any = None,
+    ) -> VerificationResult:
+        self.calls.append((input_text, pack, options, evidence))
+        return self._result
+
+    def debug_info(self) -> dict[str, object]:
+        return {}
+
+
+def test_identical_requests_reuse_stored_proof(client, app):
+    result = _build_result(pack_fingerprint("general"))
+    verifier = FakeVerifier(result)
+    app.state.verifier_service = verifier
+
+    first = client.post("/v1/verify", json={"input": "Hello"})
+    second = client.post("/v1/verify", json={"input": "Hello"})
+    app.state.verify_result_cache.clear()
+    from_db = client.post("/v1/verify", json={"input": "Hello"})
+    different = client.post("/v1/verify", json={"input": "Hello there"})
+
+    assert first.json() == second.json() == from_db.json()
+    assert different.json()["proof_id"] == result.proof_id
+    assert [call[0] for call in verifier.calls] == ["Hello", "Hello there"]
+
+
+def test_stale_fingerprint_and_debug_bypass_cache(client, app):
+    verifier = FakeVerifier(_build_result("old-fingerprint"))
+    app.state.verifier_service = verifier
+
+    client.post("/v1/verify", json={"input": "Hello"})
+    client.post("/v1/verify", json={"input": "Hello"})
+    assert len(verifier.calls) == 2
+
+    verifier._result = _build_result(pack_fingerprint("general"))
+    client.post("/v1/verify", json={"input": "Hello"})
+    client.post("/v1/verify", json={"input": "Hello"}, headers={"X-TrustAI-Debug": "1"})
+    assert len(verifier.calls) == 4
+
+
+def test_cache_disabled_with_zero_ttl(client, app):
+    app.state.verify_result_cache = VerifyResultCache(ttl_s=0)
+    verifier = FakeVerifier(_build_result(pack_fingerprint("general")))
+    app.state.verifier_service = verifier
+
+    client.post("/v1/verify", json={"input": "Hello"})
+    client.post("/v1/verify", json={"input": "Hello"})
+
+    assert len(verifier.calls) == 2
+
+
+def test_failed_results_are_not_replayed(client, app):
+    verifier = FakeVerifier(_build_result(pack_fingerprint("general"), status="failed"))
+    app.state.verifier_service = verifier
+
+    client.post("/v1/verify", json={"input": "Hello"})
+    client.post("/v1/verify", json={"input": "Hello"})
+    app.state.verify_result_cache.clear()
+    client.post("/v1/verify", json={"input": "Hello"})
+
+    assert len(verifier.calls) == 3
+
+
+def test_llm_unavailable_payloads_are_not_cacheable():
+    payload = {
+        "status": "verified",
+        "iterations": [{"rejected_because": ["llm_unavailable"]}],
+    }
+
+    assert not is_cacheable(payload)
+    assert not is_cacheable({"status": "failed", "iterations": []})
+    assert is_cacheable({"status": "verified", "iterations": [{"rejected_because": []}]})
+
+
+def test_pack_fingerprint_tracks_pack_file_edits(tmp_path, monkeypatch):
+    pack_dir = tmp_path / "storage" / "packs" / "edited"
+    pack_dir.mkdir(parents=True)
+    (pack_dir / "ontology.json").write_text("{}")
+    (pack_dir / "axioms.json").write_text("[]")
+    monkeypatch.chdir(tmp_path)
+
+    before = pack_fingerprint("edited")
+    assert pack_fingerprint("edited") == before
+    (pack_dir / "axioms.json").write_text(
+        '[{"subject": "bridge", "predicate": "status", "obj": "safe"}]'
+    )
+
+    assert pack_fingerprint("edited") != before
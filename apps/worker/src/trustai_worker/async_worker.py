@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import traceback
+from typing import Any
+
+from rq import Queue
+from rq.defaults import DEFAULT_RESULT_TTL
+from rq.exceptions import DequeueTimeout
+from rq.executions import Execution
+from rq.job import Job, JobStatus
+from rq.utils import current_timestamp, now
+from trustai_api.db.session import ThreadpoolDB
+from trustai_api.queue.rq import VERIFY_FUNC, LaneQueue
+from trustai_api.services.job_events import BackgroundEventPublisher
+from trustai_api.services.job_store import JobStatusBuffer
+
+from trustai_worker import tasks
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncVerifyWorker:
+    """Pulls verify jobs off the RQ queue and runs up to ``concurrency`` of them on one loop.
+
+    Jobs stay RQ jobs, so producers and the plain RQ worker are unaffected; this
+    worker only replaces the fork-per-job execution with tasks on a long-lived loop,
+    which keeps LLM clients and pack caches warm between jobs. Each dequeue follows
+    the lane layout's priority and fair-share order.
+
+    Running jobs are tracked in RQ's started registry and heartbeated like a forked
+    job, then moved to the finished or failed registry. Entries whose heartbeat lapses
+    (the worker died mid-job) are reaped periodically: their rows are marked failed
+    and RQ moves them to the failed registry.
+    """
+
+    def __init__(
+        self,
+        queue: LaneQueue,
+        concurrency: int = 8,
+        poll_timeout_s: int = 5,
+        status_flush_s: float = 0.25,
+        heartbeat_interval_s: float = 30.0,
+        maintenance_interval_s: float = 60.0,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._queue = queue
+        self._concurrency = concurrency
+        self._poll_timeout_s = poll_timeout_s
+        self._status_flush_s = status_flush_s
+        self._heartbeat_interval_s = heartbeat_interval_s
+        # Same slack RQ gives its own workers over the monitoring interval.
+        self._heartbeat_ttl_s = int(heartbeat_interval_s) + 60
+        self._maintenance_interval_s = maintenance_interval_s
+        self.name = f"{socket.gethostname()}.{os.getpid()}.async"
+        self.status_buffer = JobStatusBuffer()
+        # A synchronous XADD per progress event would stall every job on the loop.
+        self.publisher = BackgroundEventPublisher(lambda: tasks._event_bus())
+        self._stopping = asyncio.Event()
+        self.completed = 0
+        self.failed = 0
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self, burst: bool = False) -> None:
+        semaphore = asyncio.Semaphore(self._concurrency)
+        running: set[asyncio.Task[None]] = set()
+        flusher = asyncio.create_task(self._flush_statuses())
+        maintenance = asyncio.create_task(self._maintain())
+        try:
+            await self._consume(semaphore, running, burst)
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        finally:
+            flusher.cancel()
+            maintenance.cancel()
+            await asyncio.gather(flusher, maintenance, return_exceptions=True)
+            await asyncio.to_thread(self.publisher.close)
+
+    async def _consume(
+        self,
+        semaphore: asyncio.Semaphore,
+        running: set[asyncio.Task[None]],
+        burst: bool,
+    ) -> None:
+        while not self._stopping.is_set():
+            await semaphore.acquire()
+            rq_job = await asyncio.to_thread(self._dequeue, None if burst else self._poll_timeout_s)
+            if rq_job is None:
+                semaphore.release()
+                if burst:
+                    break
+                continue
+            task = asyncio.create_task(self._execute(rq_job))
+            running.add(task)
+            task.add_done_callback(running.discard)
+            task.add_done_callback(lambda _: semaphore.release())
+
+    async def _flush_statuses(self) -> None:
+        db: ThreadpoolDB | None = None
+        try:
+            while True:
+                await asyncio.sleep(self._status_flush_s)
+                if not len(self.status_buffer):
+                    continue
+                if db is None:
+                    db = ThreadpoolDB(tasks._get_session())
+                try:
+                    await db.run(self.status_buffer.flush)
+                except Exception:
+                    logger.exception("async_worker_status_flush_failed")
+                    await db.run(lambda session: session.rollback())
+        finally:
+            if db is not None:
+                await db.close()
+
+    async def _maintain(self) -> None:
+        while True:
+            try:
+                abandoned = await asyncio.to_thread(self._reap_abandoned)
+                if abandoned:
+                    logger.warning("async_worker_reaped_jobs", extra={"job_ids": abandoned})
+                    db = ThreadpoolDB(tasks._get_session())
+                    try:
+                        for job_id in abandoned:
+                            await db.run(tasks._mark_abandoned, job_id)
+                    finally:
+                        await db.close()
+            except Exception:
+                logger.exception("async_worker_maintenance_failed")
+            await asyncio.sleep(self._maintenance_interval_s)
+
+    def _reap_abandoned(self) -> list[str]:
+        """Clears started-registry entries whose heartbeat lapsed; returns their verify job ids."""
+        abandoned: list[str] = []
+        timestamp = current_timestamp()
+        for queue in self._queue.all_queues():
+            registry = queue.started_job_registry
+            expired = registry.get_expired_job_ids(timestamp)
+            if not expired:
+                continue
+            for rq_job in Job.fetch_many(expired, connection=self._queue.connection):
+                if rq_job is not None and rq_job.func_name == VERIFY_FUNC:
+                    abandoned.append(_job_args(rq_job)[0])
+            registry.cleanup(timestamp)
+        return abandoned
+
+    def _start(self, rq_job: Job) -> Execution:
+        with rq_job.connection.pipeline() as pipeline:
+            rq_job.prepare_for_execution(self.name, pipeline=pipeline)
+            execution = Execution.create(
+                rq_job, self._heartbeat_ttl_s, pipeline, worker_name=self.name
+            )
+            pipeline.execute()
+        return execution
+
+    def _heartbeat(self, rq_job: Job, execution: Execution) -> None:
+        with rq_job.connection.pipeline() as pipeline:
+            execution.heartbeat(rq_job.started_job_registry, self._heartbeat_ttl_s, pipeline)
+            rq_job.heartbeat(now(), self._heartbeat_ttl_s, pipeline=pipeline, xx=True)
+            pipeline.execute()
+
+    def _finish(self, rq_job: Job, execution: Execution) -> None:
+        with rq_job.connection.pipeline() as pipeline:
+            rq_job.set_status(JobStatus.FINISHED, pipeline=pipeline)
+            result_ttl = rq_job.get_result_ttl(DEFAULT_RESULT_TTL)
+            if result_ttl != 0:
+                rq_job.finished_job_registry.add(rq_job, result_ttl, pipeline=pipeline)
+            rq_job.cleanup(result_ttl, pipeline=pipeline, remove_from_queue=False)
+            execution.delete(rq_job, pipeline)
+            pipeline.execute()
+
+    def _fail(self, rq_job: Job, execution: Execution | None, exc_string: str) -> None:
+        with rq_job.connection.pipeline() as pipeline:
+            rq_job.set_status(JobStatus.FAILED, pipeline=pipeline)
+            rq_job.failed_job_registry.add(
+                rq_job, ttl=rq_job.failure_ttl, exc_string=exc_string, pipeline=pipeline
+            )
+            if execution is not None:
+                execution.delete(rq_job, pipeline)
+            pipeline.execute()
+
+    async def _keep_alive(self, rq_job: Job, execution: Execution) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_interval_s)
+            try:
+                await asyncio.to_thread(self._heartbeat, rq_job, execution)
+            except Exception:
+                logger.exception("async_worker_heartbeat_failed", extra={"rq_job_id": rq_job.id})
+
+    def _dequeue(self, timeout: int | None) -> Job | None:
+        try:
+            result = Queue.dequeue_any(
+                self._queue.ordered_queues(), timeout, connection=self._queue.connection
+            )
+        except DequeueTimeout:
+            # An idle poll interval, not an error; the loop simply polls again.
+            return None
+        return result[0] if result else None
+
+    async def _execute(self, rq_job: Job) -> None:
+        if rq_job.func_name != VERIFY_FUNC:
+            logger.warning("async_worker_unknown_job", extra={"func": rq_job.func_name})
+            await asyncio.to_thread(
+                self._fail, rq_job, None, f"Unsupported job function: {rq_job.func_name}"
+            )
+            self.failed += 1
+            return
+        execution = await asyncio.to_thread(self._start, rq_job)
+        heartbeat = asyncio.create_task(self._keep_alive(rq_job, execution))
+        job_id, payload = _job_args(rq_job)
+        try:
+            await tasks.run_deep_verify_async(
+                job_id, payload, self.status_buffer, publish=self.publisher.publish
+            )
+        except Exception:
+            logger.exception("async_worker_job_failed", extra={"job_id": job_id})
+            await asyncio.to_thread(self._fail, rq_job, execution, traceback.format_exc())
+            self.failed += 1
+            return
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+        await asyncio.to_thread(self._finish, rq_job, execution)
+        self.completed += 1
+
+
+def _job_args(rq_job: Job) -> tuple[str, dict[str, Any]]:
+    args = list(rq_job.args)
+    kwargs = rq_job.kwargs
+    job_id = args[0] if args else kwargs["job_id"]
+    payload = args[1] if len(args) > 1 else kwargs.get("payload", {})
+    return job_id, payload
+
+
+async def serve(queue: LaneQueue, concurrency: int, status_flush_s: float = 0.25) -> None:
+    worker = AsyncVerifyWorker(queue, concurrency=concurrency, status_flush_s=status_flush_s)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, worker.stop)
+        except NotImplementedError:  # pragma: no cover - non-POSIX event loops
+            pass
+    await worker.run()
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from functools import lru_cache
 from typing import Any
 
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 from trustai_api.db.models import Base
-from trustai_api.db.session import create_engine_from_url, create_sessionmaker
+from trustai_api.db.session import ThreadpoolDB, create_engine_from_url, create_sessionmaker
 from trustai_api.routes.utils import normalize_verification_result
-from trustai_api.services.idempotency import IdempotencyStore
-from trustai_api.services.job_store import JobStore
-from trustai_api.services.proof_store import ProofStore
+from trustai_api.services.job_events import JobEventBus, create_job_event_bus
+from trustai_api.services.job_store import AsyncJobStore, JobStatusBuffer, JobStore
+from trustai_api.services.proof_store import ProofWrite
 from trustai_api.services.verifier_service import VerifierService, VerifyOptions
 from trustai_api.settings import get_settings
+from trustai_core.utils.events import event_sink
 
 
 def _run(coro: Any) -> Any:
@@ -38,48 +41,89 @@ def _verifier_service() -> VerifierService:
     return VerifierService(settings)
 
 
+@lru_cache
+def _event_bus() -> JobEventBus:
+    return create_job_event_bus(get_settings().redis_url)
+
+
+def _publish(job_id: str, kind: str, data: dict[str, Any]) -> None:
+    try:
+        _event_bus().publish(job_id, kind, data)
+    except RedisError:
+        pass
+
+
 def _get_session() -> Session:
     session_local = _sessionmaker()
     return session_local()
 
 
 def run_deep_verify(job_id: str, payload: dict[str, Any]) -> None:
-    session = _get_session()
-    job_store = JobStore()
-    proof_store = ProofStore()
-    idempotency_store = IdempotencyStore()
-    job = job_store.get(session, job_id)
-    if not job:
-        session.close()
-        return
-    job_store.set_running(session, job)
+    _run(run_deep_verify_async(job_id, payload))
+
+
+async def run_deep_verify_async(
+    job_id: str,
+    payload: dict[str, Any],
+    status_buffer: JobStatusBuffer | None = None,
+    publish: Callable[[str, str, dict[str, Any]], None] | None = None,
+) -> None:
+    publish = publish or _publish
+    db = ThreadpoolDB(_get_session())
+    job_store = AsyncJobStore()
     try:
-        options_payload = payload.get("options") if payload else None
-        options = None
-        if isinstance(options_payload, dict):
-            options = VerifyOptions(
-                max_iters=options_payload.get("max_iters"),
-                threshold=options_payload.get("threshold"),
-                min_mutations=options_payload.get("min_mutations"),
-            )
-        result = _run(
-            _verifier_service().verify_sync(
-                input_text=payload.get("input", job.input_text),
-                pack=payload.get("pack", job.pack),
-                options=options,
-                evidence=payload.get("evidence"),
-            )
-        )
-        normalized = normalize_verification_result(result)
-        proof_store.create(session, payload=normalized)
-        job_store.set_done(session, job, proof_id=result.proof_id)
-        if job.request_id:
-            record = idempotency_store.get(session, job.request_id)
-            if record:
-                record.proof_id = result.proof_id
-                session.add(record)
-                session.commit()
-    except Exception as exc:  # pragma: no cover - safety net
-        job_store.set_failed(session, job, error=str(exc))
+        job = await job_store.get(db, job_id)
+        if not job:
+            return
+        request_id = job.request_id
+        if status_buffer is not None:
+            status_buffer.mark_running(job_id)
+        else:
+            await job_store.mark_running(db, [job_id])
+        publish(job_id, "running", {})
+        try:
+            options_payload = payload.get("options") if payload else None
+            options = None
+            if isinstance(options_payload, dict):
+                options = VerifyOptions(
+                    max_iters=options_payload.get("max_iters"),
+                    threshold=options_payload.get("threshold"),
+                    min_mutations=options_payload.get("min_mutations"),
+                    num_candidates=options_payload.get("num_candidates"),
+                )
+            with event_sink(lambda kind, data: publish(job_id, kind, data)):
+                result = await _verifier_service().verify_sync(
+                    input_text=payload.get("input", job.input_text),
+                    pack=payload.get("pack", job.pack),
+                    options=options,
+                    evidence=payload.get("evidence"),
+                )
+            normalized = normalize_verification_result(result)
+            if status_buffer is not None:
+                status_buffer.discard(job_id)
+            await job_store.complete(db, job_id, ProofWrite(payload=normalized), request_id)
+            publish(job_id, "done", {"proof_id": result.proof_id, "status": result.status})
+        except Exception as exc:  # pragma: no cover - safety net
+            if status_buffer is not None:
+                status_buffer.discard(job_id)
+            await db.run(_mark_failed, job_id, str(exc))
+            publish(job_id, "failed", {"error": str(exc)})
     finally:
-        session.close()
+        await db.close()
+
+
+def _mark_failed(session: Session, job_id: str, error: str) -> None:
+    # The failure may have interrupted a write; start from a clean transaction.
+    session.rollback()
+    store = JobStore()
+    job = store.get(session, job_id)
+    if job is not None:
+        store.set_failed(session, job, error=error)
+
+
+def _mark_abandoned(session: Session, job_id: str) -> None:
+    # Only rows the lost worker left in flight; a job that completed before the crash stays done.
+    store = JobStore()
+    job = store.get(session, job_id)
+    if job is not None and job.status in ("queued", "running"):
+        store.set_failed(session, job, error="Worker stopped before the job finished")
@@ -1,15 +1,38 @@
 from __future__ import annotations
 
+import asyncio
+import os
+
 from redis import Redis
 from rq import Queue, Worker
+from trustai_api.queue.rq import LaneQueue, QueueLayout
 from trustai_api.settings import get_settings
 
+from trustai_worker.async_worker import serve
+
+
+class LaneWorker(Worker):
+    """RQ worker that re-derives its queue order from the lane layout after each job."""
+
+    def __init__(self, lane_queue: LaneQueue, **kwargs) -> None:
+        super().__init__(lane_queue.all_queues(), connection=lane_queue.connection, **kwargs)
+        self._lane_queue = lane_queue
+
+    def reorder_queues(self, reference_queue: Queue) -> None:
+        self._ordered_queues = self._lane_queue.ordered_queues()
+
 
 def run_worker() -> None:
     settings = get_settings()
     connection = Redis.from_url(settings.redis_url)
-    queue = Queue("trustai", connection=connection)
-    worker = Worker([queue], connection=connection)
+    lane_queue = LaneQueue(connection, QueueLayout.from_settings(settings))
+    mode = os.getenv("TRUSTAI_WORKER_MODE", "rq").strip().lower()
+    if mode == "async":
+        concurrency = int(os.getenv("TRUSTAI_WORKER_CONCURRENCY", "8"))
+        status_flush_s = int(os.getenv("TRUSTAI_WORKER_STATUS_FLUSH_MS", "250")) / 1000
+        asyncio.run(serve(lane_queue, concurrency, status_flush_s))
+        return
+    worker = LaneWorker(lane_queue)
     worker.work()
 
 
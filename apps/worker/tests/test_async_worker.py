@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from rq.job import Job, JobStatus
+from trustai_api.queue.rq import VERIFY_FUNC, LaneQueue
+from trustai_worker import tasks
+from trustai_worker.async_worker import AsyncVerifyWorker
+
+
+class FakeRQJob:
+    def __init__(self, job_id: str, func_name: str = VERIFY_FUNC) -> None:
+        self.func_name = func_name
+        self.args = (job_id, {"input": "Hello", "pack": "general"})
+        self.kwargs: dict[str, Any] = {}
+        self.statuses: list[str] = []
+
+    def set_status(self, status: str) -> None:
+        self.statuses.append(status)
+
+
+def _worker(jobs: list[FakeRQJob], concurrency: int) -> AsyncVerifyWorker:
+    worker = AsyncVerifyWorker(queue=None, concurrency=concurrency)  # type: ignore[arg-type]
+    pending = list(jobs)
+    worker._dequeue = lambda timeout: pending.pop(0) if pending else None  # type: ignore[method-assign]
+    worker._reap_abandoned = lambda: []  # type: ignore[method-assign]
+    worker._start = lambda job: job.set_status(JobStatus.STARTED)  # type: ignore[method-assign]
+    worker._finish = lambda job, execution: job.set_status(JobStatus.FINISHED)  # type: ignore[method-assign]
+    worker._fail = lambda job, execution, exc: job.set_status(JobStatus.FAILED)  # type: ignore[method-assign]
+    return worker
+
+
+def test_async_worker_runs_jobs_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def fake_run(
+        job_id: str, payload: dict[str, Any], status_buffer=None, publish=None
+    ) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if job_id == "job-bad":
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(tasks, "run_deep_verify_async", fake_run)
+    jobs = [FakeRQJob(f"job-{index}") for index in range(6)] + [FakeRQJob("job-bad")]
+    worker = _worker(jobs, concurrency=3)
+
+    asyncio.run(worker.run(burst=True))
+
+    assert peak == 3
+    assert worker.completed == 6
+    assert worker.failed == 1
+    assert jobs[0].statuses == [JobStatus.STARTED, JobStatus.FINISHED]
+    assert jobs[-1].statuses == [JobStatus.STARTED, JobStatus.FAILED]
+
+
+def test_async_worker_rejects_unknown_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_run(
+        job_id: str, payload: dict[str, Any], status_buffer=None, publish=None
+    ) -> None:
+        raise AssertionError("should not run")
+
+    monkeypatch.setattr(tasks, "run_deep_verify_async", fake_run)
+    job = FakeRQJob("job-1", func_name="other.module.task")
+    worker = _worker([job], concurrency=2)
+
+    asyncio.run(worker.run(burst=True))
+
+    assert job.statuses == [JobStatus.FAILED]
+    assert worker.failed == 1
+
+
+def test_async_worker_idle_poll_does_not_raise() -> None:
+    connection = MagicMock()
+    connection.blpop.return_value = None
+    connection.lpop.return_value = None
+    worker = AsyncVerifyWorker(LaneQueue(connection), concurrency=1, poll_timeout_s=1)
+
+    assert worker._dequeue(1) is None
+
+    async def _run_briefly() -> None:
+        asyncio.get_running_loop().call_later(0.05, worker.stop)
+        await worker.run()
+
+    asyncio.run(_run_briefly())
+    assert connection.blpop.called
+    assert worker.completed == 0 and worker.failed == 0
+
+
+def test_async_worker_tracks_jobs_in_rq_registries() -> None:
+    connection = MagicMock()
+    pipeline = connection.pipeline.return_value.__enter__.return_value
+    rq_job = Job.create(
+        VERIFY_FUNC, args=("job-1", {}), connection=connection, origin="trustai-interactive-0"
+    )
+    worker = AsyncVerifyWorker(LaneQueue(connection), heartbeat_interval_s=30)
+
+    execution = worker._start(rq_job)
+    started_key = execution.composite_key
+    assert any(
+        call.args[0] == "rq:wip:trustai-interactive-0" and started_key in call.args[1]
+        for call in pipeline.zadd.call_args_list
+    )
+
+    pipeline.reset_mock()
+    worker._heartbeat(rq_job, execution)
+    assert pipeline.zadd.call_args_list[0].args[0] == "rq:wip:trustai-interactive-0"
+    assert pipeline.expire.call_args_list[0].args[1] == 90
+
+    pipeline.reset_mock()
+    worker._finish(rq_job, execution)
+    pipeline.zrem.assert_any_call("rq:wip:trustai-interactive-0", started_key)
+    assert any(
+        call.args[0] == "rq:finished:trustai-interactive-0" for call in pipeline.zadd.call_args_list
+    )
+
+    pipeline.reset_mock()
+    worker._fail(rq_job, execution, "boom")
+    pipeline.zrem.assert_any_call("rq:wip:trustai-interactive-0", started_key)
+    assert any(
+        call.args[0] == "rq:failed:trustai-interactive-0" for call in pipeline.zadd.call_args_list
+    )
+
+
+def test_async_worker_heartbeats_running_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_run(
+        job_id: str, payload: dict[str, Any], status_buffer=None, publish=None
+    ) -> None:
+        await asyncio.sleep(0.05)
+
+    monkeypatch.setattr(tasks, "run_deep_verify_async", fake_run)
+    job = FakeRQJob("job-1")
+    worker = _worker([job], concurrency=1)
+    worker._heartbeat_interval_s = 0.01
+    beats: list[Any] = []
+    worker._heartbeat = lambda rq_job, execution: beats.append(rq_job)  # type: ignore[method-assign]
+
+    asyncio.run(worker.run(burst=True))
+
+    assert beats and all(beat is job for beat in beats)
+    assert job.statuses == [JobStatus.STARTED, JobStatus.FINISHED]
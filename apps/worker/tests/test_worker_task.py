@@ -3,8 +3,9 @@ from __future__ import annotations
 import os
 
 import pytest
+from sqlalchemy.orm import Session
 from trustai_api.routes.utils import normalize_verification_result
-from trustai_api.services.job_store import JobStore
+from trustai_api.services.job_store import JobStatusBuffer, JobStore
 from trustai_api.services.proof_store import ProofStore
 from trustai_api.settings import get_settings
 from trustai_core.schemas.proof import IterationTrace, MismatchReport, VerificationResult
@@ -99,3 +100,112 @@ def test_worker_runs_job(monkeypatch: pytest.MonkeyPatch) -> None:
     normalized = normalize_verification_result(_build_result())
     assert stored_proof.proof_id == normalized["proof_id"]
     session.close()
+
+
+def test_worker_publishes_progress_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    from trustai_api.services.job_events import InMemoryJobEventBus
+    from trustai_core.utils.events import emit_event
+
+    class EmittingVerifier(FakeVerifier):
+        async def verify_sync(self, input_text, pack, options=None, evidence=None):
+            emit_event("iteration", i=1, score=0.95, accepted=True)
+            return await super().verify_sync(input_text, pack, options, evidence)
+
+    bus = InMemoryJobEventBus()
+    session = tasks._get_session()
+    JobStore().create(session, job_id="job-events", pack="general", input_text="Hello")
+    session.close()
+    monkeypatch.setattr(tasks, "_verifier_service", lambda: EmittingVerifier())
+    monkeypatch.setattr(tasks, "_event_bus", lambda: bus)
+
+    tasks.run_deep_verify("job-events", {"input": "Hello", "pack": "general"})
+
+    events = bus._since("job-events", None)
+    assert [event.kind for event in events] == ["running", "iteration", "done"]
+    assert events[1].data == {"i": 1, "score": 0.95, "accepted": True}
+    assert events[2].data["proof_id"] == _build_result().proof_id
+
+
+def test_worker_completion_is_one_transaction(monkeypatch: pytest.MonkeyPatch) -> None:
+    from trustai_api.services.idempotency import IdempotencyStore
+
+    session = tasks._get_session()
+    JobStore().create(
+        session, job_id="job-tx", pack="general", input_text="Hello", request_id="req-tx"
+    )
+    IdempotencyStore().create(session, request_id="req-tx", mode="async", pack="general")
+    session.close()
+    monkeypatch.setattr(tasks, "_verifier_service", lambda: FakeVerifier())
+
+    commits = 0
+    original_commit = Session.commit
+
+    def counting_commit(self: Session) -> None:
+        nonlocal commits
+        commits += 1
+        original_commit(self)
+
+    monkeypatch.setattr(Session, "commit", counting_commit)
+    tasks.run_deep_verify("job-tx", {"input": "Hello", "pack": "general"})
+    monkeypatch.setattr(Session, "commit", original_commit)
+
+    # One commit for the running transition, one for proof + job + idempotency key.
+    assert commits == 2
+    session = tasks._get_session()
+    job = JobStore().get(session, "job-tx")
+    assert job is not None and job.status == "done"
+    assert ProofStore().get(session, job.proof_id) is not None
+    record = IdempotencyStore().get(session, "req-tx")
+    assert record is not None and record.proof_id == job.proof_id
+    session.close()
+
+
+def test_status_buffer_coalesces_running_updates() -> None:
+    session = tasks._get_session()
+    store = JobStore()
+    for job_id in ("job-a", "job-b", "job-c"):
+        store.create(session, job_id=job_id, pack="general", input_text="Hello")
+    buffer = JobStatusBuffer(store)
+    for job_id in ("job-a", "job-b", "job-c", "job-a"):
+        buffer.mark_running(job_id)
+    assert buffer.discard("job-c")
+
+    assert buffer.flush(session) == 2
+    assert len(buffer) == 0
+    session.expire_all()
+    assert [store.get(session, job_id).status for job_id in ("job-a", "job-b", "job-c")] == [
+        "running",
+        "running",
+        "queued",
+    ]
+    session.close()
+
+
+def test_async_worker_fails_rows_of_abandoned_jobs() -> None:
+    import asyncio
+
+    from trustai_worker.async_worker import AsyncVerifyWorker
+
+    session = tasks._get_session()
+    store = JobStore()
+    for job_id in ("job-lost", "job-finished"):
+        store.create(session, job_id=job_id, pack="general", input_text="Hello")
+    store.set_running(session, store.get(session, "job-lost"))
+    store.set_done(session, store.get(session, "job-finished"), proof_id="proof-1")
+    session.close()
+    worker = AsyncVerifyWorker(queue=None, maintenance_interval_s=60)  # type: ignore[arg-type]
+    worker._reap_abandoned = lambda: ["job-lost", "job-finished", "missing"]  # type: ignore[method-assign]
+
+    async def _maintain_once() -> None:
+        task = asyncio.create_task(worker._maintain())
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(_maintain_once())
+
+    session = tasks._get_session()
+    lost = store.get(session, "job-lost")
+    assert lost is not None and lost.status == "failed"
+    assert store.get(session, "job-finished").status == "done"
+    session.close()
@@ -11,8 +11,10 @@ import orjson
 
 from trustai_core.benchmarks.models import BenchmarkCase, BenchmarkRunResult, CaseResult, RunSummary
 from trustai_core.benchmarks.scoring import score_case
-from trustai_core.llm.anthropic_client import AnthropicClient
-from trustai_core.llm.openai_client import OpenAIClient
+from trustai_core.llm.base import LLMClient
+from trustai_core.llm.batch import get_batch_llm_client
+from trustai_core.llm.cache import with_llm_cache
+from trustai_core.llm.pool import get_llm_client_pool
 from trustai_core.packs.registry import PackContext, get_pack_runner
 
 FixtureResolver = Callable[[BenchmarkCase], Path | None]
@@ -83,18 +85,27 @@ async def _run_case(
         os.environ["TRUSTAI_LLM_MODE"] = "live"
         os.environ.pop("TRUSTAI_TARIFF_FIXTURE", None)
 
+    openai_model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
+    claude_model = os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-latest")
+
+    def _openai_client() -> LLMClient:
+        if mode == "batch":
+            return with_llm_cache(get_batch_llm_client("openai", openai_model))
+        return with_llm_cache(get_llm_client_pool().openai(model=openai_model))
+
+    def _anthropic_client() -> LLMClient:
+        if mode == "batch":
+            return with_llm_cache(get_batch_llm_client("anthropic", claude_model))
+        return with_llm_cache(get_llm_client_pool().anthropic(model=claude_model))
+
     pack_runner = get_pack_runner(
         case.pack_id,
         PackContext(
-            llm_mode=mode,
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-4.1-mini"),
-            claude_model=os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-latest"),
-            openai_client_factory=lambda: OpenAIClient(
-                model=os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
-            ),
-            anthropic_client_factory=lambda: AnthropicClient(
-                model=os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-latest")
-            ),
+            llm_mode="fixture" if mode == "fixture" else "live",
+            openai_model=openai_model,
+            claude_model=claude_model,
+            openai_client_factory=_openai_client,
+            anthropic_client_factory=_anthropic_client,
         ),
     )
     if not pack_runner:
@@ -117,6 +128,15 @@ async def _run_case(
     return CaseResult(case=case, score=case_score, output_summary=summary)
 
 
+async def _run_cases_concurrently(
+    cases: list[BenchmarkCase],
+    mode: str,
+    fixture_resolver: FixtureResolver,
+    executor: Callable[[BenchmarkCase, str, FixtureResolver], Any],
+) -> list[CaseResult]:
+    return list(await asyncio.gather(*(executor(case, mode, fixture_resolver) for case in cases)))
+
+
 def _summarize_results(results: Iterable[CaseResult]) -> RunSummary:
     results_list = list(results)
     total = len(results_list)
@@ -140,16 +160,19 @@ def run_benchmark_suite(
     fixture_resolver: FixtureResolver | None = None,
     executor: Callable[[BenchmarkCase, str, FixtureResolver], Any] | None = None,
 ) -> BenchmarkRunResult:
-    if mode not in {"fixture", "live"}:
-        raise ValueError("Mode must be fixture or live.")
+    if mode not in {"fixture", "live", "batch"}:
+        raise ValueError("Mode must be fixture, live or batch.")
     cases = _load_cases_from_path(path)
     fixture_resolver = fixture_resolver or _default_fixture_resolver
     executor = executor or _run_case
     started_at = _timestamp()
     results: list[CaseResult] = []
-    for case in cases:
-        result = asyncio.run(executor(case, mode, fixture_resolver))
-        results.append(result)
+    if mode == "batch":
+        results = asyncio.run(_run_cases_concurrently(cases, mode, fixture_resolver, executor))
+    else:
+        for case in cases:
+            result = asyncio.run(executor(case, mode, fixture_resolver))
+            results.append(result)
     completed_at = _timestamp()
     summary = _summarize_results(results)
     return BenchmarkRunResult(
@@ -1,7 +1,15 @@
 from trustai_core.duty.base import DutyCalculator
-from trustai_core.duty.layers import DutyLayerRule
+from trustai_core.duty.layers import DutyLayerRule, DutyLayerSnapshotCache
 from trustai_core.duty.models import AppliedDutyLayer, DutyBreakdown, DutyFlow, DutyLineRate
 from trustai_core.duty.programs import ProgramResult, ProgramRule
+from trustai_core.duty.scenarios import (
+    DutyScenario,
+    DutyScenarioResult,
+    DutySweepResult,
+    build_scenario_grid,
+    calculate_scenario,
+    sweep_duty_scenarios,
+)
 
 __all__ = [
     "AppliedDutyLayer",
@@ -9,7 +17,14 @@ __all__ = [
     "DutyCalculator",
     "DutyFlow",
     "DutyLayerRule",
+    "DutyLayerSnapshotCache",
     "DutyLineRate",
+    "DutyScenario",
+    "DutyScenarioResult",
+    "DutySweepResult",
     "ProgramResult",
     "ProgramRule",
+    "build_scenario_grid",
+    "calculate_scenario",
+    "sweep_duty_scenarios",
 ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from datetime import date
 from pathlib import Path
 
@@ -67,12 +69,106 @@ def evaluate_layer_rules(
     return applied
 
 
+class DutyLayerSnapshot:
+    __slots__ = ("effective_date", "_by_origin")
+
+    def __init__(self, rules: list[DutyLayerRule], effective_date: date) -> None:
+        self.effective_date = effective_date
+        by_origin: dict[str, list[tuple[tuple[str, ...], AppliedDutyLayer]]] = {}
+        for rule in rules:
+            if not _date_in_range(effective_date, rule.effective_from, rule.effective_to):
+                continue
+            prefixes = tuple(_normalize_code(prefix) for prefix in rule.match.line_prefixes)
+            layer = AppliedDutyLayer(
+                layer_id=rule.layer_id,
+                pct=float(rule.pct),
+                reason=rule.reason,
+                effective_from=rule.effective_from,
+                effective_to=rule.effective_to,
+            )
+            for origin in rule.match.origin_countries:
+                by_origin.setdefault(origin, []).append((prefixes, layer))
+        self._by_origin = by_origin
+
+    def evaluate(self, origin_country: str | None, line_id: str | None) -> list[AppliedDutyLayer]:
+        if not origin_country or not line_id:
+            return []
+        entries = self._by_origin.get(origin_country)
+        if not entries:
+            return []
+        normalized_line = _normalize_code(line_id)
+        return [layer for prefixes, layer in entries if normalized_line.startswith(prefixes)]
+
+
+class DutyLayerSnapshotCache:
+    def __init__(self, path: Path, max_dates: int = 32) -> None:
+        self._path = path
+        self._max_dates = max(1, max_dates)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._signature: tuple[int, int] | None = None
+        self._rules: list[DutyLayerRule] = []
+        self._snapshots: OrderedDict[date, DutyLayerSnapshot] = OrderedDict()
+
+    def snapshot(self, effective_date: date) -> DutyLayerSnapshot:
+        with self._lock:
+            self._refresh_locked()
+            snapshot = self._snapshots.get(effective_date)
+            if snapshot is not None:
+                self._snapshots.move_to_end(effective_date)
+                return snapshot
+            snapshot = DutyLayerSnapshot(self._rules, effective_date)
+            self._snapshots[effective_date] = snapshot
+            while len(self._snapshots) > self._max_dates:
+                self._snapshots.popitem(last=False)
+            return snapshot
+
+    def evaluate(
+        self,
+        origin_country: str | None,
+        line_id: str | None,
+        effective_date: date,
+    ) -> list[AppliedDutyLayer]:
+        return self.snapshot(effective_date).evaluate(origin_country, line_id)
+
+    def _refresh_locked(self) -> None:
+        signature = _file_signature(self._path)
+        if self._loaded and signature == self._signature:
+            return
+        self._rules = load_layer_rules(self._path)
+        self._snapshots.clear()
+        self._signature = signature
+        self._loaded = True
+
+
+_SNAPSHOT_CACHES: dict[Path, DutyLayerSnapshotCache] = {}
+_SNAPSHOT_CACHES_LOCK = threading.Lock()
+
+
+def get_layer_snapshot_cache(path: Path, max_dates: int = 32) -> DutyLayerSnapshotCache:
+    key = path.resolve()
+    with _SNAPSHOT_CACHES_LOCK:
+        cache = _SNAPSHOT_CACHES.get(key)
+        if cache is None:
+            cache = DutyLayerSnapshotCache(key, max_dates=max_dates)
+            _SNAPSHOT_CACHES[key] = cache
+        return cache
+
+
 def parse_effective_date(value: str | None, *, fallback: date) -> date:
     if not value:
         return fallback
     return date.fromisoformat(value)
 
 
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def _matches_prefix(line_id: str, prefixes: list[str]) -> bool:
     for prefix in prefixes:
         if line_id.startswith(_normalize_code(prefix)):
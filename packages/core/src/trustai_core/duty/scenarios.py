@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from itertools import product
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from trustai_core.duty.base import DutyCalculator
+from trustai_core.duty.models import DutyBreakdown, DutyFlow
+
+
+class DutyScenario(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    line_id: str
+    origin_country: str | None = None
+    preference_program: str | None = None
+    effective_date: str | None = None
+
+    def sort_key(self) -> tuple[str, str, str, str]:
+        return (
+            self.line_id,
+            self.origin_country or "",
+            self.preference_program or "",
+            self.effective_date or "",
+        )
+
+
+class DutyScenarioResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    scenario: DutyScenario
+    total_rate_pct: float
+    delta_pct: float | None = None
+    breakdown: DutyBreakdown
+
+
+class DutySweepResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    baseline: DutyScenarioResult | None = None
+    results: list[DutyScenarioResult] = Field(default_factory=list)
+    requested: int = 0
+    evaluated: int = 0
+    unresolved_lines: list[str] = Field(default_factory=list)
+
+    def best(self) -> DutyScenarioResult | None:
+        if not self.results:
+            return None
+        return self.results[0]
+
+    def best_savings_pct(self) -> float | None:
+        best = self.best()
+        if best is None or best.delta_pct is None:
+            return None
+        return round(max(0.0, -best.delta_pct), 4)
+
+
+def build_scenario_grid(
+    line_ids: Iterable[str],
+    origins: Iterable[str | None] | None = None,
+    programs: Iterable[str | None] | None = None,
+    effective_dates: Iterable[str | None] | None = None,
+) -> list[DutyScenario]:
+    lines = _unique(line.strip() for line in line_ids if line and line.strip())
+    origin_values = _unique(origins or [None])
+    program_values = _unique(programs or [None])
+    date_values = _unique(effective_dates or [None])
+    return [
+        DutyScenario(
+            line_id=line_id,
+            origin_country=origin,
+            preference_program=program,
+            effective_date=effective_date,
+        )
+        for line_id, origin, program, effective_date in product(
+            lines,
+            origin_values,
+            program_values,
+            date_values,
+        )
+    ]
+
+
+def sweep_duty_scenarios(
+    calculator: DutyCalculator,
+    flow: DutyFlow,
+    scenarios: Iterable[DutyScenario],
+    baseline: DutyScenario | None = None,
+) -> DutySweepResult:
+    requested = list(scenarios)
+    has_line = getattr(calculator, "has_line", None)
+    unresolved = sorted(
+        {
+            scenario.line_id
+            for scenario in requested
+            if has_line is not None and not has_line(scenario.line_id)
+        }
+    )
+    resolved = [scenario for scenario in requested if scenario.line_id not in unresolved]
+    if baseline and has_line is not None and not has_line(baseline.line_id):
+        baseline = None
+    matrix: dict[DutyScenario, DutyBreakdown] = {}
+    for scenario in [baseline, *resolved] if baseline else resolved:
+        if scenario not in matrix:
+            matrix[scenario] = calculate_scenario(calculator, flow, scenario)
+
+    baseline_result = None
+    baseline_total = None
+    if baseline:
+        baseline_breakdown = matrix[baseline]
+        baseline_total = baseline_breakdown.total_rate_pct
+        baseline_result = DutyScenarioResult(
+            scenario=baseline,
+            total_rate_pct=baseline_total,
+            delta_pct=0.0,
+            breakdown=baseline_breakdown,
+        )
+
+    results: list[DutyScenarioResult] = []
+    for scenario in _unique(resolved):
+        breakdown = matrix[scenario]
+        delta = None
+        if baseline_total is not None:
+            delta = round(breakdown.total_rate_pct - baseline_total, 4)
+        results.append(
+            DutyScenarioResult(
+                scenario=scenario,
+                total_rate_pct=breakdown.total_rate_pct,
+                delta_pct=delta,
+                breakdown=breakdown,
+            )
+        )
+    ranked = sorted(
+        results,
+        key=lambda item: (item.total_rate_pct, item.scenario.sort_key()),
+    )
+    return DutySweepResult(
+        baseline=baseline_result,
+        results=ranked,
+        requested=len(requested),
+        evaluated=len(matrix),
+        unresolved_lines=unresolved,
+    )
+
+
+def calculate_scenario(
+    calculator: DutyCalculator,
+    flow: DutyFlow,
+    scenario: DutyScenario,
+) -> DutyBreakdown:
+    return calculator.calculate(
+        scenario.line_id,
+        _scenario_flow(flow, scenario),
+        scenario.preference_program,
+    )
+
+
+def _scenario_flow(flow: DutyFlow, scenario: DutyScenario) -> DutyFlow:
+    return flow.model_copy(
+        update={
+            "origin_country": scenario.origin_country or flow.origin_country,
+            "preference_program": scenario.preference_program,
+            "effective_date": scenario.effective_date or flow.effective_date,
+        }
+    )
+
+
+def _unique(values: Iterable[object]) -> list:
+    seen: set[object] = set()
+    unique: list[object] = []
+    for value in values:
+        if value in seen:
+            continue
+        seen.add(value)
+        unique.append(value)
+    return unique
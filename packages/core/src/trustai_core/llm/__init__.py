@@ -1,14 +1,26 @@
 from trustai_core.llm.anthropic_client import AnthropicClient
 from trustai_core.llm.base import LLMClient, LLMError, RateLimitError, TimeoutError
+from trustai_core.llm.cache import CachedLLMClient, LLMResponseCache
 from trustai_core.llm.openai_client import OpenAIClient
-from trustai_core.llm.retry import RetryPolicy
+from trustai_core.llm.pool import LLMClientPool, PoolConfig, get_llm_client_pool
+from trustai_core.llm.retry import RetryPolicy, SingleFlight, SingleFlightLLMClient
+from trustai_core.llm.streaming import JSONObjectStreamValidator, StreamValidationError
 
 __all__ = [
     "AnthropicClient",
+    "CachedLLMClient",
+    "JSONObjectStreamValidator",
     "LLMClient",
+    "LLMClientPool",
     "LLMError",
+    "LLMResponseCache",
     "OpenAIClient",
+    "PoolConfig",
     "RateLimitError",
     "RetryPolicy",
+    "SingleFlight",
+    "SingleFlightLLMClient",
+    "StreamValidationError",
     "TimeoutError",
+    "get_llm_client_pool",
 ]
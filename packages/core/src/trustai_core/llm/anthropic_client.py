@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 
 from anthropic import (
     APIConnectionError as AnthropicConnectionError,
@@ -19,7 +20,11 @@ from anthropic import (
 )
 
 from trustai_core.llm.base import LLMClient, LLMError, RateLimitError, TimeoutError
+from trustai_core.llm.hedging import get_hedger
+from trustai_core.llm.prompt import prompt_parts
+from trustai_core.llm.ratelimit import estimate_tokens, get_rate_limiter, parse_retry_after
 from trustai_core.llm.retry import RetryPolicy, build_idempotency_key, run_with_retry
+from trustai_core.llm.streaming import JSONObjectStreamValidator, close_stream
 
 DEFAULT_CLAUDE_MODELS = [
     "claude-3-5-sonnet-20241022",
@@ -36,6 +41,10 @@ _LEGACY_MODEL_MAP = {
     "sonnet": DEFAULT_CLAUDE_MODELS[0],
     "haiku": DEFAULT_CLAUDE_MODELS[1],
 }
+# Shared by the request calls and cache_identity so cached responses track the real params.
+_MAX_TOKENS = 512
+_TEMPERATURE = 0.2
+_SYSTEM_PROMPT = "Return text only."
 
 
 class ModelNotFoundError(LLMError):
@@ -67,6 +76,18 @@ def _dedupe(models: list[str]) -> list[str]:
     return unique
 
 
+def _user_content(prompt: str) -> str | list[dict[str, Any]]:
+    prefix, suffix = prompt_parts(prompt)
+    if not prefix or os.getenv("TRUSTAI_ANTHROPIC_PROMPT_CACHE", "1") != "1":
+        return str(prompt)
+    blocks: list[dict[str, Any]] = [
+        {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}
+    ]
+    if suffix:
+        blocks.append({"type": "text", "text": suffix})
+    return blocks
+
+
 class AnthropicClient(LLMClient):
     def __init__(
         self,
@@ -74,11 +95,15 @@ class AnthropicClient(LLMClient):
         model: str = DEFAULT_CLAUDE_MODEL,
         timeout_s: float = 30.0,
         retry_policy: RetryPolicy | None = None,
+        http_client: Any | None = None,
     ) -> None:
         resolved_key = api_key or os.getenv("CLAUDE_AI_KEY") or os.getenv("ANTHROPIC_API_KEY")
         if not resolved_key:
             raise LLMError("Anthropic API key is missing")
-        self._client = AsyncAnthropic(api_key=resolved_key, timeout=timeout_s)
+        client_kwargs: dict[str, Any] = {"api_key": resolved_key, "timeout": timeout_s}
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+        self._client = AsyncAnthropic(**client_kwargs)
         preferred_model = (
             os.getenv("TRUSTAI_ANTHROPIC_MODEL")
             or os.getenv("CLAUDE_MODEL")
@@ -97,6 +122,7 @@ class AnthropicClient(LLMClient):
         candidates.extend(DEFAULT_CLAUDE_MODELS)
         self._models = _dedupe(candidates)
         self._retry_policy = retry_policy or RetryPolicy()
+        self._hedger = get_hedger("anthropic")
 
     @property
     def model_id(self) -> str:
@@ -104,23 +130,36 @@ class AnthropicClient(LLMClient):
             return ""
         return self._models[0]
 
+    def cache_identity(self, method: str) -> dict[str, object]:
+        return {
+            "provider": "anthropic",
+            "models": list(self._models),
+            "max_tokens": _MAX_TOKENS,
+            "temperature": _TEMPERATURE,
+            "system": _SYSTEM_PROMPT,
+        }
+
     async def complete_json(self, prompt: str, schema: dict) -> dict:
         raise LLMError("Anthropic client does not support structured JSON responses")
 
     async def _call_model(self, prompt: str, model: str) -> str:
+        limiter = get_rate_limiter("anthropic", model)
         try:
-            response = await self._client.messages.create(
-                model=model,
-                max_tokens=512,
-                temperature=0.2,
-                system="Return text only.",
-                messages=[{"role": "user", "content": prompt}],
-                extra_headers={"Idempotency-Key": build_idempotency_key("anthropic")},
-            )
+            async with limiter.limit(estimate_tokens(prompt, _MAX_TOKENS)):
+                response = await self._client.messages.create(
+                    model=model,
+                    max_tokens=_MAX_TOKENS,
+                    temperature=_TEMPERATURE,
+                    system=_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": _user_content(prompt)}],
+                    extra_headers={"Idempotency-Key": build_idempotency_key("anthropic")},
+                )
         except AnthropicNotFoundError as exc:
             raise ModelNotFoundError(str(exc)) from exc
         except AnthropicRateLimitError as exc:
-            raise RateLimitError(str(exc)) from exc
+            retry_after = parse_retry_after(exc)
+            limiter.penalize(retry_after)
+            raise RateLimitError(str(exc), retry_after=retry_after) from exc
         except AnthropicTimeoutError as exc:
             raise TimeoutError(str(exc)) from exc
         except AnthropicConnectionError as exc:
@@ -133,16 +172,79 @@ class AnthropicClient(LLMClient):
             return ""
         return "".join(block.text for block in content_blocks if hasattr(block, "text"))
 
+    async def _stream_model(self, prompt: str, model: str, schema: dict | None) -> str:
+        validator = JSONObjectStreamValidator.from_schema(schema, allow_preamble=True)
+        limiter = get_rate_limiter("anthropic", model)
+        try:
+            async with limiter.limit(estimate_tokens(prompt, _MAX_TOKENS)):
+                stream = await self._client.messages.create(
+                    model=model,
+                    max_tokens=_MAX_TOKENS,
+                    temperature=_TEMPERATURE,
+                    system=_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": _user_content(prompt)}],
+                    stream=True,
+                    extra_headers={"Idempotency-Key": build_idempotency_key("anthropic")},
+                )
+                try:
+                    async for event in stream:
+                        if getattr(event, "type", None) != "content_block_delta":
+                            continue
+                        text = getattr(event.delta, "text", None)
+                        if text and validator.feed(text):
+                            break
+                finally:
+                    await close_stream(stream)
+        except LLMError:
+            raise
+        except AnthropicNotFoundError as exc:
+            raise ModelNotFoundError(str(exc)) from exc
+        except AnthropicRateLimitError as exc:
+            retry_after = parse_retry_after(exc)
+            limiter.penalize(retry_after)
+            raise RateLimitError(str(exc), retry_after=retry_after) from exc
+        except AnthropicTimeoutError as exc:
+            raise TimeoutError(str(exc)) from exc
+        except AnthropicConnectionError as exc:
+            raise LLMError(str(exc)) from exc
+        except Exception as exc:  # pragma: no cover - safety net
+            raise LLMError(str(exc)) from exc
+        validator.payload()
+        return validator.text()
+
     async def complete_text(self, prompt: str) -> str:
+        return await self._complete_across_models(lambda model: self._call_model(prompt, model))
+
+    async def complete_text_stream(self, prompt: str, schema: dict | None = None) -> str:
+        return await self._complete_across_models(
+            lambda model: self._stream_model(prompt, model, schema)
+        )
+
+    async def _complete_across_models(self, call) -> str:
         attempted: list[str] = []
+
+        async def _with_retry(model: str) -> str:
+            return await run_with_retry(
+                lambda: self._hedger.timed(model, call),
+                policy=self._retry_policy,
+            )
+
+        if self._hedger.config.enabled and len(self._models) > 1:
+            try:
+                return await self._hedger.run(
+                    self._models,
+                    _with_retry,
+                    fallback_on=(ModelNotFoundError,),
+                    attempted=attempted,
+                )
+            except ModelNotFoundError as exc:
+                raise LLMError(f"Anthropic model not found. Tried models: {attempted}") from exc
+
         last_error: LLMError | None = None
         for model in self._models:
             attempted.append(model)
             try:
-                return await run_with_retry(
-                    lambda: self._call_model(prompt, model),
-                    policy=self._retry_policy,
-                )
+                return await _with_retry(model)
             except ModelNotFoundError as exc:
                 last_error = exc
                 continue
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Protocol
 
+_DISTINCT_SAMPLES: ContextVar[bool] = ContextVar("trustai_distinct_samples", default=False)
+
 
 class LLMError(Exception):
     """Base error for LLM client failures."""
@@ -10,6 +15,10 @@ class LLMError(Exception):
 class RateLimitError(LLMError):
     """Raised when the provider rate limits requests."""
 
+    def __init__(self, message: str = "", retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
 class TimeoutError(LLMError):
     """Raised when the provider times out."""
@@ -21,3 +30,17 @@ class LLMClient(Protocol):
 
     async def complete_text(self, prompt: str) -> str:
         ...
+
+
+@contextmanager
+def distinct_samples(enabled: bool = True) -> Iterator[None]:
+    """Marks calls in this context as independent samples that must not be coalesced or cached."""
+    token = _DISTINCT_SAMPLES.set(enabled)
+    try:
+        yield
+    finally:
+        _DISTINCT_SAMPLES.reset(token)
+
+
+def wants_distinct_samples() -> bool:
+    return _DISTINCT_SAMPLES.get()
@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import orjson
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+from trustai_core.llm.base import LLMClient, LLMError
+
+OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    custom_id: str
+    body: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    custom_id: str
+    text: str | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchConfig:
+    max_batch_size: int = 1000
+    flush_interval_s: float = 2.0
+    poll_interval_s: float = 10.0
+    timeout_s: float = 86400.0
+
+    @classmethod
+    def from_env(cls) -> BatchConfig:
+        return cls(
+            max_batch_size=int(os.getenv("TRUSTAI_LLM_BATCH_MAX_SIZE", "1000")),
+            flush_interval_s=float(os.getenv("TRUSTAI_LLM_BATCH_FLUSH_S", "2.0")),
+            poll_interval_s=float(os.getenv("TRUSTAI_LLM_BATCH_POLL_S", "10.0")),
+            timeout_s=float(os.getenv("TRUSTAI_LLM_BATCH_TIMEOUT_S", "86400")),
+        )
+
+
+class BatchBackend(Protocol):
+    provider: str
+    model: str
+
+    def build_body(self, method: str, prompt: str) -> dict[str, Any]:
+        ...
+
+    def cache_identity(self, method: str) -> dict[str, object]:
+        ...
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        ...
+
+    async def poll(self, batch_id: str) -> dict[str, BatchResult] | None:
+        ...
+
+
+class OpenAIBatchBackend:
+    provider = "openai"
+
+    def __init__(self, client: Any, model: str, completion_window: str = "24h") -> None:
+        self._client = client
+        self.model = model
+        self._completion_window = completion_window
+
+    def build_body(self, method: str, prompt: str) -> dict[str, Any]:
+        if method == "complete_json":
+            return {
+                "model": self.model,
+                "temperature": 0,
+                "response_format": {"type": "json_object"},
+                "messages": [
+                    {"role": "system", "content": "Return JSON only."},
+                    {"role": "user", "content": prompt},
+                ],
+            }
+        return {
+            "model": self.model,
+            "temperature": 0.2,
+            "messages": [
+                {"role": "system", "content": "Return text only."},
+                {"role": "user", "content": prompt},
+            ],
+        }
+
+    def cache_identity(self, method: str) -> dict[str, object]:
+        body = self.build_body(method, "")
+        identity: dict[str, object] = {
+            "provider": "openai",
+            "model": self.model,
+            "temperature": body["temperature"],
+            "system": body["messages"][0]["content"],
+        }
+        if "response_format" in body:
+            identity["response_format"] = "json_object"
+        return identity
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        lines = b"\n".join(
+            orjson.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": OPENAI_BATCH_ENDPOINT,
+                    "body": request.body,
+                }
+            )
+            for request in requests
+        )
+        uploaded = await self._client.files.create(
+            file=("trustai_batch.jsonl", lines, "application/jsonl"),
+            purpose="batch",
+        )
+        batch = await self._client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=OPENAI_BATCH_ENDPOINT,
+            completion_window=self._completion_window,
+        )
+        return batch.id
+
+    async def poll(self, batch_id: str) -> dict[str, BatchResult] | None:
+        batch = await self._client.batches.retrieve(batch_id)
+        if batch.status in {"failed", "expired", "cancelled"}:
+            raise LLMError(f"OpenAI batch {batch_id} ended with status {batch.status}")
+        if batch.status != "completed":
+            return None
+        results: dict[str, BatchResult] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self._client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    result = _parse_openai_line(orjson.loads(line))
+                    results[result.custom_id] = result
+        return results
+
+
+class AnthropicBatchBackend:
+    provider = "anthropic"
+
+    def __init__(self, client: Any, model: str) -> None:
+        self._client = client
+        self.model = model
+
+    def build_body(self, method: str, prompt: str) -> dict[str, Any]:
+        if method == "complete_json":
+            raise LLMError("Anthropic client does not support structured JSON responses")
+        return {
+            "model": self.model,
+            "max_tokens": 512,
+            "temperature": 0.2,
+            "system": "Return text only.",
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def cache_identity(self, method: str) -> dict[str, object]:
+        return {
+            "provider": "anthropic",
+            "models": [self.model],
+            "max_tokens": 512,
+            "temperature": 0.2,
+            "system": "Return text only.",
+        }
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        batch = await self._client.messages.batches.create(
+            requests=[
+                {"custom_id": request.custom_id, "params": request.body} for request in requests
+            ]
+        )
+        return batch.id
+
+    async def poll(self, batch_id: str) -> dict[str, BatchResult] | None:
+        batch = await self._client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+        results: dict[str, BatchResult] = {}
+        async for entry in await self._client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                text = "".join(
+                    block.text for block in result.message.content or [] if hasattr(block, "text")
+                )
+                results[entry.custom_id] = BatchResult(entry.custom_id, text=text)
+            else:
+                results[entry.custom_id] = BatchResult(
+                    entry.custom_id, error=f"Anthropic batch request {result.type}"
+                )
+        return results
+
+
+class LocalBatchBackend:
+    """In-process stand-in for a provider batch API, used by tests and dry runs."""
+
+    def __init__(
+        self,
+        handler: Callable[[str, str], str],
+        model: str = "local-batch",
+        polls_until_ready: int = 1,
+    ) -> None:
+        self.provider = "local"
+        self.model = model
+        self._handler = handler
+        self._polls_until_ready = polls_until_ready
+        self._batches: dict[str, list[BatchRequest]] = {}
+        self._polls: dict[str, int] = {}
+        self.submitted: list[list[BatchRequest]] = []
+
+    def build_body(self, method: str, prompt: str) -> dict[str, Any]:
+        return {"method": method, "prompt": prompt}
+
+    def cache_identity(self, method: str) -> dict[str, object]:
+        return {"provider": self.provider, "model": self.model}
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        batch_id = f"batch-{len(self.submitted) + 1}"
+        self._batches[batch_id] = list(requests)
+        self._polls[batch_id] = 0
+        self.submitted.append(list(requests))
+        return batch_id
+
+    async def poll(self, batch_id: str) -> dict[str, BatchResult] | None:
+        self._polls[batch_id] += 1
+        if self._polls[batch_id] < self._polls_until_ready:
+            return None
+        results: dict[str, BatchResult] = {}
+        for request in self._batches.pop(batch_id):
+            try:
+                text = self._handler(request.body["method"], request.body["prompt"])
+            except Exception as exc:
+                results[request.custom_id] = BatchResult(request.custom_id, error=str(exc))
+            else:
+                results[request.custom_id] = BatchResult(request.custom_id, text=text)
+        return results
+
+
+class BatchLLMClient(LLMClient):
+    def __init__(self, backend: BatchBackend, config: BatchConfig | None = None) -> None:
+        self._backend = backend
+        self._config = config or BatchConfig.from_env()
+        self._ids = itertools.count(1)
+        self._queue: list[tuple[BatchRequest, asyncio.Future[str]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.batches_submitted = 0
+        self.requests_submitted = 0
+
+    @property
+    def model_id(self) -> str:
+        return self._backend.model
+
+    @property
+    def backend(self) -> BatchBackend:
+        return self._backend
+
+    def cache_identity(self, method: str) -> dict[str, object]:
+        return self._backend.cache_identity(method)
+
+    async def complete_json(self, prompt: str, schema: dict) -> dict:
+        content = await self._enqueue("complete_json", prompt)
+        try:
+            payload = orjson.loads(content or "{}")
+        except orjson.JSONDecodeError as exc:
+            raise LLMError(f"{self._backend.provider} batch returned invalid JSON") from exc
+        if not isinstance(payload, dict):
+            raise LLMError(f"{self._backend.provider} batch returned non-object JSON")
+        return payload
+
+    async def complete_text(self, prompt: str) -> str:
+        return await self._enqueue("complete_text", prompt)
+
+    async def flush(self) -> None:
+        self._cancel_timer()
+        pending, self._queue = self._queue, []
+        if pending:
+            await self._run_batch(pending)
+
+    async def _enqueue(self, method: str, prompt: str) -> str:
+        loop = asyncio.get_running_loop()
+        request = BatchRequest(
+            custom_id=f"req-{next(self._ids)}",
+            body=self._backend.build_body(method, prompt),
+        )
+        future: asyncio.Future[str] = loop.create_future()
+        self._queue.append((request, future))
+        if len(self._queue) >= self._config.max_batch_size:
+            self._spawn_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._config.flush_interval_s, self._spawn_flush)
+        return await future
+
+    def _spawn_flush(self) -> None:
+        self._cancel_timer()
+        pending, self._queue = self._queue, []
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _cancel_timer(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    async def _run_batch(self, pending: list[tuple[BatchRequest, asyncio.Future[str]]]) -> None:
+        try:
+            results = await self._submit_and_wait([request for request, _ in pending])
+        except Exception as exc:
+            error = exc if isinstance(exc, LLMError) else LLMError(str(exc))
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for request, future in pending:
+            if future.done():
+                continue
+            result = results.get(request.custom_id)
+            if result is None:
+                future.set_exception(LLMError(f"Batch result missing for {request.custom_id}"))
+            elif result.error is not None:
+                future.set_exception(LLMError(result.error))
+            else:
+                future.set_result(result.text or "")
+
+    async def _submit_and_wait(self, requests: list[BatchRequest]) -> dict[str, BatchResult]:
+        batch_id = await self._backend.submit(requests)
+        self.batches_submitted += 1
+        self.requests_submitted += len(requests)
+        deadline = time.monotonic() + self._config.timeout_s
+        while True:
+            results = await self._backend.poll(batch_id)
+            if results is not None:
+                return results
+            if time.monotonic() >= deadline:
+                raise LLMError(f"Batch {batch_id} did not complete in time")
+            await asyncio.sleep(self._config.poll_interval_s)
+
+
+_BATCH_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], BatchLLMClient]
+] = weakref.WeakKeyDictionary()
+_BATCH_CLIENTS_LOCK = threading.Lock()
+
+
+def get_batch_llm_client(provider: str, model: str) -> BatchLLMClient:
+    loop = asyncio.get_running_loop()
+    with _BATCH_CLIENTS_LOCK:
+        clients = _BATCH_CLIENTS.setdefault(loop, {})
+        client = clients.get((provider, model))
+        if client is None:
+            client = BatchLLMClient(_provider_backend(provider, model))
+            clients[(provider, model)] = client
+        return client
+
+
+def _provider_backend(provider: str, model: str) -> BatchBackend:
+    if provider == "openai":
+        api_key = os.getenv("OPEN_AI_KEY") or os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise LLMError("OpenAI API key is missing")
+        return OpenAIBatchBackend(AsyncOpenAI(api_key=api_key), model)
+    if provider == "anthropic":
+        api_key = os.getenv("CLAUDE_AI_KEY") or os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise LLMError("Anthropic API key is missing")
+        return AnthropicBatchBackend(AsyncAnthropic(api_key=api_key), model)
+    raise LLMError(f"Unsupported batch provider: {provider}")
+
+
+def _parse_openai_line(line: dict[str, Any]) -> BatchResult:
+    custom_id = str(line.get("custom_id"))
+    error = line.get("error")
+    if error:
+        message = error.get("message") if isinstance(error, dict) else str(error)
+        return BatchResult(custom_id, error=message or "OpenAI batch request failed")
+    response = line.get("response") or {}
+    if response.get("status_code") != 200:
+        return BatchResult(
+            custom_id, error=f"OpenAI batch request returned {response.get('status_code')}"
+        )
+    choices = (response.get("body") or {}).get("choices") or []
+    if not choices:
+        return BatchResult(custom_id, text="")
+    return BatchResult(custom_id, text=(choices[0].get("message") or {}).get("content") or "")
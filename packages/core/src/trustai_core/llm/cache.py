@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from trustai_core.llm.base import LLMClient, wants_distinct_samples
+from trustai_core.llm.streaming import complete_json_streaming, supports_streaming
+from trustai_core.utils.hashing import sha256_canonical_json
+
+DEFAULT_CACHE_TTL_S = 24 * 60 * 60
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_PATH = ".trustai_cache/llm_cache.sqlite"
+
+
+@dataclass
+class LLMCacheStats:
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    stores: int = 0
+    expired: int = 0
+    bypassed: int = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "stores": self.stores,
+            "expired": self.expired,
+            "bypassed": self.bypassed,
+        }
+
+
+@dataclass
+class LLMResponseCache:
+    ttl_s: float = DEFAULT_CACHE_TTL_S
+    max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
+    path: Path | None = None
+    stats: LLMCacheStats = field(default_factory=LLMCacheStats)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        found, value = self._get_memory(key)
+        if not found and self._db is not None:
+            found, value = self._get_disk(key)
+        if not found:
+            self._count_miss()
+        return found, value
+
+    async def aget(self, key: str) -> tuple[bool, Any]:
+        """Like :meth:`get`, but reads the SQLite tier in a worker thread."""
+        found, value = self._get_memory(key)
+        if not found and self._db is not None:
+            found, value = await asyncio.to_thread(self._get_disk, key)
+        if not found:
+            self._count_miss()
+        return found, value
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at, payload = self._set_memory(key, value)
+        if self._db is not None:
+            self._set_disk(key, expires_at, payload)
+
+    async def aset(self, key: str, value: Any) -> None:
+        """Like :meth:`set`, but writes and commits the SQLite tier in a worker thread."""
+        expires_at, payload = self._set_memory(key, value)
+        if self._db is not None:
+            await asyncio.to_thread(self._set_disk, key, expires_at, payload)
+
+    def _get_memory(self, key: str) -> tuple[bool, Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at > now:
+                self._memory.move_to_end(key)
+                self.stats.hits += 1
+                self.stats.memory_hits += 1
+                return True, orjson.loads(value)
+            del self._memory[key]
+            self.stats.expired += 1
+            return False, None
+
+    def _get_disk(self, key: str) -> tuple[bool, Any]:
+        assert self._db is not None
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT expires_at, value FROM llm_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return False, None
+            expires_at, value = row
+            if expires_at > now:
+                self._remember(key, expires_at, value)
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                return True, orjson.loads(value)
+            self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._db.commit()
+            self.stats.expired += 1
+            return False, None
+
+    def _set_memory(self, key: str, value: Any) -> tuple[float, bytes]:
+        expires_at = time.time() + self.ttl_s
+        payload = orjson.dumps(value)
+        with self._lock:
+            self._remember(key, expires_at, payload)
+            self.stats.stores += 1
+        return expires_at, payload
+
+    def _set_disk(self, key: str, expires_at: float, payload: bytes) -> None:
+        assert self._db is not None
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, expires_at, payload),
+            )
+            self._db.commit()
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self.stats.misses += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+
+    def _remember(self, key: str, expires_at: float, value: bytes) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > max(1, self.max_entries):
+            self._memory.popitem(last=False)
+
+
+def client_cache_identity(client: LLMClient, method: str) -> dict[str, object]:
+    identity = getattr(client, "cache_identity", None)
+    if identity is not None:
+        return dict(identity(method))
+    return {"provider": type(client).__name__, "model": getattr(client, "model_id", "")}
+
+
+def build_cache_key(
+    identity: dict[str, object],
+    method: str,
+    prompt: str,
+    schema: dict | None = None,
+) -> str:
+    return sha256_canonical_json(
+        {"identity": identity, "method": method, "prompt": prompt, "schema": schema}
+    )
+
+
+class CachedLLMClient(LLMClient):
+    def __init__(
+        self,
+        client: LLMClient,
+        cache: LLMResponseCache,
+        cache_nondeterministic: bool = False,
+    ) -> None:
+        self._client = client
+        self._cache = cache
+        self._cache_nondeterministic = cache_nondeterministic
+
+    @property
+    def inner(self) -> LLMClient:
+        return self._client
+
+    @property
+    def stats(self) -> LLMCacheStats:
+        return self._cache.stats
+
+    @property
+    def model_id(self) -> str:
+        return getattr(self._client, "model_id", "")
+
+    def cache_identity(self, method: str) -> dict[str, object]:
+        return client_cache_identity(self._client, method)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._client, name)
+
+    async def complete_json(self, prompt: str, schema: dict) -> dict:
+        key = self._key("complete_json", prompt, schema)
+        if key is None:
+            return await self._client.complete_json(prompt, schema)
+        found, value = await self._cache.aget(key)
+        if found:
+            return value
+        payload = await self._client.complete_json(prompt, schema)
+        await self._cache.aset(key, payload)
+        return payload
+
+    async def complete_text(self, prompt: str) -> str:
+        key = self._key("complete_text", prompt, None)
+        if key is None:
+            return await self._client.complete_text(prompt)
+        found, value = await self._cache.aget(key)
+        if found:
+            return value
+        text = await self._client.complete_text(prompt)
+        await self._cache.aset(key, text)
+        return text
+
+    async def complete_json_stream(self, prompt: str, schema: dict) -> dict | None:
+        # Defined here so streaming callers hit the cache instead of __getattr__ forwarding.
+        if not supports_streaming(self._client):
+            return None
+        key = self._key("complete_json_stream", prompt, schema)
+        if key is None:
+            return await complete_json_streaming(self._client, prompt, schema)
+        found, value = await self._cache.aget(key)
+        if found:
+            return value
+        payload = await complete_json_streaming(self._client, prompt, schema)
+        if payload is not None:
+            await self._cache.aset(key, payload)
+        return payload
+
+    async def complete_text_stream(self, prompt: str, schema: dict | None = None) -> str:
+        text_stream = self._client.complete_text_stream
+        key = self._key("complete_text_stream", prompt, schema)
+        if key is None:
+            return await text_stream(prompt, schema)
+        found, value = await self._cache.aget(key)
+        if found:
+            return value
+        text = await text_stream(prompt, schema)
+        await self._cache.aset(key, text)
+        return text
+
+    def _key(self, method: str, prompt: str, schema: dict | None) -> str | None:
+        if wants_distinct_samples():
+            self._cache.stats.bypassed += 1
+            return None
+        identity = client_cache_identity(self._client, method)
+        if not self._cache_nondeterministic and identity.get("temperature", 0) != 0:
+            self._cache.stats.bypassed += 1
+            return None
+        return build_cache_key(identity, method, prompt, schema)
+
+
+@lru_cache
+def get_llm_cache() -> LLMResponseCache | None:
+    mode = os.getenv("TRUSTAI_LLM_CACHE", "off").lower()
+    if mode in {"", "0", "off", "none"}:
+        return None
+    if mode not in {"memory", "sqlite"}:
+        raise ValueError("TRUSTAI_LLM_CACHE must be 'off', 'memory' or 'sqlite'")
+    path = None
+    if mode == "sqlite":
+        path = Path(os.getenv("TRUSTAI_LLM_CACHE_PATH", DEFAULT_CACHE_PATH))
+    return LLMResponseCache(
+        ttl_s=float(os.getenv("TRUSTAI_LLM_CACHE_TTL_S", str(DEFAULT_CACHE_TTL_S))),
+        max_entries=int(
+            os.getenv("TRUSTAI_LLM_CACHE_MAX_ENTRIES", str(DEFAULT_CACHE_MAX_ENTRIES))
+        ),
+        path=path,
+    )
+
+
+def with_llm_cache(client: LLMClient) -> LLMClient:
+    cache = get_llm_cache()
+    if cache is None:
+        return client
+    cache_text = os.getenv("TRUSTAI_LLM_CACHE_TEXT", "0") == "1"
+    return CachedLLMClient(client, cache, cache_nondeterministic=cache_text)
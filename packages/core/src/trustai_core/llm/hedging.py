@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_BUCKET_BOUNDS_S = tuple(0.05 * 1.25**index for index in range(40))
+
+
+class LatencyHistogram:
+    def __init__(self, max_samples: int = 1000) -> None:
+        self._counts = [0] * (len(_BUCKET_BOUNDS_S) + 1)
+        self._total = 0
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._total
+
+    def record(self, seconds: float) -> None:
+        index = bisect.bisect_left(_BUCKET_BOUNDS_S, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += 1
+            if self._total > self._max_samples:
+                # Halve all buckets so recent latency dominates the estimate.
+                self._counts = [count // 2 for count in self._counts]
+                self._total = sum(self._counts)
+
+    def quantile(self, q: float) -> float | None:
+        with self._lock:
+            if not self._total:
+                return None
+            threshold = q * self._total
+            cumulative = 0
+            for index, count in enumerate(self._counts):
+                cumulative += count
+                if cumulative >= threshold:
+                    return _BUCKET_BOUNDS_S[min(index, len(_BUCKET_BOUNDS_S) - 1)]
+        return _BUCKET_BOUNDS_S[-1]
+
+
+@dataclass(frozen=True)
+class HedgeConfig:
+    enabled: bool = False
+    quantile: float = 0.95
+    min_samples: int = 20
+    default_delay_s: float = 2.0
+    min_delay_s: float = 0.25
+
+    @classmethod
+    def from_env(cls, provider: str) -> HedgeConfig:
+        return cls(
+            enabled=os.getenv(f"TRUSTAI_{provider.upper()}_HEDGE", "0") == "1",
+            quantile=float(os.getenv("TRUSTAI_LLM_HEDGE_QUANTILE", "0.95")),
+            min_samples=int(os.getenv("TRUSTAI_LLM_HEDGE_MIN_SAMPLES", "20")),
+            default_delay_s=float(os.getenv("TRUSTAI_LLM_HEDGE_DEFAULT_DELAY_S", "2.0")),
+            min_delay_s=float(os.getenv("TRUSTAI_LLM_HEDGE_MIN_DELAY_S", "0.25")),
+        )
+
+
+class Hedger:
+    def __init__(self, config: HedgeConfig) -> None:
+        self._config = config
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+
+    @property
+    def config(self) -> HedgeConfig:
+        return self._config
+
+    def histogram(self, model: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(model)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self._histograms[model] = histogram
+            return histogram
+
+    def record(self, model: str, seconds: float) -> None:
+        self.histogram(model).record(seconds)
+
+    def hedge_delay(self, model: str) -> float:
+        histogram = self.histogram(model)
+        if histogram.count < self._config.min_samples:
+            return self._config.default_delay_s
+        estimate = histogram.quantile(self._config.quantile)
+        if estimate is None:
+            return self._config.default_delay_s
+        return max(self._config.min_delay_s, estimate)
+
+    async def timed(self, model: str, call: Callable[[str], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await call(model)
+        self.record(model, time.monotonic() - started)
+        return result
+
+    async def run(
+        self,
+        candidates: Sequence[str],
+        call: Callable[[str], Awaitable[T]],
+        fallback_on: tuple[type[BaseException], ...] = (),
+        attempted: list[str] | None = None,
+    ) -> T:
+        if not candidates:
+            raise ValueError("Hedged call requires at least one candidate")
+        pending: dict[asyncio.Task[T], str] = {}
+        started: dict[asyncio.Task[T], float] = {}
+        launched: list[str] = []
+        last_error: BaseException | None = None
+
+        def _launch() -> None:
+            model = candidates[len(launched)]
+            launched.append(model)
+            if attempted is not None:
+                attempted.append(model)
+            task = asyncio.create_task(call(model))
+            pending[task] = model
+            started[task] = time.monotonic()
+
+        _launch()
+        primary = next(iter(pending))
+        try:
+            while pending:
+                timeout = None
+                if len(launched) < len(candidates):
+                    timeout = self.hedge_delay(launched[-1])
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self.hedges_fired += 1
+                    _launch()
+                    continue
+                for task in done:
+                    model = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        # Only a hedge that beat a still-running primary is a win; a
+                        # fallback after the primary failed is not.
+                        if task is not primary and primary in pending:
+                            self.hedge_wins += 1
+                        return task.result()
+                    if not isinstance(error, fallback_on):
+                        if not pending:
+                            raise error
+                        last_error = error
+                        continue
+                    last_error = error
+                    if len(launched) < len(candidates):
+                        _launch()
+            assert last_error is not None
+            raise last_error
+        finally:
+            cancelled_at = time.monotonic()
+            for task, model in pending.items():
+                # Losers ran at least this long; dropping them would censor the slow tail
+                # and drag the hedge delay down.
+                self.record(model, cancelled_at - started[task])
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+_HEDGERS: dict[str, Hedger] = {}
+_HEDGERS_LOCK = threading.Lock()
+
+
+def get_hedger(provider: str) -> Hedger:
+    with _HEDGERS_LOCK:
+        hedger = _HEDGERS.get(provider)
+        if hedger is None:
+            hedger = Hedger(HedgeConfig.from_env(provider))
+            _HEDGERS[provider] = hedger
+        return hedger
+
+
+def reset_hedgers() -> None:
+    with _HEDGERS_LOCK:
+        _HEDGERS.clear()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from typing import Any
 
 import orjson
 from openai import (
@@ -17,9 +18,18 @@ from openai import (
 )
 
 from trustai_core.llm.base import LLMClient, LLMError, RateLimitError, TimeoutError
+from trustai_core.llm.prompt import prompt_cache_key
+from trustai_core.llm.ratelimit import estimate_tokens, get_rate_limiter, parse_retry_after
 from trustai_core.llm.retry import RetryPolicy, build_idempotency_key, run_with_retry
+from trustai_core.llm.streaming import JSONObjectStreamValidator, close_stream
 
 DEFAULT_OPENAI_MODEL = "gpt-4o-mini"
+# Shared by the request calls and cache_identity so cached responses track the real params.
+_JSON_TEMPERATURE = 0
+_JSON_SYSTEM_PROMPT = "Return JSON only."
+_JSON_RESPONSE_FORMAT = "json_object"
+_TEXT_TEMPERATURE = 0.2
+_TEXT_SYSTEM_PROMPT = "Return text only."
 
 
 class OpenAIClient(LLMClient):
@@ -29,33 +39,61 @@ class OpenAIClient(LLMClient):
         model: str = DEFAULT_OPENAI_MODEL,
         timeout_s: float = 30.0,
         retry_policy: RetryPolicy | None = None,
+        http_client: Any | None = None,
     ) -> None:
         resolved_key = api_key or os.getenv("OPEN_AI_KEY") or os.getenv("OPENAI_API_KEY")
         if not resolved_key:
             raise LLMError("OpenAI API key is missing")
-        self._client = AsyncOpenAI(api_key=resolved_key, timeout=timeout_s)
+        client_kwargs: dict[str, Any] = {"api_key": resolved_key, "timeout": timeout_s}
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+        self._client = AsyncOpenAI(**client_kwargs)
         self._model = model
         self._retry_policy = retry_policy or RetryPolicy()
+        self._limiter = get_rate_limiter("openai", model)
 
     @property
     def model_id(self) -> str:
         return self._model
 
+    def cache_identity(self, method: str) -> dict[str, object]:
+        if method == "complete_json":
+            return {
+                "provider": "openai",
+                "model": self._model,
+                "temperature": _JSON_TEMPERATURE,
+                "system": _JSON_SYSTEM_PROMPT,
+                "response_format": _JSON_RESPONSE_FORMAT,
+            }
+        return {
+            "provider": "openai",
+            "model": self._model,
+            "temperature": _TEXT_TEMPERATURE,
+            "system": _TEXT_SYSTEM_PROMPT,
+        }
+
+    def _rate_limited(self, exc: Exception) -> RateLimitError:
+        retry_after = parse_retry_after(exc)
+        self._limiter.penalize(retry_after)
+        return RateLimitError(str(exc), retry_after=retry_after)
+
     async def complete_json(self, prompt: str, schema: dict) -> dict:
         async def _call() -> dict:
             try:
-                response = await self._client.chat.completions.create(
-                    model=self._model,
-                    temperature=0,
-                    response_format={"type": "json_object"},
-                    messages=[
-                        {"role": "system", "content": "Return JSON only."},
-                        {"role": "user", "content": prompt},
-                    ],
-                    extra_headers={"Idempotency-Key": build_idempotency_key("openai")},
-                )
+                async with self._limiter.limit(estimate_tokens(prompt)):
+                    response = await self._client.chat.completions.create(
+                        model=self._model,
+                        temperature=_JSON_TEMPERATURE,
+                        response_format={"type": _JSON_RESPONSE_FORMAT},
+                        messages=[
+                            {"role": "system", "content": _JSON_SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt},
+                        ],
+                        extra_headers={"Idempotency-Key": build_idempotency_key("openai")},
+                        **_prompt_cache_kwargs(prompt),
+                    )
             except OpenAIRateLimitError as exc:
-                raise RateLimitError(str(exc)) from exc
+                raise self._rate_limited(exc) from exc
             except OpenAITimeoutError as exc:
                 raise TimeoutError(str(exc)) from exc
             except OpenAIConnectionError as exc:
@@ -74,20 +112,62 @@ class OpenAIClient(LLMClient):
 
         return await run_with_retry(_call, policy=self._retry_policy)
 
+    async def complete_json_stream(self, prompt: str, schema: dict) -> dict:
+        async def _call() -> dict:
+            validator = JSONObjectStreamValidator.from_schema(schema)
+            try:
+                async with self._limiter.limit(estimate_tokens(prompt)):
+                    stream = await self._client.chat.completions.create(
+                        model=self._model,
+                        temperature=_JSON_TEMPERATURE,
+                        response_format={"type": _JSON_RESPONSE_FORMAT},
+                        messages=[
+                            {"role": "system", "content": _JSON_SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt},
+                        ],
+                        stream=True,
+                        extra_headers={"Idempotency-Key": build_idempotency_key("openai")},
+                        **_prompt_cache_kwargs(prompt),
+                    )
+                    try:
+                        async for chunk in stream:
+                            if not chunk.choices:
+                                continue
+                            delta = chunk.choices[0].delta.content
+                            if delta and validator.feed(delta):
+                                break
+                    finally:
+                        await close_stream(stream)
+            except LLMError:
+                raise
+            except OpenAIRateLimitError as exc:
+                raise self._rate_limited(exc) from exc
+            except OpenAITimeoutError as exc:
+                raise TimeoutError(str(exc)) from exc
+            except OpenAIConnectionError as exc:
+                raise LLMError(str(exc)) from exc
+            except Exception as exc:  # pragma: no cover - safety net
+                raise LLMError(str(exc)) from exc
+            return validator.payload()
+
+        return await run_with_retry(_call, policy=self._retry_policy)
+
     async def complete_text(self, prompt: str) -> str:
         async def _call() -> str:
             try:
-                response = await self._client.chat.completions.create(
-                    model=self._model,
-                    temperature=0.2,
-                    messages=[
-                        {"role": "system", "content": "Return text only."},
-                        {"role": "user", "content": prompt},
-                    ],
-                    extra_headers={"Idempotency-Key": build_idempotency_key("openai")},
-                )
+                async with self._limiter.limit(estimate_tokens(prompt)):
+                    response = await self._client.chat.completions.create(
+                        model=self._model,
+                        temperature=_TEXT_TEMPERATURE,
+                        messages=[
+                            {"role": "system", "content": _TEXT_SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt},
+                        ],
+                        extra_headers={"Idempotency-Key": build_idempotency_key("openai")},
+                        **_prompt_cache_kwargs(prompt),
+                    )
             except OpenAIRateLimitError as exc:
-                raise RateLimitError(str(exc)) from exc
+                raise self._rate_limited(exc) from exc
             except OpenAITimeoutError as exc:
                 raise TimeoutError(str(exc)) from exc
             except OpenAIConnectionError as exc:
@@ -98,3 +178,10 @@ class OpenAIClient(LLMClient):
             return response.choices[0].message.content or ""
 
         return await run_with_retry(_call, policy=self._retry_policy)
+
+
+def _prompt_cache_kwargs(prompt: str) -> dict[str, Any]:
+    cache_key = prompt_cache_key(prompt)
+    if cache_key is None:
+        return {}
+    return {"prompt_cache_key": cache_key}
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from types import ModuleType
+from typing import Any
+
+import anthropic
+import openai
+
+from trustai_core.llm.anthropic_client import DEFAULT_CLAUDE_MODEL, AnthropicClient
+from trustai_core.llm.base import LLMError
+from trustai_core.llm.openai_client import DEFAULT_OPENAI_MODEL, OpenAIClient
+
+ClientKey = tuple[str, str, str, float]
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_s: float = 30.0
+    http2: bool = True
+
+    @classmethod
+    def from_env(cls) -> PoolConfig:
+        return cls(
+            max_connections=int(os.getenv("TRUSTAI_LLM_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("TRUSTAI_LLM_MAX_KEEPALIVE", "20")),
+            keepalive_expiry_s=float(os.getenv("TRUSTAI_LLM_KEEPALIVE_EXPIRY_S", "30")),
+            http2=os.getenv("TRUSTAI_LLM_HTTP2", "1") == "1",
+        )
+
+
+class LLMClientPool:
+    def __init__(self, config: PoolConfig | None = None) -> None:
+        self._config = config or PoolConfig.from_env()
+        self._lock = threading.Lock()
+        self._by_loop: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[ClientKey, Any]
+        ] = weakref.WeakKeyDictionary()
+        self._unbound: dict[ClientKey, Any] = {}
+        self.created = 0
+        self.reused = 0
+
+    @property
+    def config(self) -> PoolConfig:
+        return self._config
+
+    def openai(
+        self,
+        model: str = DEFAULT_OPENAI_MODEL,
+        api_key: str | None = None,
+        timeout_s: float = 30.0,
+    ) -> OpenAIClient:
+        resolved_key = api_key or os.getenv("OPEN_AI_KEY") or os.getenv("OPENAI_API_KEY")
+        return self._get(
+            ("openai", model, _key_fingerprint(resolved_key), timeout_s),
+            lambda: OpenAIClient(
+                api_key=resolved_key,
+                model=model,
+                timeout_s=timeout_s,
+                http_client=self._http_client(openai, timeout_s),
+            ),
+        )
+
+    def anthropic(
+        self,
+        model: str = DEFAULT_CLAUDE_MODEL,
+        api_key: str | None = None,
+        timeout_s: float = 30.0,
+    ) -> AnthropicClient:
+        resolved_key = api_key or os.getenv("CLAUDE_AI_KEY") or os.getenv("ANTHROPIC_API_KEY")
+        return self._get(
+            ("anthropic", model, _key_fingerprint(resolved_key), timeout_s),
+            lambda: AnthropicClient(
+                api_key=resolved_key,
+                model=model,
+                timeout_s=timeout_s,
+                http_client=self._http_client(anthropic, timeout_s),
+            ),
+        )
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._unbound) + sum(len(clients) for clients in self._by_loop.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_loop = weakref.WeakKeyDictionary()
+            self._unbound = {}
+
+    def _get(self, key: ClientKey, factory: Callable[[], Any]) -> Any:
+        if key[2] == "":
+            raise LLMError(f"{key[0].capitalize()} API key is missing")
+        with self._lock:
+            clients = self._clients_for_loop()
+            client = clients.get(key)
+            if client is not None:
+                self.reused += 1
+                return client
+            client = factory()
+            clients[key] = client
+            self.created += 1
+            return client
+
+    def _clients_for_loop(self) -> dict[ClientKey, Any]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._unbound
+        clients = self._by_loop.get(loop)
+        if clients is None:
+            clients = {}
+            self._by_loop[loop] = clients
+        return clients
+
+    def _http_client(self, sdk: ModuleType, timeout_s: float) -> Any:
+        # The SDKs may ship their own httpx flavour; build limits from the same module.
+        limits_cls = type(sdk.DEFAULT_CONNECTION_LIMITS)
+        limits = limits_cls(
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry_s,
+        )
+        return sdk.DefaultAsyncHttpxClient(
+            timeout=timeout_s,
+            limits=limits,
+            http2=self._config.http2 and _http2_available(),
+        )
+
+
+def _key_fingerprint(api_key: str | None) -> str:
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+@lru_cache
+def get_llm_client_pool() -> LLMClientPool:
+    return LLMClientPool()
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import hashlib
+
+
+class PromptWithPrefix(str):
+    """Prompt text whose leading ``prefix`` is stable across calls and safe to cache."""
+
+    prefix: str
+    suffix: str
+
+    def __new__(cls, prefix: str, suffix: str) -> PromptWithPrefix:
+        prompt = super().__new__(cls, prefix + suffix)
+        prompt.prefix = prefix
+        prompt.suffix = suffix
+        return prompt
+
+
+def prompt_parts(prompt: str) -> tuple[str, str]:
+    if isinstance(prompt, PromptWithPrefix):
+        return prompt.prefix, prompt.suffix
+    return "", str(prompt)
+
+
+def prompt_cache_key(prompt: str) -> str | None:
+    prefix, _ = prompt_parts(prompt)
+    if not prefix:
+        return None
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:32]
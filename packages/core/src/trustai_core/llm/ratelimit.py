@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_OUTPUT_TOKENS = 512
+
+
+class TokenBucket:
+    def __init__(self, per_minute: float, capacity: float | None = None) -> None:
+        self._rate_per_s = per_minute / 60.0
+        self._capacity = capacity if capacity is not None else per_minute
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float, not_before: float = 0.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated) * self._rate_per_s,
+            )
+            self._updated = now
+            self._tokens -= min(amount, self._capacity)
+            wait_s = 0.0
+            if self._tokens < 0:
+                wait_s = -self._tokens / self._rate_per_s
+            return max(wait_s, not_before - now)
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    requests_per_minute: float = 0.0
+    tokens_per_minute: float = 0.0
+    max_in_flight: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.requests_per_minute or self.tokens_per_minute or self.max_in_flight)
+
+    @classmethod
+    def from_env(cls, provider: str) -> RateLimitConfig:
+        return cls(
+            requests_per_minute=float(_provider_env("RPM", provider, "0")),
+            tokens_per_minute=float(_provider_env("TPM", provider, "0")),
+            max_in_flight=int(_provider_env("MAX_IN_FLIGHT", provider, "0")),
+        )
+
+
+class ProviderRateLimiter:
+    def __init__(self, config: RateLimitConfig) -> None:
+        self._config = config
+        self._requests = (
+            TokenBucket(config.requests_per_minute) if config.requests_per_minute else None
+        )
+        self._tokens = TokenBucket(config.tokens_per_minute) if config.tokens_per_minute else None
+        self._blocked_until = 0.0
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self.waited_s = 0.0
+        self.throttled = 0
+        self.penalties = 0
+
+    @property
+    def config(self) -> RateLimitConfig:
+        return self._config
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        if not self._config.enabled and self._blocked_until <= time.monotonic():
+            yield
+            return
+        await self._wait(estimated_tokens)
+        semaphore = self._semaphore()
+        if semaphore is None:
+            yield
+            return
+        async with semaphore:
+            yield
+
+    def penalize(self, retry_after_s: float | None) -> None:
+        if not retry_after_s or retry_after_s <= 0:
+            return
+        self.penalties += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after_s)
+
+    async def _wait(self, estimated_tokens: int) -> None:
+        wait_s = max(0.0, self._blocked_until - time.monotonic())
+        if self._requests is not None:
+            wait_s = max(wait_s, self._requests.reserve(1, self._blocked_until))
+        if self._tokens is not None and estimated_tokens:
+            wait_s = max(wait_s, self._tokens.reserve(estimated_tokens, self._blocked_until))
+        if wait_s > 0:
+            self.throttled += 1
+            self.waited_s += wait_s
+            await asyncio.sleep(wait_s)
+
+    def _semaphore(self) -> asyncio.Semaphore | None:
+        if not self._config.max_in_flight:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._config.max_in_flight)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+
+_LIMITERS: dict[tuple[str, str], ProviderRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str) -> ProviderRateLimiter:
+    key = (provider, model)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = ProviderRateLimiter(RateLimitConfig.from_env(provider))
+            _LIMITERS[key] = limiter
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+def estimate_tokens(prompt: str, max_output_tokens: int = DEFAULT_OUTPUT_TOKENS) -> int:
+    return len(prompt) // 4 + max_output_tokens
+
+
+def parse_retry_after(exc: BaseException) -> float | None:
+    response: Any = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    for header in ("retry-after-ms", "retry-after"):
+        raw = headers.get(header)
+        if raw is None:
+            continue
+        try:
+            value = float(raw)
+        except (TypeError, ValueError):
+            continue
+        return value / 1000.0 if header == "retry-after-ms" else value
+    return None
+
+
+def _provider_env(name: str, provider: str, default: str) -> str:
+    specific = os.getenv(f"TRUSTAI_LLM_{name}_{provider.upper()}")
+    if specific is not None:
+        return specific
+    return os.getenv(f"TRUSTAI_LLM_{name}", default)
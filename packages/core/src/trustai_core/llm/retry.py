@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import os
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from typing import Any, TypeVar
 from uuid import uuid4
 
 from tenacity import (
@@ -10,7 +15,17 @@ from tenacity import (
     wait_exponential,
 )
 
-from trustai_core.llm.base import LLMError, RateLimitError, TimeoutError
+from trustai_core.llm.base import (
+    LLMClient,
+    LLMError,
+    RateLimitError,
+    TimeoutError,
+    wants_distinct_samples,
+)
+from trustai_core.llm.cache import build_cache_key, client_cache_identity
+from trustai_core.llm.streaming import complete_json_streaming, supports_streaming
+
+T = TypeVar("T")
 
 
 @dataclass(frozen=True)
@@ -38,3 +53,101 @@ async def run_with_retry(fn, *args, policy: RetryPolicy | None = None, **kwargs)
         with attempt:
             return await fn(*args, **kwargs)
     raise LLMError("Retry attempts exhausted")  # pragma: no cover
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._inflight: dict[tuple[int, str], asyncio.Task] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        slot = (id(asyncio.get_running_loop()), key)
+        task = self._inflight.get(slot)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[slot] = task
+            task.add_done_callback(lambda done: self._release(slot, done))
+        else:
+            self.followers += 1
+        return await asyncio.shield(task)
+
+    def _release(self, slot: tuple[int, str], task: asyncio.Task) -> None:
+        if self._inflight.get(slot) is task:
+            del self._inflight[slot]
+        if not task.cancelled():
+            task.exception()
+
+
+_DEFAULT_SINGLE_FLIGHT = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _DEFAULT_SINGLE_FLIGHT
+
+
+class SingleFlightLLMClient(LLMClient):
+    def __init__(self, client: LLMClient, group: SingleFlight | None = None) -> None:
+        self._client = client
+        self._group = group or get_single_flight()
+
+    @property
+    def inner(self) -> LLMClient:
+        return self._client
+
+    @property
+    def model_id(self) -> str:
+        return getattr(self._client, "model_id", "")
+
+    def cache_identity(self, method: str) -> dict[str, object]:
+        return client_cache_identity(self._client, method)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._client, name)
+
+    async def complete_json(self, prompt: str, schema: dict) -> dict:
+        if wants_distinct_samples():
+            return await self._client.complete_json(prompt, schema)
+        key = self._key("complete_json", prompt, schema)
+        payload = await self._group.run(key, lambda: self._client.complete_json(prompt, schema))
+        return copy.deepcopy(payload)
+
+    async def complete_text(self, prompt: str) -> str:
+        if wants_distinct_samples():
+            return await self._client.complete_text(prompt)
+        key = self._key("complete_text", prompt, None)
+        return await self._group.run(key, lambda: self._client.complete_text(prompt))
+
+    async def complete_json_stream(self, prompt: str, schema: dict) -> dict | None:
+        if not supports_streaming(self._client):
+            return None
+        if wants_distinct_samples():
+            return await complete_json_streaming(self._client, prompt, schema)
+        key = self._key("complete_json_stream", prompt, schema)
+        payload = await self._group.run(
+            key, lambda: complete_json_streaming(self._client, prompt, schema)
+        )
+        return copy.deepcopy(payload)
+
+    async def complete_text_stream(self, prompt: str, schema: dict | None = None) -> str:
+        text_stream = self._client.complete_text_stream
+        if wants_distinct_samples():
+            return await text_stream(prompt, schema)
+        key = self._key("complete_text_stream", prompt, schema)
+        return await self._group.run(key, lambda: text_stream(prompt, schema))
+
+    def _key(self, method: str, prompt: str, schema: dict | None) -> str:
+        identity = client_cache_identity(self._client, method)
+        return build_cache_key(identity, method, prompt, schema)
+
+
+def with_single_flight(client: LLMClient) -> LLMClient:
+    if os.getenv("TRUSTAI_LLM_SINGLEFLIGHT", "1") != "1":
+        return client
+    return SingleFlightLLMClient(client)
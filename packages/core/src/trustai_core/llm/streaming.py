@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import inspect
+import os
+from collections.abc import Iterable
+from typing import Any
+
+import orjson
+
+from trustai_core.llm.base import LLMClient, LLMError
+
+
+class StreamValidationError(LLMError):
+    """Raised when a streamed JSON response is rejected before completion."""
+
+
+class JSONObjectStreamValidator:
+    def __init__(
+        self,
+        allowed_keys: Iterable[str] | None = None,
+        required_keys: Iterable[str] | None = None,
+        allow_preamble: bool = False,
+    ) -> None:
+        self._allowed = set(allowed_keys) if allowed_keys is not None else None
+        self._required = set(required_keys or [])
+        self._allow_preamble = allow_preamble
+        self._chunks: list[str] = []
+        self._offset = 0
+        self._start: int | None = None
+        self._end: int | None = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expecting_key = False
+        self._key_chars: list[str] | None = None
+        self.keys: list[str] = []
+
+    @classmethod
+    def from_schema(
+        cls,
+        schema: dict[str, Any] | None,
+        allow_preamble: bool = False,
+    ) -> JSONObjectStreamValidator:
+        properties = (schema or {}).get("properties")
+        allowed = list(properties) if isinstance(properties, dict) and properties else None
+        required = (schema or {}).get("required") or []
+        return cls(allowed_keys=allowed, required_keys=required, allow_preamble=allow_preamble)
+
+    @property
+    def complete(self) -> bool:
+        return self._end is not None
+
+    def feed(self, text: str) -> bool:
+        if self._end is not None:
+            return True
+        self._chunks.append(text)
+        for index, char in enumerate(text):
+            self._consume(char, self._offset + index)
+            if self._end is not None:
+                break
+        self._offset += len(text)
+        return self._end is not None
+
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def payload(self) -> dict[str, Any]:
+        if self._start is None:
+            raise StreamValidationError("Streamed response did not contain a JSON object")
+        if self._end is None:
+            raise StreamValidationError("Streamed JSON object was truncated")
+        try:
+            payload = orjson.loads(self.text()[self._start : self._end + 1])
+        except orjson.JSONDecodeError as exc:
+            raise StreamValidationError("Streamed response was not valid JSON") from exc
+        if not isinstance(payload, dict):
+            raise StreamValidationError("Streamed JSON was not an object")
+        return payload
+
+    def _consume(self, char: str, position: int) -> None:
+        if self._start is None:
+            if char == "{":
+                self._start = position
+                self._depth = 1
+                self._expecting_key = True
+            elif not char.isspace() and not self._allow_preamble:
+                raise StreamValidationError("Streamed response did not start with a JSON object")
+            return
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._key_chars is not None:
+                    self._on_key("".join(self._key_chars))
+                    self._key_chars = None
+                return
+            if self._key_chars is not None:
+                self._key_chars.append(char)
+            return
+        if char == '"':
+            self._in_string = True
+            if self._depth == 1 and self._expecting_key:
+                self._key_chars = []
+                self._expecting_key = False
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if self._depth == 0:
+                self._end = position
+                missing = sorted(self._required.difference(self.keys))
+                if missing:
+                    raise StreamValidationError(
+                        f"Streamed JSON is missing required keys: {', '.join(missing)}"
+                    )
+        elif char == "," and self._depth == 1:
+            self._expecting_key = True
+
+    def _on_key(self, raw_key: str) -> None:
+        try:
+            key = orjson.loads(f'"{raw_key}"')
+        except orjson.JSONDecodeError:
+            key = raw_key
+        if self._allowed is not None and key not in self._allowed:
+            raise StreamValidationError(f"Streamed JSON has unexpected key: {key}")
+        self.keys.append(key)
+
+
+def streaming_enabled() -> bool:
+    return os.getenv("TRUSTAI_LLM_STREAMING", "0") == "1"
+
+
+def supports_streaming(client: LLMClient) -> bool:
+    return any(
+        getattr(client, name, None) is not None
+        for name in ("complete_json_stream", "complete_text_stream")
+    )
+
+
+async def complete_json_streaming(
+    client: LLMClient,
+    prompt: str,
+    schema: dict[str, Any],
+) -> dict[str, Any] | None:
+    json_stream = getattr(client, "complete_json_stream", None)
+    if json_stream is not None:
+        return await json_stream(prompt, schema)
+    text_stream = getattr(client, "complete_text_stream", None)
+    if text_stream is not None:
+        text = await text_stream(prompt, schema)
+        validator = JSONObjectStreamValidator.from_schema(schema, allow_preamble=True)
+        validator.feed(text)
+        return validator.payload()
+    return None
+
+
+async def close_stream(stream: Any) -> None:
+    close = getattr(stream, "close", None) or getattr(stream, "aclose", None)
+    if close is None:
+        return
+    result = close()
+    if inspect.isawaitable(result):
+        await result
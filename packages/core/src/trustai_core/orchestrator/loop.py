@@ -8,10 +8,12 @@ from trustai_core.arbiter import feedback as feedback_builder
 from trustai_core.arbiter.evaluator import CLAIM_SUPPORT_THRESHOLD, SCORE_THRESHOLD, Evaluator
 from trustai_core.core.encoder import AtomEncoder
 from trustai_core.core.memory import ItemMemory
+from trustai_core.llm.base import distinct_samples
 from trustai_core.packs.loader import load_pack
 from trustai_core.schemas.atoms import AtomModel, ManifestModel
 from trustai_core.schemas.proof import ANSWER_PREVIEW_CHARS, IterationTrace, VerificationResult
 from trustai_core.utils.canonicalize import sort_atoms
+from trustai_core.utils.events import emit_event
 from trustai_core.utils.hashing import sha256_canonical_json
 
 FEEDBACK_PREVIEW_CHARS = 320
@@ -124,6 +126,46 @@ def _is_high_confidence(pair) -> bool:
     return min(pair.left.confidence, pair.right.confidence) >= HARD_CONTRADICTION_CONFIDENCE
 
 
+async def _claim_candidate(perceiver, pack, answer: str) -> tuple[str, ManifestModel]:
+    return answer, await perceiver.extract_claim_atoms(answer, pack)
+
+
+async def _sample_candidate(
+    perceiver,
+    reasoner,
+    user_text: str,
+    pack,
+    evidence_manifest: ManifestModel,
+    feedback: str | None,
+    distinct: bool = False,
+) -> tuple[str, ManifestModel]:
+    # Sibling candidates share one prompt; without this they would collapse into a
+    # single coalesced (or cached) provider call and every candidate would be identical.
+    with distinct_samples(distinct):
+        answer = await reasoner.generate_answer(user_text, pack, evidence_manifest, feedback)
+    return await _claim_candidate(perceiver, pack, answer)
+
+
+def _is_converged(mismatch, threshold: float) -> bool:
+    return (
+        mismatch.score >= threshold
+        and not mismatch.contradictions
+        and not mismatch.unsupported_claims
+    )
+
+
+def _select_candidate(scored: list[tuple[str, ManifestModel, Any]], threshold: float):
+    return max(
+        scored,
+        key=lambda item: (
+            _is_converged(item[2], threshold),
+            item[2].score,
+            -len(item[2].contradictions),
+            -len(item[2].unsupported_claims),
+        ),
+    )
+
+
 async def verify_and_fix(
     user_text: str,
     pack_name: str,
@@ -135,7 +177,10 @@ async def verify_and_fix(
     claim_support_threshold: float = CLAIM_SUPPORT_THRESHOLD,
     enable_parallel_prepass: bool = False,
     regenerate_with_evidence: bool = False,
+    num_candidates: int = 1,
 ) -> VerificationResult:
+    if num_candidates < 1:
+        raise ValueError("num_candidates must be >= 1")
     if hasattr(arbiter, "encoder"):
         encoder = arbiter.encoder
         memory = encoder.memory
@@ -170,23 +215,48 @@ async def verify_and_fix(
     no_progress_count = 0
 
     for i in range(1, max_iters + 1):
+        seeds: list[str] = []
         if preliminary_answer is not None and i == 1:
             answer = preliminary_answer
-        else:
-            answer = await reasoner.generate_answer(user_text, pack, evidence_manifest, feedback)
-
-        if regenerate_with_evidence and evidence_manifest.atoms and i == 1 and preliminary_answer:
-            answer = await reasoner.generate_answer(user_text, pack, evidence_manifest, feedback)
-
-        claim_manifest = await perceiver.extract_claim_atoms(answer, pack)
-        mismatch = _evaluate_with_fallback(
-            arbiter,
-            evidence_manifest.atoms,
-            claim_manifest.atoms,
-            pack,
-            encoder,
+            if regenerate_with_evidence and evidence_manifest.atoms and preliminary_answer:
+                answer = await reasoner.generate_answer(
+                    user_text, pack, evidence_manifest, feedback
+                )
+            seeds.append(answer)
+
+        candidates = await asyncio.gather(
+            *(_claim_candidate(perceiver, pack, seed) for seed in seeds),
+            *(
+                _sample_candidate(
+                    perceiver,
+                    reasoner,
+                    user_text,
+                    pack,
+                    evidence_manifest,
+                    feedback,
+                    distinct=num_candidates > 1,
+                )
+                for _ in range(num_candidates - len(seeds))
+            ),
+        )
+        answer, claim_manifest, mismatch = _select_candidate(
+            [
+                (
+                    candidate_answer,
+                    candidate_claims,
+                    _evaluate_with_fallback(
+                        arbiter,
+                        evidence_manifest.atoms,
+                        candidate_claims.atoms,
+                        pack,
+                        encoder,
+                        threshold,
+                        claim_support_threshold,
+                    ),
+                )
+                for candidate_answer, candidate_claims in candidates
+            ],
             threshold,
-            claim_support_threshold,
         )
         last_mismatch = mismatch
         evidence_keys = {_atom_key(atom) for atom in evidence_manifest.atoms}
@@ -237,6 +307,15 @@ async def verify_and_fix(
                 answer_delta_summary=answer_delta_summary,
             )
         )
+        emit_event(
+            "iteration",
+            i=i,
+            score=round(mismatch.score, 6),
+            accepted=_is_converged(mismatch, threshold),
+            unsupported=len(mismatch.unsupported_claims),
+            missing=len(mismatch.missing_required),
+            conflicts=len(mismatch.ontology_conflicts),
+        )
         if previous_score is not None:
             if mismatch.score < previous_score + NO_PROGRESS_DELTA:
                 no_progress_count += 1
@@ -247,11 +326,7 @@ async def verify_and_fix(
         if no_progress_count >= NO_PROGRESS_LIMIT:
             break
 
-        if (
-            mismatch.score >= threshold
-            and not mismatch.contradictions
-            and not mismatch.unsupported_claims
-        ):
+        if _is_converged(mismatch, threshold):
             explain = _build_explain(mismatch)
             iterations_payload = [item.model_dump() for item in iterations]
             result_payload: dict[str, Any] = {
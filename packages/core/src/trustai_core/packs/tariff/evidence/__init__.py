@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+from trustai_core.packs.tariff.evidence.index import CitationIndex, build_citation_index
 from trustai_core.packs.tariff.evidence.models import EvidenceSource
-from trustai_core.packs.tariff.evidence.retrieve import TariffEvidenceRetriever
+from trustai_core.packs.tariff.evidence.retrieve import (
+    TariffEvidenceRetriever,
+    get_evidence_retriever,
+)
 from trustai_core.packs.tariff.evidence.store import TariffEvidenceStore
 
-__all__ = ["EvidenceSource", "TariffEvidenceRetriever", "TariffEvidenceStore"]
+__all__ = [
+    "CitationIndex",
+    "EvidenceSource",
+    "TariffEvidenceRetriever",
+    "TariffEvidenceStore",
+    "build_citation_index",
+    "get_evidence_retriever",
+]
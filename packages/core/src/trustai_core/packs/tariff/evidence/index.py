@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable
+
+from trustai_core.packs.tariff.evidence.models import EvidenceSource
+
+
+class CitationIndex:
+    __slots__ = ("_sources", "_normalize", "_normalized_text", "_quote_hits")
+
+    def __init__(self, evidence_bundle: Iterable[EvidenceSource], normalize: bool = False) -> None:
+        self._sources = {source.source_id: source for source in evidence_bundle}
+        self._normalize = normalize
+        self._normalized_text: dict[str, str] = {}
+        self._quote_hits: dict[tuple[str, str], bool] = {}
+
+    def get(self, source_id: str) -> EvidenceSource | None:
+        return self._sources.get(source_id)
+
+    def __contains__(self, source_id: object) -> bool:
+        return source_id in self._sources
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def quote_found(self, source_id: str, quote: str) -> bool:
+        key = (source_id, quote)
+        hit = self._quote_hits.get(key)
+        if hit is None:
+            hit = self._search(source_id, quote)
+            self._quote_hits[key] = hit
+        return hit
+
+    def _search(self, source_id: str, quote: str) -> bool:
+        source = self._sources.get(source_id)
+        if source is None:
+            return False
+        if quote in source.text:
+            return True
+        if not self._normalize:
+            return False
+        text = self._normalized_text.get(source_id)
+        if text is None:
+            text = _normalize_text(source.text)
+            self._normalized_text[source_id] = text
+        return _normalize_text(quote) in text
+
+
+def build_citation_index(
+    evidence_bundle: Iterable[EvidenceSource] | CitationIndex,
+    normalize: bool = False,
+) -> CitationIndex:
+    if isinstance(evidence_bundle, CitationIndex):
+        return evidence_bundle
+    return _cached_index(tuple(evidence_bundle), normalize)
+
+
+@lru_cache(maxsize=32)
+def _cached_index(evidence_bundle: tuple[EvidenceSource, ...], normalize: bool) -> CitationIndex:
+    return CitationIndex(evidence_bundle, normalize=normalize)
+
+
+def _normalize_text(value: str) -> str:
+    return " ".join(value.split()).casefold()
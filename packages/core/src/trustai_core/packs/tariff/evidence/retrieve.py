@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import re
 from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
 
 from trustai_core.packs.tariff.evidence.models import EvidenceSource
-from trustai_core.packs.tariff.evidence.store import TariffEvidenceStore
+from trustai_core.packs.tariff.evidence.store import TariffEvidenceStore, _default_evidence_root
 
 TOKEN_PATTERN = re.compile(r"[a-zA-Z0-9]+")
 SECTION_BY_CHAPTER = {
@@ -72,6 +74,16 @@ class TariffEvidenceRetriever:
         return result
 
 
+def get_evidence_retriever(root: Path | None = None) -> TariffEvidenceRetriever:
+    return _cached_retriever(root or _default_evidence_root())
+
+
+@lru_cache(maxsize=8)
+def _cached_retriever(root: Path) -> TariffEvidenceRetriever:
+    # Sources are already cached per root, so the token index can be shared too.
+    return TariffEvidenceRetriever(TariffEvidenceStore(root))
+
+
 def _collect_forced_sources(
     sources: Iterable[EvidenceSource],
     heading_chapters: set[str],
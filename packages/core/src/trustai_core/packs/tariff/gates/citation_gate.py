@@ -4,6 +4,7 @@ from typing import Iterable
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from trustai_core.packs.tariff.evidence.index import CitationIndex, build_citation_index
 from trustai_core.packs.tariff.evidence.models import EvidenceSource
 from trustai_core.packs.tariff.models import TariffCitation, TariffDossier
 
@@ -19,9 +20,10 @@ class CitationGateResult(BaseModel):
 
 def run_citation_gate(
     dossier: TariffDossier,
-    evidence_bundle: Iterable[EvidenceSource],
+    evidence_bundle: Iterable[EvidenceSource] | CitationIndex,
+    normalize_quotes: bool = False,
 ) -> CitationGateResult:
-    bundle = {source.source_id: source for source in evidence_bundle}
+    bundle = build_citation_index(evidence_bundle, normalize=normalize_quotes)
     citations = collect_citations(dossier)
     violations: list[str] = []
     missing_claim_types: list[str] = []
@@ -59,21 +61,20 @@ def collect_citations(dossier: TariffDossier) -> list[TariffCitation]:
 
 def _validate_citation_sources(
     citations: Iterable[TariffCitation],
-    bundle: dict[str, EvidenceSource],
+    bundle: CitationIndex,
     violations: list[str],
 ) -> None:
     for citation in citations:
-        source = bundle.get(citation.source_id)
-        if not source:
+        if citation.source_id not in bundle:
             violations.append(f"invalid_source_id: {citation.source_id}")
             continue
-        if citation.quote not in source.text:
+        if not bundle.quote_found(citation.source_id, citation.quote):
             violations.append(f"quote_not_found: {citation.source_id}")
 
 
 def _gri_steps_have_citations(
     dossier: TariffDossier,
-    bundle: dict[str, EvidenceSource],
+    bundle: CitationIndex,
     violations: list[str],
 ) -> bool:
     ok = True
@@ -91,15 +92,16 @@ def _gri_steps_have_citations(
             violations.append(f"gri_citation_not_gri_source: {step.step.value}")
             ok = False
         for citation in step_citations:
-            source = bundle.get(citation.source_id)
-            if source and citation.quote not in source.text:
+            if citation.source_id in bundle and not bundle.quote_found(
+                citation.source_id, citation.quote
+            ):
                 ok = False
     return ok
 
 
 def _essential_character_citations_ok(
     dossier: TariffDossier,
-    bundle: dict[str, EvidenceSource],
+    bundle: CitationIndex,
     violations: list[str],
 ) -> bool:
     citations = [
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from trustai_core.packs.tariff.models import GriStep, GriTrace
 
 GRI_ORDER = [
@@ -11,37 +13,102 @@ GRI_ORDER = [
     GriStep.GRI_6,
 ]
 
+_GRI_ORDER_TUPLE = tuple(GRI_ORDER)
+
+
+class CompiledGriTrace:
+    __slots__ = ("ordered", "applied_mask", "rejected_mask", "vector_len", "vector_mask", "labels")
+
+    def __init__(
+        self,
+        ordered: bool,
+        applied_mask: int,
+        rejected_mask: int,
+        vector_len: int,
+        vector_mask: int,
+        labels: tuple[str, ...],
+    ) -> None:
+        self.ordered = ordered
+        self.applied_mask = applied_mask
+        self.rejected_mask = rejected_mask
+        self.vector_len = vector_len
+        self.vector_mask = vector_mask
+        self.labels = labels
+
+    @property
+    def key(self) -> tuple[bool, int, int, int, int, tuple[str, ...]]:
+        return (
+            self.ordered,
+            self.applied_mask,
+            self.rejected_mask,
+            self.vector_len,
+            self.vector_mask,
+            self.labels,
+        )
+
+    def validate(self) -> tuple[bool, list[str]]:
+        ok, violations = _validate_compiled(self.key)
+        return ok, list(violations)
+
 
-def validate_gri_sequence(gri_trace: GriTrace | None) -> tuple[bool, list[str]]:
+def compile_gri_trace(gri_trace: GriTrace | None) -> CompiledGriTrace | None:
+    if gri_trace is None:
+        return None
+    applied_mask = 0
+    rejected_mask = 0
+    for idx, step in enumerate(gri_trace.steps):
+        if step.applied:
+            applied_mask |= 1 << idx
+        if step.rejected_because:
+            rejected_mask |= 1 << idx
+    vector_mask = 0
+    for idx, applied in enumerate(gri_trace.step_vector or []):
+        if applied:
+            vector_mask |= 1 << idx
+    return CompiledGriTrace(
+        ordered=tuple(step.step for step in gri_trace.steps) == _GRI_ORDER_TUPLE,
+        applied_mask=applied_mask,
+        rejected_mask=rejected_mask,
+        vector_len=len(gri_trace.step_vector or []),
+        vector_mask=vector_mask,
+        labels=tuple(f"{step.step}" for step in gri_trace.steps),
+    )
+
+
+def validate_gri_sequence(
+    gri_trace: GriTrace | CompiledGriTrace | None,
+) -> tuple[bool, list[str]]:
     if gri_trace is None:
         return False, ["missing_gri_trace"]
+    if not isinstance(gri_trace, CompiledGriTrace):
+        gri_trace = compile_gri_trace(gri_trace)
+    return gri_trace.validate()
+
+
+@lru_cache(maxsize=1024)
+def _validate_compiled(
+    key: tuple[bool, int, int, int, int, tuple[str, ...]],
+) -> tuple[bool, tuple[str, ...]]:
+    ordered, applied_mask, rejected_mask, vector_len, vector_mask, labels = key
     violations: list[str] = []
-    if [step.step for step in gri_trace.steps] != GRI_ORDER:
+    if not ordered:
         violations.append("GRI steps must be ordered GRI_1 through GRI_6")
-    if gri_trace.step_vector and len(gri_trace.step_vector) != len(GRI_ORDER):
+    if vector_len and vector_len != len(GRI_ORDER):
         violations.append("Step vector must include 6 entries")
-    applied_indices = [i for i, step in enumerate(gri_trace.steps) if step.applied]
-    if applied_indices:
-        first_applied = applied_indices[0]
+    if applied_mask:
+        first_applied = (applied_mask & -applied_mask).bit_length() - 1
         for idx in range(first_applied):
-            if gri_trace.steps[idx].applied:
-                violations.append(
-                    f"Sequence Violation: {gri_trace.steps[idx].step} applied before "
-                    f"{gri_trace.steps[first_applied].step}"
-                )
-            if not gri_trace.steps[idx].rejected_because:
+            if not rejected_mask >> idx & 1:
                 violations.append(
-                    f"Sequence Violation: {gri_trace.steps[first_applied].step} used before "
-                    f"rejecting {gri_trace.steps[idx].step}"
+                    f"Sequence Violation: {labels[first_applied]} used before "
+                    f"rejecting {labels[idx]}"
                 )
-        for idx in range(first_applied + 1, len(gri_trace.steps)):
-            if gri_trace.steps[idx].applied:
+        for idx in range(first_applied + 1, len(labels)):
+            if applied_mask >> idx & 1:
                 violations.append(
-                    f"Sequence Violation: {gri_trace.steps[idx].step} applied after "
-                    f"{gri_trace.steps[first_applied].step}"
+                    f"Sequence Violation: {labels[idx]} applied after "
+                    f"{labels[first_applied]}"
                 )
-    if gri_trace.step_vector:
-        applied_vector = [step.applied for step in gri_trace.steps]
-        if applied_vector != gri_trace.step_vector:
-            violations.append("Step vector does not match applied steps")
-    return (not violations), violations[:10]
+    if vector_len and (vector_len != len(labels) or vector_mask != applied_mask):
+        violations.append("Step vector does not match applied steps")
+    return (not violations), tuple(violations[:10])
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 import orjson
 
+from trustai_core.duty.scenarios import DutySweepResult
+from trustai_core.packs.tariff.evidence.index import CitationIndex, build_citation_index
 from trustai_core.packs.tariff.evidence.models import EvidenceSource
 from trustai_core.packs.tariff.gates import run_citation_gate, run_missing_evidence_gate
 from trustai_core.packs.tariff.models import TariffDossier, TariffVerificationResult
@@ -18,7 +21,11 @@ from trustai_core.packs.tariff.mutations.models import (
 )
 from trustai_core.packs.tariff.mutations.operators import build_default_operators
 from trustai_core.packs.tariff.mutations.search import SearchConfig, run_beam_search
-from trustai_core.packs.tariff.gri import validate_gri_sequence
+from trustai_core.packs.tariff.gri import CompiledGriTrace, compile_gri_trace, validate_gri_sequence
+
+MAX_DUTY_SCENARIOS = 10
+# Operator categories that are spelled differently in the dossier's ALLOWED_CATEGORIES.
+_OPERATOR_DOSSIER_CATEGORIES = {"material": "materials"}
 
 
 def parse_product_dossier(input_text: str) -> ProductDossier | None:
@@ -49,13 +56,16 @@ def build_lever_proof(
     evidence_payload: list[dict[str, Any]],
     top_k: int = 3,
     search_config: SearchConfig | None = None,
+    duty_sweep: DutySweepResult | None = None,
 ) -> LeverProof:
     baseline_summary = _build_baseline_summary(product_dossier, tariff_dossier)
+    duty_scenarios = _cap_duty_sweep(duty_sweep)
     if not product_dossier or not tariff_dossier:
         return LeverProof(
             baseline_summary=baseline_summary,
             mutation_candidates=[],
             selected_levers=[],
+            duty_sweep=duty_scenarios,
         )
 
     search_config = search_config or SearchConfig()
@@ -64,13 +74,17 @@ def build_lever_proof(
         tariff_dossier=tariff_dossier,
         evidence_bundle=evidence_bundle,
         operators=build_default_operators(),
-        verifier=_verify_mutation,
+        verifier=partial(
+            _verify_mutation,
+            compiled_gri=compile_gri_trace(tariff_dossier.gri_trace),
+            citation_index=build_citation_index(evidence_bundle),
+        ),
         config=search_config,
     )
 
     accepted: list[SelectedLever] = []
     for sequence in search_result.sequences:
-        savings_estimate = _estimate_savings(tariff_dossier, sequence)
+        savings_estimate = _estimate_savings(tariff_dossier, sequence, duty_sweep)
         score = _score_sequence(savings_estimate)
         steps = [
             LeverSequenceStep(
@@ -112,16 +126,21 @@ def build_lever_proof(
         selected_levers=ranked[: max(1, top_k)],
         search_summary=search_result.search_summary,
         rejected_sequences=search_result.rejected_sequences,
+        duty_sweep=duty_scenarios,
     )
 
 
 def _verify_mutation(
     dossier: TariffDossier,
     evidence_bundle: list[EvidenceSource],
+    compiled_gri: CompiledGriTrace | None = None,
+    citation_index: CitationIndex | None = None,
 ) -> LeverVerificationSummary:
-    citation_gate = run_citation_gate(dossier, evidence_bundle)
+    citation_gate = run_citation_gate(dossier, citation_index or evidence_bundle)
     missing_evidence_gate = run_missing_evidence_gate(dossier, evidence_bundle)
-    sequence_ok, sequence_violations = validate_gri_sequence(dossier.gri_trace)
+    sequence_ok, sequence_violations = validate_gri_sequence(
+        compiled_gri if compiled_gri is not None else dossier.gri_trace
+    )
     rejected: list[str] = []
     if not citation_gate.ok:
         rejected.append("citation_gate_failed")
@@ -142,11 +161,15 @@ def _verify_mutation(
 def _estimate_savings(
     dossier: TariffDossier,
     sequence: Any,
+    duty_sweep: DutySweepResult | None = None,
 ) -> LeverSavingsEstimate:
     baseline_rate = _resolve_duty_rate(dossier.baseline)
     optimized_rate = _resolve_duty_rate(dossier.optimized)
     duty_savings = None
-    if baseline_rate is not None and optimized_rate is not None:
+    if duty_sweep is not None and duty_sweep.baseline is not None:
+        # Each lever is priced by its own target line when the sweep covers it.
+        duty_savings = _sweep_savings_for_sequence(dossier, sequence.sequence, duty_sweep)
+    if duty_savings is None and baseline_rate is not None and optimized_rate is not None:
         duty_savings = round(max(0.0, baseline_rate - optimized_rate), 4)
     plausibility_penalty = _sequence_plausibility_penalty(sequence.sequence)
     gate_confidence = 0.1 if dossier.citations else 0.0
@@ -169,6 +192,38 @@ def _estimate_savings(
     )
 
 
+def _sweep_savings_for_sequence(
+    dossier: TariffDossier,
+    sequence: list[MutationCandidate],
+    duty_sweep: DutySweepResult,
+) -> float | None:
+    categories = {_dossier_category(candidate.category) for candidate in sequence}
+    targeted = [mutation for mutation in dossier.mutations if mutation.category in categories]
+    expected_lines = {
+        _normalize_line_id(mutation.expected_hts_change)
+        for mutation in targeted
+        if mutation.expected_hts_change
+    }
+    expected_lines.discard("")
+    if not expected_lines:
+        return None
+    # Results are ranked best first, so the first match is this lever's best scenario.
+    for result in duty_sweep.results:
+        if _normalize_line_id(result.scenario.line_id) in expected_lines:
+            if result.delta_pct is None:
+                return None
+            return round(max(0.0, -result.delta_pct), 4)
+    return None
+
+
+def _dossier_category(operator_category: str) -> str:
+    return _OPERATOR_DOSSIER_CATEGORIES.get(operator_category, operator_category)
+
+
+def _normalize_line_id(line_id: str) -> str:
+    return "".join(char for char in line_id if char.isalnum())
+
+
 def _plausibility_penalty(candidate: MutationCandidate) -> float:
     penalties: list[float] = []
     max_material = candidate.bounds.max_material_delta or 0.0
@@ -237,6 +292,12 @@ def _score_sequence(savings: LeverSavingsEstimate) -> float:
     return round(score, 6)
 
 
+def _cap_duty_sweep(duty_sweep: DutySweepResult | None) -> DutySweepResult | None:
+    if duty_sweep is None:
+        return None
+    return duty_sweep.model_copy(update={"results": duty_sweep.results[:MAX_DUTY_SCENARIOS]})
+
+
 def _sequence_key(sequence: list[LeverSequenceStep]) -> str:
     return "|".join(step.operator_id for step in sequence)
 
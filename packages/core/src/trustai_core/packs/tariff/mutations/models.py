@@ -4,6 +4,8 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from trustai_core.duty.scenarios import DutySweepResult
+
 
 class ProductComponent(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -167,3 +169,4 @@ class LeverProof(BaseModel):
     selected_levers: list[SelectedLever]
     search_summary: SearchSummary | None = None
     rejected_sequences: list[RejectedSequence] = Field(default_factory=list)
+    duty_sweep: DutySweepResult | None = None
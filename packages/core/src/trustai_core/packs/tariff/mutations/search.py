@@ -18,6 +18,7 @@ from trustai_core.packs.tariff.mutations.models import (
 )
 from trustai_core.packs.tariff.mutations.operators import MutationOperator
 from trustai_core.packs.tariff.mutations.utils import apply_diff
+from trustai_core.utils.events import emit_event
 
 
 @dataclass(frozen=True)
@@ -207,6 +208,14 @@ def run_beam_search(
                 next_candidates.append(sequence_candidate)
 
         frontier = _top_beam(next_candidates, beam_width)
+        emit_event(
+            "lever_search",
+            depth=depth,
+            visited=visited,
+            expanded=expanded,
+            pruned=pruned,
+            accepted_sequences=len(sequences),
+        )
         if not frontier:
             break
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
@@ -10,11 +12,12 @@ import orjson
 from pydantic import ValidationError
 
 from trustai_core.llm.base import LLMClient, LLMError
+from trustai_core.llm.streaming import complete_json_streaming, streaming_enabled
 from trustai_core.packs.registry import PackContext, register_pack
 from trustai_core.packs.tariff.evidence import (
     EvidenceSource,
-    TariffEvidenceRetriever,
     TariffEvidenceStore,
+    get_evidence_retriever,
 )
 from trustai_core.packs.tariff.gates import run_citation_gate, run_missing_evidence_gate
 from trustai_core.packs.tariff.gates.citation_gate import collect_citations
@@ -39,11 +42,18 @@ from trustai_core.packs.tariff.models import (
 )
 from trustai_core.packs.tariff.mutations.engine import build_lever_proof, parse_product_dossier
 from trustai_core.packs.tariff.mutations.search import SearchConfig
+from trustai_core.packs.tariff.pipeline import (
+    LOCAL_CRITIQUE,
+    cancel_revision,
+    critique_while_revising,
+    resolve_pipeline_mode,
+)
 from trustai_core.packs.tariff.prompts import (
     build_tariff_critic_prompt,
     build_tariff_proposal_prompt,
     build_tariff_revision_prompt,
 )
+from trustai_core.utils.events import emit_event
 from trustai_core.utils.hashing import sha256_canonical_json
 
 TARIFF_PACK_VERSION = "0.1"
@@ -72,6 +82,7 @@ class TariffOptions:
     lever_search_depth: int = 2
     lever_beam_width: int = 4
     lever_max_expansions: int = 40
+    pipeline: str = "off"
 
 
 class TariffPack:
@@ -121,50 +132,82 @@ class TariffPack:
         feedback: str | None = None
         previous_dossier: TariffDossier | None = None
         candidate_chapters: list[str] = []
+        next_dossier: asyncio.Task[TariffDossier] | None = None
 
         try:
             for i in range(1, resolved_options.max_iters + 1):
-                if dossier and feedback:
-                    prompt = build_tariff_revision_prompt(
-                        input_text,
-                        dossier,
-                        critic_outputs[-1].model_dump(),
-                        mismatch_report,
-                        evidence_bundle,
-                        _tariff_dossier_schema(),
-                    )
+                if next_dossier is not None:
+                    dossier = await next_dossier
+                    next_dossier = None
                 else:
-                    prompt = build_tariff_proposal_prompt(
-                        input_text,
-                        feedback,
-                        evidence_bundle,
-                        _tariff_dossier_schema(),
-                    )
-                dossier = await router.proposer.complete_tariff(prompt)
+                    if dossier and feedback:
+                        prompt = build_tariff_revision_prompt(
+                            input_text,
+                            dossier,
+                            critic_outputs[-1].model_dump(),
+                            mismatch_report,
+                            evidence_bundle,
+                            _tariff_dossier_schema(),
+                        )
+                    else:
+                        prompt = build_tariff_proposal_prompt(
+                            input_text,
+                            feedback,
+                            evidence_bundle,
+                            _tariff_dossier_schema(),
+                        )
+                    dossier = await router.proposer.complete_tariff(prompt)
                 proposal_history.append(dossier)
                 candidate_chapters = _resolve_candidate_chapters(dossier, evidence_bundle)
                 evidence_bundle = _ensure_candidate_coverage(
                     evidence_bundle,
                     candidate_chapters,
                 )
-                critique = await router.critic.complete_critique(
-                    build_tariff_critic_prompt(
-                        input_text,
-                        dossier,
-                        evidence_bundle,
-                        _tariff_critique_schema(),
-                    )
+                critic_prompt = build_tariff_critic_prompt(
+                    input_text,
+                    dossier,
+                    evidence_bundle,
+                    _tariff_critique_schema(),
                 )
-                iteration, previous_bundle, mismatch_report = _evaluate_iteration(
+                evaluate = partial(
+                    _evaluate_iteration,
                     i=i,
                     dossier=dossier,
-                    critique=critique,
                     previous_bundle=previous_bundle,
                     previous_dossier=previous_dossier,
                     threshold=resolved_options.threshold,
                     min_mutations=resolved_options.min_mutations,
                     evidence_bundle=evidence_bundle,
                 )
+                local_verdict = None
+                if resolved_options.pipeline != "off":
+                    local_verdict = evaluate(critique=LOCAL_CRITIQUE)
+                    if local_verdict[0].accepted:
+                        local_verdict = None
+                if local_verdict is None:
+                    critique = await router.critic.complete_critique(critic_prompt)
+                    iteration, previous_bundle, mismatch_report = evaluate(critique=critique)
+                elif resolved_options.pipeline == "skip_critic":
+                    critique = LOCAL_CRITIQUE
+                    iteration, previous_bundle, mismatch_report = local_verdict
+                else:
+                    revision = None
+                    if i < resolved_options.max_iters:
+                        revision = router.proposer.complete_tariff(
+                            build_tariff_revision_prompt(
+                                input_text,
+                                dossier,
+                                LOCAL_CRITIQUE.model_dump(),
+                                local_verdict[2],
+                                evidence_bundle,
+                                _tariff_dossier_schema(),
+                            )
+                        )
+                    critique, next_dossier = await critique_while_revising(
+                        router.critic.complete_critique(critic_prompt),
+                        revision,
+                    )
+                    iteration, previous_bundle, mismatch_report = evaluate(critique=critique)
                 iterations.append(iteration)
                 critic_outputs.append(critique)
                 feedback = iteration.feedback_text
@@ -179,6 +222,8 @@ class TariffPack:
                 f"LLM error: {exc}",
                 evidence_bundle=evidence_bundle,
             )
+        finally:
+            await cancel_revision(next_dossier)
 
         final_answer = _format_tariff_report(dossier) if dossier else None
         explain = _build_explain(iterations)
@@ -361,21 +406,29 @@ class TariffLLM:
         self.client = client
 
     async def complete_tariff(self, prompt: str) -> TariffDossier:
-        payload = await _complete_json(self.client, prompt)
+        payload = await _complete_json(self.client, prompt, _tariff_dossier_schema())
         try:
             return TariffDossier.model_validate(payload)
         except ValidationError as exc:
             raise LLMError(f"Tariff proposer returned invalid JSON: {exc}") from exc
 
     async def complete_critique(self, prompt: str) -> TariffCritique:
-        payload = await _complete_json(self.client, prompt)
+        payload = await _complete_json(self.client, prompt, _tariff_critique_schema())
         try:
             return TariffCritique.model_validate(payload)
         except ValidationError as exc:
             raise LLMError(f"Tariff critic returned invalid JSON: {exc}") from exc
 
 
-async def _complete_json(client: LLMClient, prompt: str) -> dict[str, Any]:
+async def _complete_json(
+    client: LLMClient,
+    prompt: str,
+    schema: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    if schema is not None and streaming_enabled():
+        payload = await complete_json_streaming(client, prompt, schema)
+        if payload is not None:
+            return payload
     try:
         payload = await client.complete_json(prompt, {})
         if isinstance(payload, dict):
@@ -402,7 +455,7 @@ def _parse_json(content: str) -> dict[str, Any]:
 
 def _resolve_options(options: dict[str, object] | None) -> TariffOptions:
     if not options:
-        return TariffOptions()
+        return TariffOptions(pipeline=resolve_pipeline_mode())
     max_iters = int(options.get("max_iters") or 4)
     max_iters = min(max_iters, TARIFF_MAX_ITERS_CAP)
     threshold = float(options.get("threshold") or TARIFF_THRESHOLD_DEFAULT)
@@ -424,6 +477,7 @@ def _resolve_options(options: dict[str, object] | None) -> TariffOptions:
     lever_search_depth = int(options.get("lever_search_depth") or 2)
     lever_beam_width = int(options.get("lever_beam_width") or 4)
     lever_max_expansions = int(options.get("lever_max_expansions") or 40)
+    pipeline = resolve_pipeline_mode(options.get("pipeline"))
     return TariffOptions(
         max_iters=max_iters,
         threshold=threshold,
@@ -435,6 +489,7 @@ def _resolve_options(options: dict[str, object] | None) -> TariffOptions:
         lever_search_depth=lever_search_depth,
         lever_beam_width=lever_beam_width,
         lever_max_expansions=lever_max_expansions,
+        pipeline=pipeline,
     )
 
 
@@ -555,10 +610,12 @@ def _build_llm_error_result(
     )
 
 
+@lru_cache(maxsize=1)
 def _tariff_dossier_schema() -> dict[str, Any]:
     return TariffDossier.model_json_schema()
 
 
+@lru_cache(maxsize=1)
 def _tariff_critique_schema() -> dict[str, Any]:
     return TariffCritique.model_json_schema()
 
@@ -766,6 +823,14 @@ def _evaluate_iteration(
         citation_gate_result=citation_gate.model_dump(),
         missing_evidence_gate_result=missing_evidence_gate.model_dump(),
     )
+    emit_event(
+        "iteration",
+        i=i,
+        score=iteration.score,
+        accepted=accepted,
+        rejected_because=rejected_because,
+        hts_code=dossier.baseline.hts_code,
+    )
     return iteration, hdc_bundle, mismatch_report
 
 
@@ -1207,8 +1272,7 @@ def _build_evidence_bundle(
     input_text: str,
     options: TariffOptions,
 ) -> list[EvidenceSource]:
-    store = TariffEvidenceStore()
-    retriever = TariffEvidenceRetriever(store)
+    retriever = get_evidence_retriever()
     bundle = retriever.retrieve(
         input_text,
         candidate_chapters=options.candidate_chapters,
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Awaitable
+
+from trustai_core.packs.tariff.models import TariffCritique, TariffDossier
+
+PIPELINE_MODES = ("off", "skip_critic", "speculative")
+
+LOCAL_CRITIQUE = TariffCritique(
+    unsupported=[],
+    missing=[],
+    conflicts=[],
+    suggested_fixes=[],
+    revised_questions_for_user=[],
+)
+
+
+def resolve_pipeline_mode(value: object | None = None) -> str:
+    mode = str(value or os.getenv("TRUSTAI_TARIFF_PIPELINE") or "off").strip().lower()
+    if mode not in PIPELINE_MODES:
+        raise ValueError(f"pipeline must be one of: {', '.join(PIPELINE_MODES)}")
+    return mode
+
+
+async def critique_while_revising(
+    critique: Awaitable[TariffCritique],
+    revision: Awaitable[TariffDossier] | None,
+) -> tuple[TariffCritique, asyncio.Task[TariffDossier] | None]:
+    revision_task = asyncio.ensure_future(revision) if revision is not None else None
+    try:
+        return await critique, revision_task
+    except BaseException:
+        await cancel_revision(revision_task)
+        raise
+
+
+async def cancel_revision(task: asyncio.Task[TariffDossier] | None) -> None:
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except (asyncio.CancelledError, Exception):
+        pass
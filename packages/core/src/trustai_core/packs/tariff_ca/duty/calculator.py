@@ -20,6 +20,9 @@ class CADutyCalculator:
         self._layers = CADutyLayers(self._root)
         self._programs = CAPreferencePrograms(self._root)
 
+    def has_line(self, line_id: str) -> bool:
+        return line_id in self._base_rates
+
     def calculate(
         self,
         line_id: str,
@@ -4,14 +4,14 @@ import os
 from datetime import date
 from pathlib import Path
 
-from trustai_core.duty.layers import evaluate_layer_rules, load_layer_rules, parse_effective_date
+from trustai_core.duty.layers import get_layer_snapshot_cache, parse_effective_date
 from trustai_core.duty.models import AppliedDutyLayer
 
 
 class USDutyLayers:
     def __init__(self, root: Path | None = None) -> None:
         self._root = root or _default_rates_root()
-        self._rules = load_layer_rules(self._root / "additional_duties.json")
+        self._snapshots = get_layer_snapshot_cache(self._root / "additional_duties.json")
 
     def evaluate(
         self,
@@ -20,7 +20,7 @@ class USDutyLayers:
         effective_date: str | None,
     ) -> list[AppliedDutyLayer]:
         resolved = parse_effective_date(effective_date, fallback=date.today())
-        return evaluate_layer_rules(self._rules, origin_country, line_id, resolved)
+        return self._snapshots.evaluate(origin_country, line_id, resolved)
 
 
 def _default_rates_root() -> Path:
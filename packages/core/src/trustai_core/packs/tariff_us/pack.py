@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
@@ -10,11 +12,12 @@ import orjson
 from pydantic import ValidationError
 
 from trustai_core.llm.base import LLMClient, LLMError
+from trustai_core.llm.streaming import complete_json_streaming, streaming_enabled
 from trustai_core.packs.registry import PackContext, register_pack
 from trustai_core.packs.tariff.evidence import (
     EvidenceSource,
-    TariffEvidenceRetriever,
     TariffEvidenceStore,
+    get_evidence_retriever,
 )
 from trustai_core.packs.tariff.gates import run_citation_gate, run_missing_evidence_gate
 from trustai_core.packs.tariff.gates.citation_gate import collect_citations
@@ -29,6 +32,12 @@ from trustai_core.packs.tariff.hdc import (
 )
 from trustai_core.packs.tariff.gri import validate_gri_sequence
 from trustai_core.duty.models import DutyBreakdown, DutyFlow
+from trustai_core.duty.scenarios import (
+    DutyScenario,
+    DutySweepResult,
+    build_scenario_grid,
+    sweep_duty_scenarios,
+)
 from trustai_core.packs.tariff.models import (
     GriStep,
     GriTrace,
@@ -41,12 +50,19 @@ from trustai_core.packs.tariff.models import (
 )
 from trustai_core.packs.tariff.mutations.engine import build_lever_proof, parse_product_dossier
 from trustai_core.packs.tariff.mutations.search import SearchConfig
+from trustai_core.packs.tariff.pipeline import (
+    LOCAL_CRITIQUE,
+    cancel_revision,
+    critique_while_revising,
+    resolve_pipeline_mode,
+)
 from trustai_core.packs.tariff_us.duty.calculator import USDutyCalculator
 from trustai_core.packs.tariff_us.prompts import (
     build_tariff_critic_prompt,
     build_tariff_proposal_prompt,
     build_tariff_revision_prompt,
 )
+from trustai_core.utils.events import emit_event
 from trustai_core.utils.hashing import sha256_canonical_json
 
 TARIFF_PACK_VERSION = "0.2-us"
@@ -75,6 +91,7 @@ class TariffOptions:
     lever_search_depth: int = 2
     lever_beam_width: int = 4
     lever_max_expansions: int = 40
+    pipeline: str = "off"
 
 
 class TariffPack:
@@ -85,13 +102,16 @@ class TariffPack:
         self.fingerprint = sha256_canonical_json(
             {"pack": self.name, "version": TARIFF_PACK_VERSION}
         )
+        self._duty_calculator: USDutyCalculator | None = None
 
     async def run(self, input_text: str, options: dict[str, object] | None) -> TariffVerificationResult:
         resolved_options = _resolve_options(options)
         evidence_bundle = _build_evidence_bundle(input_text, resolved_options)
         product_dossier = parse_product_dossier(input_text)
         flow = _resolve_flow(input_text)
-        duty_calculator = USDutyCalculator()
+        if self._duty_calculator is None:
+            self._duty_calculator = USDutyCalculator()
+        duty_calculator = self._duty_calculator
         if self._context.llm_mode != "live":
             fixture = _load_fixture()
             if fixture:
@@ -130,56 +150,91 @@ class TariffPack:
         feedback: str | None = None
         previous_dossier: TariffDossier | None = None
         candidate_chapters: list[str] = []
+        next_dossier: asyncio.Task[TariffDossier] | None = None
+        duty_sweep: DutySweepResult | None = None
 
         try:
             for i in range(1, resolved_options.max_iters + 1):
-                if dossier and feedback:
-                    prompt = build_tariff_revision_prompt(
-                        input_text,
-                        dossier,
-                        critic_outputs[-1].model_dump(),
-                        mismatch_report,
-                        evidence_bundle,
-                        _tariff_dossier_schema(),
-                    )
+                if next_dossier is not None:
+                    dossier = await next_dossier
+                    next_dossier = None
                 else:
-                    prompt = build_tariff_proposal_prompt(
-                        input_text,
-                        feedback,
-                        evidence_bundle,
-                        _tariff_dossier_schema(),
-                    )
-                dossier = await router.proposer.complete_tariff(prompt)
+                    if dossier and feedback:
+                        prompt = build_tariff_revision_prompt(
+                            input_text,
+                            dossier,
+                            critic_outputs[-1].model_dump(),
+                            mismatch_report,
+                            evidence_bundle,
+                            _tariff_dossier_schema(),
+                        )
+                    else:
+                        prompt = build_tariff_proposal_prompt(
+                            input_text,
+                            feedback,
+                            evidence_bundle,
+                            _tariff_dossier_schema(),
+                        )
+                    dossier = await router.proposer.complete_tariff(prompt)
                 dossier = _apply_duty_breakdowns(
                     dossier,
                     flow,
                     duty_calculator,
                     system="HTSUS",
                 )
+                duty_sweep = _build_duty_sweep(dossier, flow, duty_calculator)
                 proposal_history.append(dossier)
                 candidate_chapters = _resolve_candidate_chapters(dossier, evidence_bundle)
                 evidence_bundle = _ensure_candidate_coverage(
                     evidence_bundle,
                     candidate_chapters,
                 )
-                critique = await router.critic.complete_critique(
-                    build_tariff_critic_prompt(
-                        input_text,
-                        dossier,
-                        evidence_bundle,
-                        _tariff_critique_schema(),
-                    )
+                critic_prompt = build_tariff_critic_prompt(
+                    input_text,
+                    dossier,
+                    evidence_bundle,
+                    _tariff_critique_schema(),
                 )
-                iteration, previous_bundle, mismatch_report = _evaluate_iteration(
+                evaluate = partial(
+                    _evaluate_iteration,
                     i=i,
                     dossier=dossier,
-                    critique=critique,
                     previous_bundle=previous_bundle,
                     previous_dossier=previous_dossier,
                     threshold=resolved_options.threshold,
                     min_mutations=resolved_options.min_mutations,
                     evidence_bundle=evidence_bundle,
+                    duty_sweep=duty_sweep,
                 )
+                local_verdict = None
+                if resolved_options.pipeline != "off":
+                    local_verdict = evaluate(critique=LOCAL_CRITIQUE)
+                    if local_verdict[0].accepted:
+                        local_verdict = None
+                if local_verdict is None:
+                    critique = await router.critic.complete_critique(critic_prompt)
+                    iteration, previous_bundle, mismatch_report = evaluate(critique=critique)
+                elif resolved_options.pipeline == "skip_critic":
+                    critique = LOCAL_CRITIQUE
+                    iteration, previous_bundle, mismatch_report = local_verdict
+                else:
+                    revision = None
+                    if i < resolved_options.max_iters:
+                        revision = router.proposer.complete_tariff(
+                            build_tariff_revision_prompt(
+                                input_text,
+                                dossier,
+                                LOCAL_CRITIQUE.model_dump(),
+                                local_verdict[2],
+                                evidence_bundle,
+                                _tariff_dossier_schema(),
+                            )
+                        )
+                    critique, next_dossier = await critique_while_revising(
+                        router.critic.complete_critique(critic_prompt),
+                        revision,
+                    )
+                    iteration, previous_bundle, mismatch_report = evaluate(critique=critique)
                 iterations.append(iteration)
                 critic_outputs.append(critique)
                 feedback = iteration.feedback_text
@@ -195,6 +250,8 @@ class TariffPack:
                 evidence_bundle=evidence_bundle,
                 flow=flow,
             )
+        finally:
+            await cancel_revision(next_dossier)
 
         final_answer = _format_tariff_report(dossier) if dossier else None
         explain = _build_explain(iterations)
@@ -210,6 +267,7 @@ class TariffPack:
                 beam_width=resolved_options.lever_beam_width,
                 max_expansions=resolved_options.lever_max_expansions,
             ),
+            duty_sweep=duty_sweep,
         )
         lever_payload = lever_proof.model_dump(by_alias=True)
         proof_payload = _build_proof_payload(
@@ -281,6 +339,7 @@ class TariffPack:
         mismatch_report = ""
         previous_dossier: TariffDossier | None = None
         candidate_chapters: list[str] = []
+        duty_sweep: DutySweepResult | None = None
 
         for i in range(1, options.max_iters + 1):
             proposal_payload = proposals[min(i - 1, len(proposals) - 1)]
@@ -292,6 +351,7 @@ class TariffPack:
                 duty_calculator,
                 system="HTSUS",
             )
+            duty_sweep = _build_duty_sweep(dossier, flow, duty_calculator)
             proposal_history.append(dossier)
             candidate_chapters = _resolve_candidate_chapters(dossier, evidence_bundle)
             evidence_bundle = _ensure_candidate_coverage(
@@ -308,6 +368,7 @@ class TariffPack:
                 threshold=options.threshold,
                 min_mutations=options.min_mutations,
                 evidence_bundle=evidence_bundle,
+                duty_sweep=duty_sweep,
             )
             iterations.append(iteration)
             critic_outputs.append(critique)
@@ -333,6 +394,7 @@ class TariffPack:
                 beam_width=options.lever_beam_width,
                 max_expansions=options.lever_max_expansions,
             ),
+            duty_sweep=duty_sweep,
         )
         lever_payload = lever_proof.model_dump(by_alias=True)
         proof_payload = _build_proof_payload(
@@ -390,21 +452,29 @@ class TariffLLM:
         self.client = client
 
     async def complete_tariff(self, prompt: str) -> TariffDossier:
-        payload = await _complete_json(self.client, prompt)
+        payload = await _complete_json(self.client, prompt, _tariff_dossier_schema())
         try:
             return TariffDossier.model_validate(payload)
         except ValidationError as exc:
             raise LLMError(f"Tariff proposer returned invalid JSON: {exc}") from exc
 
     async def complete_critique(self, prompt: str) -> TariffCritique:
-        payload = await _complete_json(self.client, prompt)
+        payload = await _complete_json(self.client, prompt, _tariff_critique_schema())
         try:
             return TariffCritique.model_validate(payload)
         except ValidationError as exc:
             raise LLMError(f"Tariff critic returned invalid JSON: {exc}") from exc
 
 
-async def _complete_json(client: LLMClient, prompt: str) -> dict[str, Any]:
+async def _complete_json(
+    client: LLMClient,
+    prompt: str,
+    schema: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    if schema is not None and streaming_enabled():
+        payload = await complete_json_streaming(client, prompt, schema)
+        if payload is not None:
+            return payload
     try:
         payload = await client.complete_json(prompt, {})
         if isinstance(payload, dict):
@@ -431,7 +501,7 @@ def _parse_json(content: str) -> dict[str, Any]:
 
 def _resolve_options(options: dict[str, object] | None) -> TariffOptions:
     if not options:
-        return TariffOptions()
+        return TariffOptions(pipeline=resolve_pipeline_mode())
     max_iters = int(options.get("max_iters") or 4)
     max_iters = min(max_iters, TARIFF_MAX_ITERS_CAP)
     threshold = float(options.get("threshold") or TARIFF_THRESHOLD_DEFAULT)
@@ -453,6 +523,7 @@ def _resolve_options(options: dict[str, object] | None) -> TariffOptions:
     lever_search_depth = int(options.get("lever_search_depth") or 2)
     lever_beam_width = int(options.get("lever_beam_width") or 4)
     lever_max_expansions = int(options.get("lever_max_expansions") or 40)
+    pipeline = resolve_pipeline_mode(options.get("pipeline"))
     return TariffOptions(
         max_iters=max_iters,
         threshold=threshold,
@@ -464,6 +535,7 @@ def _resolve_options(options: dict[str, object] | None) -> TariffOptions:
         lever_search_depth=lever_search_depth,
         lever_beam_width=lever_beam_width,
         lever_max_expansions=lever_max_expansions,
+        pipeline=pipeline,
     )
 
 
@@ -587,10 +659,12 @@ def _build_llm_error_result(
     )
 
 
+@lru_cache(maxsize=1)
 def _tariff_dossier_schema() -> dict[str, Any]:
     return TariffDossier.model_json_schema()
 
 
+@lru_cache(maxsize=1)
 def _tariff_critique_schema() -> dict[str, Any]:
     return TariffCritique.model_json_schema()
 
@@ -670,6 +744,33 @@ def generate_perturbations(
                     constraints=constraints_list,
                 )
             )
+    duty_sweep = product_facts.get("duty_sweep")
+    best_scenario = duty_sweep.best() if duty_sweep is not None else None
+    if (
+        best_scenario is not None
+        and best_scenario.delta_pct is not None
+        and best_scenario.delta_pct < 0
+    ):
+        line_id = best_scenario.scenario.line_id
+        candidates.append(
+            WhatIfCandidate(
+                mutation_id="whatif_line_shift",
+                change=f"Lawful redesign so the product classifies under {line_id}.",
+                rationale=(
+                    f"Duty scenario sweep computes {best_scenario.total_rate_pct:.2f}% "
+                    f"for {line_id} under the same flow."
+                ),
+                expected_heading_shift=f"Shift to {line_id}.",
+                # Sweep deltas are percentage points; what-if deltas are fractions.
+                estimated_duty_delta=round(best_scenario.delta_pct / 100, 6),
+                legal_risks=[
+                    "Requires lawful redesign and documented BOM changes.",
+                    "Classification must be supported by notes and rulings.",
+                ],
+                citations_required=True,
+                constraints=constraints_list,
+            )
+        )
     candidates.append(
         WhatIfCandidate(
             mutation_id="whatif_documentation_upgrade",
@@ -705,6 +806,7 @@ def _evaluate_iteration(
     threshold: float,
     min_mutations: int,
     evidence_bundle: list[EvidenceSource],
+    duty_sweep: DutySweepResult | None = None,
 ) -> tuple[TariffVerifyIteration, list[int], str]:
     rejected_because: list[str] = []
     gate = _gate_dossier(dossier, min_mutations)
@@ -765,7 +867,7 @@ def _evaluate_iteration(
         rejected_because,
         critique,
         mismatch_report,
-        _build_what_if_feedback(dossier, rejected_because),
+        _build_what_if_feedback(dossier, rejected_because, duty_sweep),
         citation_gate.revision_guidance,
         missing_evidence_gate.revision_guidance,
     )
@@ -798,6 +900,14 @@ def _evaluate_iteration(
         citation_gate_result=citation_gate.model_dump(),
         missing_evidence_gate_result=missing_evidence_gate.model_dump(),
     )
+    emit_event(
+        "iteration",
+        i=i,
+        score=iteration.score,
+        accepted=accepted,
+        rejected_because=rejected_because,
+        hts_code=dossier.baseline.hts_code,
+    )
     return iteration, hdc_bundle, mismatch_report
 
 
@@ -1055,13 +1165,18 @@ def _build_feedback_text(
     return "\n".join(parts)
 
 
-def _build_what_if_feedback(dossier: TariffDossier, rejected_because: list[str]) -> str | None:
+def _build_what_if_feedback(
+    dossier: TariffDossier,
+    rejected_because: list[str],
+    duty_sweep: DutySweepResult | None = None,
+) -> str | None:
     if "missing_what_if_candidates" not in rejected_because:
         return None
     suggestions = generate_perturbations(
         {
             "composition_table": [item.model_dump() for item in dossier.composition_table],
             "baseline_duty_rate_pct": dossier.baseline.duty_rate_pct,
+            "duty_sweep": duty_sweep,
         },
         dossier.compliance_notes,
     )
@@ -1297,6 +1412,31 @@ def _apply_duty_summary(
     )
 
 
+def _build_duty_sweep(
+    dossier: TariffDossier,
+    flow: DutyFlow,
+    duty_calculator: USDutyCalculator,
+) -> DutySweepResult | None:
+    baseline_line = (dossier.baseline.hts_code or "").strip()
+    if not baseline_line:
+        return None
+    line_ids = [baseline_line, dossier.optimized.hts_code or ""]
+    line_ids.extend(mutation.expected_hts_change or "" for mutation in dossier.mutations)
+    scenarios = build_scenario_grid(
+        line_ids,
+        origins=[flow.origin_country],
+        programs=[flow.preference_program, None],
+        effective_dates=[flow.effective_date],
+    )
+    baseline = DutyScenario(
+        line_id=baseline_line,
+        origin_country=flow.origin_country,
+        preference_program=flow.preference_program,
+        effective_date=flow.effective_date,
+    )
+    return sweep_duty_scenarios(duty_calculator, flow, scenarios, baseline=baseline)
+
+
 def _missing_duty_breakdown(reason: str) -> DutyBreakdown:
     return DutyBreakdown(
         base_rate_pct=0.0,
@@ -1331,8 +1471,7 @@ def _build_evidence_bundle(
     input_text: str,
     options: TariffOptions,
 ) -> list[EvidenceSource]:
-    store = TariffEvidenceStore(_evidence_root())
-    retriever = TariffEvidenceRetriever(store)
+    retriever = get_evidence_retriever(_evidence_root())
     bundle = retriever.retrieve(
         input_text,
         candidate_chapters=options.candidate_chapters,
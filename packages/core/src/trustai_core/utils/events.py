@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+EventSink = Callable[[str, dict[str, Any]], None]
+
+logger = logging.getLogger(__name__)
+
+_EVENT_SINK: ContextVar[EventSink | None] = ContextVar("trustai_event_sink", default=None)
+
+
+@contextmanager
+def event_sink(sink: EventSink | None) -> Iterator[None]:
+    """Routes progress events emitted in this context (and tasks it spawns) to ``sink``."""
+    token = _EVENT_SINK.set(sink)
+    try:
+        yield
+    finally:
+        _EVENT_SINK.reset(token)
+
+
+def emit_event(kind: str, **data: Any) -> None:
+    sink = _EVENT_SINK.get()
+    if sink is None:
+        return
+    try:
+        sink(kind, data)
+    except Exception:  # progress reporting must never break verification
+        logger.warning("event_sink_failed", extra={"kind": kind}, exc_info=True)
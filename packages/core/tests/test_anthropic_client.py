@@ -45,3 +45,31 @@ def test_anthropic_client_prefers_claude_model_env(monkeypatch: pytest.MonkeyPat
     client = AnthropicClient()
 
     assert client.model_id == "claude-3-5-haiku-20241022"
+
+
+@pytest.mark.asyncio
+async def test_anthropic_cache_identity_matches_request_params(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent: dict = {}
+
+    class Messages:
+        async def create(self, **kwargs):
+            sent.update(kwargs)
+            return type("Response", (), {"content": []})()
+
+    class RecordingAnthropic(DummyAnthropic):
+        def __init__(self, api_key: str, timeout: float) -> None:
+            super().__init__(api_key, timeout)
+            self.messages = Messages()
+
+    monkeypatch.setattr("trustai_core.llm.anthropic_client.AsyncAnthropic", RecordingAnthropic)
+    monkeypatch.setenv("CLAUDE_AI_KEY", "test-key")
+    client = AnthropicClient()
+
+    await client._call_model("prompt", client.model_id)
+    identity = client.cache_identity("complete_text")
+
+    assert identity["max_tokens"] == sent["max_tokens"]
+    assert identity["temperature"] == sent["temperature"]
+    assert identity["system"] == sent["system"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import json
@@ -148,6 +149,34 @@ def test_runner_report_structure(tmp_path: Path) -> None:
     assert payload["summary"]["total_cases"] == 2
 
 
+def test_runner_batch_mode_runs_cases_in_one_loop(tmp_path: Path) -> None:
+    (tmp_path / "cases").mkdir()
+    for case_id in ("case_a", "case_b"):
+        payload = _sample_case_payload(case_id)
+        (tmp_path / "cases" / f"{case_id}.json").write_text(json.dumps(payload), encoding="utf-8")
+    loops = set()
+    in_flight = []
+
+    async def _executor(case, mode, fixture_resolver):
+        assert mode == "batch"
+        loops.add(id(asyncio.get_running_loop()))
+        in_flight.append(case.id)
+        await asyncio.sleep(0)
+        assert len(in_flight) == 2
+        result = _fake_result(case.expected.preferred_hts[0])
+        return CaseResult(
+            case=case,
+            score=score_case(case, result),
+            output_summary={"status": result["status"]},
+        )
+
+    report = run_benchmark_suite("tariff", tmp_path / "cases", mode="batch", executor=_executor)
+
+    assert report.mode == "batch"
+    assert report.summary.total_cases == 2
+    assert len(loops) == 1
+
+
 def test_missing_evidence_refusal_scoring() -> None:
     payload = _sample_case_payload("case_missing_evidence")
     payload["expected"]["expected_accept"] = False
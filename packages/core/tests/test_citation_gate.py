@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from trustai_core.packs.tariff.evidence.index import CitationIndex, build_citation_index
 from trustai_core.packs.tariff.evidence.store import TariffEvidenceStore
 from trustai_core.packs.tariff.gates.citation_gate import run_citation_gate
 from trustai_core.packs.tariff.models import (
@@ -272,3 +273,29 @@ def test_citation_gate_passes_with_valid_citations() -> None:
     )
     result = run_citation_gate(dossier, _bundle())
     assert result.ok
+
+
+def test_citation_gate_normalizes_quotes_when_enabled() -> None:
+    dossier = _base_dossier(
+        citations=[
+            TariffCitation(
+                claim_type="hts_classification",
+                claim="HTS classification",
+                source_id="HTS.6404",
+                quote="  FOOTWEAR with outer soles\nof rubber or plastics",
+            )
+        ]
+    )
+    assert not run_citation_gate(dossier, _bundle()).ok
+    assert run_citation_gate(dossier, _bundle(), normalize_quotes=True).ok
+
+
+def test_citation_index_is_reused_per_bundle() -> None:
+    bundle = _bundle()
+    index = build_citation_index(bundle)
+    assert build_citation_index(list(bundle)) is index
+    assert build_citation_index(index) is index
+    assert isinstance(index, CitationIndex)
+    assert index.quote_found("HTS.6404", HTS_QUOTE)
+    assert not index.quote_found("HTS.6404", "not in text")
+    assert not index.quote_found("BAD.SOURCE", HTS_QUOTE)
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from datetime import date
+from pathlib import Path
+
+import orjson
+from trustai_core.duty.layers import DutyLayerSnapshotCache, evaluate_layer_rules, load_layer_rules
 from trustai_core.packs.tariff_ca.duty.layers import CADutyLayers
 from trustai_core.packs.tariff_us.duty.layers import USDutyLayers
 
@@ -26,3 +31,60 @@ def test_ca_surtax_layer_outside_date_range() -> None:
     layers = CADutyLayers()
     applied = layers.evaluate("US", "8413.70", "2024-06-01")
     assert applied == []
+
+
+def _write_rules(path: Path, origins: list[str], effective_to: str | None = None) -> None:
+    payload = [
+        {
+            "layer_id": "TEST.LAYER",
+            "type": "ad_valorem",
+            "pct": 10.0,
+            "match": {"origin_countries": origins, "line_prefixes": ["73.18"]},
+            "effective_from": "2024-01-01",
+            "effective_to": effective_to,
+            "reason": "Test layer",
+        }
+    ]
+    path.write_bytes(orjson.dumps(payload))
+
+
+def test_snapshot_cache_matches_rule_evaluation() -> None:
+    path = Path("storage/packs/tariff_us/rates/additional_duties.json")
+    rules = load_layer_rules(path)
+    cache = DutyLayerSnapshotCache(path)
+    for origin, line_id, effective in [
+        ("CN", "7318.15", date(2024, 6, 1)),
+        ("CN", "8544.11", date(2024, 6, 1)),
+        ("FR", "8413.70", date(2024, 6, 1)),
+        ("CN", "7318.15", date(2010, 1, 1)),
+    ]:
+        assert cache.evaluate(origin, line_id, effective) == evaluate_layer_rules(
+            rules, origin, line_id, effective
+        )
+
+
+def test_snapshot_cache_evicts_oldest_dates(tmp_path: Path) -> None:
+    path = tmp_path / "layers.json"
+    _write_rules(path, ["CN"])
+    cache = DutyLayerSnapshotCache(path, max_dates=2)
+    first = cache.snapshot(date(2024, 1, 1))
+    second = cache.snapshot(date(2024, 1, 2))
+    assert cache.snapshot(date(2024, 1, 1)) is first
+    cache.snapshot(date(2024, 1, 3))
+    assert cache.snapshot(date(2024, 1, 1)) is first
+    assert cache.snapshot(date(2024, 1, 2)) is not second
+
+
+def test_snapshot_cache_reloads_when_rules_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "layers.json"
+    _write_rules(path, ["CN"])
+    cache = DutyLayerSnapshotCache(path)
+    effective = date(2024, 6, 1)
+    applied = cache.evaluate("CN", "7318.15", effective)
+    assert [layer.layer_id for layer in applied] == ["TEST.LAYER"]
+    assert cache.evaluate("MX", "7318.15", effective) == []
+
+    _write_rules(path, ["CN", "MX"], effective_to="2024-12-31")
+
+    applied = cache.evaluate("MX", "7318.15", effective)
+    assert [layer.layer_id for layer in applied] == ["TEST.LAYER"]
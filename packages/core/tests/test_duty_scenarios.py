@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from trustai_core.duty.models import DutyBreakdown, DutyFlow
+from trustai_core.duty.scenarios import DutyScenario, build_scenario_grid, sweep_duty_scenarios
+from trustai_core.packs.tariff_us.duty.calculator import USDutyCalculator
+from trustai_core.packs.tariff_us.pack import generate_perturbations
+
+
+class CountingCalculator:
+    def __init__(self) -> None:
+        self._inner = USDutyCalculator()
+        self.calls = 0
+
+    def has_line(self, line_id: str) -> bool:
+        return self._inner.has_line(line_id)
+
+    def calculate(
+        self,
+        line_id: str,
+        flow: DutyFlow,
+        preference_program: str | None = None,
+    ) -> DutyBreakdown:
+        self.calls += 1
+        return self._inner.calculate(line_id, flow, preference_program)
+
+
+def test_build_scenario_grid_is_cartesian_and_deduped() -> None:
+    scenarios = build_scenario_grid(
+        ["7318.15", "8544.11", "7318.15"],
+        origins=["CN", "MX"],
+        programs=[None, "USMCA", None],
+        effective_dates=["2024-06-01"],
+    )
+    assert len(scenarios) == 8
+    assert len(set(scenarios)) == 8
+    assert scenarios[0] == DutyScenario(
+        line_id="7318.15",
+        origin_country="CN",
+        preference_program=None,
+        effective_date="2024-06-01",
+    )
+
+
+def test_sweep_ranks_by_total_and_reports_delta() -> None:
+    calculator = USDutyCalculator()
+    flow = DutyFlow(importing_country="US", origin_country="CN", effective_date="2024-06-01")
+    baseline = DutyScenario(line_id="7318.15", origin_country="CN", effective_date="2024-06-01")
+    scenarios = build_scenario_grid(
+        ["7318.15", "8544.11", "6402.99"],
+        origins=["CN"],
+        effective_dates=["2024-06-01"],
+    )
+
+    sweep = sweep_duty_scenarios(calculator, flow, scenarios, baseline=baseline)
+
+    assert sweep.baseline is not None
+    assert sweep.baseline.total_rate_pct == 33.0
+    assert [item.scenario.line_id for item in sweep.results] == ["6402.99", "8544.11", "7318.15"]
+    assert sweep.results[0].delta_pct == -28.0
+    assert sweep.best_savings_pct() == 28.0
+    expected = calculator.calculate("8544.11", flow)
+    assert sweep.results[1].breakdown == expected
+
+
+def test_sweep_evaluates_each_scenario_once_and_skips_unknown_lines() -> None:
+    calculator = CountingCalculator()
+    flow = DutyFlow(importing_country="US", origin_country="CN", effective_date="2024-06-01")
+    scenarios = build_scenario_grid(["7318.15", "9999.99"], origins=["CN", "MX"])
+    baseline = scenarios[0]
+
+    sweep = sweep_duty_scenarios(calculator, flow, scenarios + scenarios, baseline=baseline)
+
+    assert calculator.calls == 2
+    assert sweep.evaluated == 2
+    assert sweep.requested == 8
+    assert sweep.unresolved_lines == ["9999.99"]
+    assert {item.scenario.origin_country for item in sweep.results} == {"CN", "MX"}
+
+
+def test_sweep_without_baseline_has_no_deltas() -> None:
+    calculator = USDutyCalculator()
+    flow = DutyFlow(importing_country="US", effective_date="2024-06-01")
+    sweep = sweep_duty_scenarios(calculator, flow, build_scenario_grid(["8413.70"]))
+    assert sweep.baseline is None
+    assert sweep.results[0].delta_pct is None
+    assert sweep.best_savings_pct() is None
+
+
+def test_line_shift_what_if_reports_fractional_delta() -> None:
+    flow = DutyFlow(importing_country="US", origin_country="VN", effective_date="2024-06-01")
+    sweep = sweep_duty_scenarios(
+        USDutyCalculator(),
+        flow,
+        build_scenario_grid(["6404.11.90", "6402.99"], origins=["VN"]),
+        baseline=DutyScenario(line_id="6404.11.90", origin_country="VN"),
+    )
+
+    candidates = generate_perturbations({"duty_sweep": sweep}, [])
+
+    line_shift = next(item for item in candidates if item.mutation_id == "whatif_line_shift")
+    assert sweep.best().delta_pct == -15.0
+    assert line_shift.estimated_duty_delta == -0.15
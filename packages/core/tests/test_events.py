@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import asyncio
+
+from trustai_core.utils.events import emit_event, event_sink
+
+
+def test_event_sink_scopes_and_propagates_to_tasks() -> None:
+    received: list[tuple[str, dict]] = []
+
+    async def _emit_from_task() -> None:
+        emit_event("iteration", i=2)
+
+    async def _worker() -> None:
+        await asyncio.create_task(_emit_from_task())
+
+    emit_event("ignored", i=0)
+    with event_sink(lambda kind, data: received.append((kind, data))):
+        emit_event("iteration", i=1)
+        asyncio.run(_worker())
+    emit_event("ignored", i=3)
+
+    assert received == [("iteration", {"i": 1}), ("iteration", {"i": 2})]
+
+
+def test_failing_sink_does_not_raise() -> None:
+    def _sink(kind: str, data: dict) -> None:
+        raise RuntimeError("bus down")
+
+    with event_sink(_sink):
+        emit_event("iteration", i=1)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from trustai_core.packs.tariff.gri import compile_gri_trace, validate_gri_sequence
+from trustai_core.packs.tariff.models import GriStep, GriStepResult, GriTrace
+
+
+def _trace(
+    applied: set[GriStep],
+    rejected: set[GriStep] | None = None,
+    step_vector: list[bool] | None = None,
+    steps: list[GriStep] | None = None,
+) -> GriTrace:
+    ordered = steps or list(GriStep)
+    if rejected is None:
+        rejected = {step for step in GriStep if step not in applied}
+    if step_vector is None:
+        step_vector = [step in applied for step in ordered]
+    results = [
+        GriStepResult(
+            step=step,
+            applied=step in applied,
+            reasoning="Reasoning.",
+            citations=[],
+            rejected_because=["Not applicable"] if step in rejected else [],
+        )
+        for step in ordered
+    ]
+    return GriTrace(
+        steps=results,
+        final_step_used=min(applied, key=list(GriStep).index) if applied else None,
+        sequence_ok=True,
+        violations=[],
+        step_vector=step_vector,
+    )
+
+
+def test_valid_sequence_has_no_violations() -> None:
+    assert validate_gri_sequence(_trace({GriStep.GRI_3})) == (True, [])
+
+
+def test_missing_trace_is_rejected() -> None:
+    assert validate_gri_sequence(None) == (False, ["missing_gri_trace"])
+
+
+def test_sequence_violations_match_step_labels() -> None:
+    trace = _trace({GriStep.GRI_3, GriStep.GRI_5}, rejected={GriStep.GRI_2})
+    ok, violations = validate_gri_sequence(trace)
+    assert not ok
+    assert violations == [
+        f"Sequence Violation: {GriStep.GRI_3} used before rejecting {GriStep.GRI_1}",
+        f"Sequence Violation: {GriStep.GRI_5} applied after {GriStep.GRI_3}",
+    ]
+
+
+def test_ordering_and_step_vector_violations() -> None:
+    steps = [GriStep.GRI_2, GriStep.GRI_1, *list(GriStep)[2:]]
+    trace = _trace({GriStep.GRI_2}, steps=steps, step_vector=[True, False, False])
+    ok, violations = validate_gri_sequence(trace)
+    assert not ok
+    assert violations == [
+        "GRI steps must be ordered GRI_1 through GRI_6",
+        "Step vector must include 6 entries",
+        "Step vector does not match applied steps",
+    ]
+
+
+def test_compiled_trace_validates_like_raw_trace() -> None:
+    trace = _trace({GriStep.GRI_1, GriStep.GRI_4}, step_vector=[True] * 6)
+    compiled = compile_gri_trace(trace)
+    assert compiled is not None
+    assert compiled.applied_mask == 0b1001
+    assert validate_gri_sequence(compiled) == validate_gri_sequence(trace)
+    ok, violations = validate_gri_sequence(compiled)
+    violations.append("mutated")
+    assert validate_gri_sequence(compiled) == (ok, violations[:-1])
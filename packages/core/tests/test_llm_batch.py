@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from trustai_core.llm.base import LLMError
+from trustai_core.llm.batch import (
+    BatchConfig,
+    BatchLLMClient,
+    BatchRequest,
+    LocalBatchBackend,
+    OpenAIBatchBackend,
+)
+
+FAST = BatchConfig(max_batch_size=100, flush_interval_s=0.01, poll_interval_s=0.0)
+
+
+def _handler(method: str, prompt: str) -> str:
+    if prompt == "boom":
+        raise RuntimeError("request rejected")
+    if method == "complete_json":
+        return orjson.dumps({"echo": prompt}).decode()
+    return prompt.upper()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_batch() -> None:
+    backend = LocalBatchBackend(_handler, polls_until_ready=3)
+    client = BatchLLMClient(backend, FAST)
+
+    results = await asyncio.gather(
+        client.complete_text("a"),
+        client.complete_json("b", {}),
+        client.complete_text("c"),
+    )
+
+    assert results == ["A", {"echo": "b"}, "C"]
+    assert client.batches_submitted == 1
+    assert len(backend.submitted[0]) == 3
+
+
+@pytest.mark.asyncio
+async def test_request_errors_only_fail_their_caller() -> None:
+    client = BatchLLMClient(LocalBatchBackend(_handler), FAST)
+
+    ok, failed = await asyncio.gather(
+        client.complete_text("fine"),
+        client.complete_text("boom"),
+        return_exceptions=True,
+    )
+
+    assert ok == "FINE"
+    assert isinstance(failed, LLMError)
+    assert "request rejected" in str(failed)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting_for_interval() -> None:
+    backend = LocalBatchBackend(_handler)
+    config = BatchConfig(max_batch_size=2, flush_interval_s=60.0, poll_interval_s=0.0)
+    client = BatchLLMClient(backend, config)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(client.complete_text("x"), client.complete_text("y")),
+        timeout=1.0,
+    )
+
+    assert results == ["X", "Y"]
+    assert [len(batch) for batch in backend.submitted] == [2]
+
+
+class _FakeOpenAI:
+    def __init__(self) -> None:
+        self.uploaded: bytes = b""
+        self.statuses = ["in_progress", "completed"]
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve)
+
+    async def _create_file(self, file, purpose: str) -> object:
+        assert purpose == "batch"
+        self.uploaded = file[1]
+        return SimpleNamespace(id="file-in")
+
+    async def _create_batch(self, **kwargs: object) -> object:
+        assert kwargs["input_file_id"] == "file-in"
+        return SimpleNamespace(id="batch-1")
+
+    async def _retrieve(self, batch_id: str) -> object:
+        return SimpleNamespace(
+            status=self.statuses.pop(0),
+            output_file_id="file-out",
+            error_file_id="file-err",
+        )
+
+    async def _content(self, file_id: str) -> object:
+        if file_id == "file-err":
+            line = {"custom_id": "req-2", "error": {"message": "bad request"}}
+            return SimpleNamespace(text=orjson.dumps(line).decode())
+        line = {
+            "custom_id": "req-1",
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": '{"ok": true}'}}]},
+            },
+        }
+        return SimpleNamespace(text=orjson.dumps(line).decode() + "\n")
+
+
+@pytest.mark.asyncio
+async def test_openai_backend_uploads_jsonl_and_parses_result_files() -> None:
+    fake = _FakeOpenAI()
+    backend = OpenAIBatchBackend(fake, "gpt-test")
+    body = backend.build_body("complete_json", "prompt")
+
+    batch_id = await backend.submit([BatchRequest("req-1", body), BatchRequest("req-2", body)])
+    assert await backend.poll(batch_id) is None
+    results = await backend.poll(batch_id)
+
+    lines = [orjson.loads(line) for line in fake.uploaded.splitlines()]
+    assert [line["custom_id"] for line in lines] == ["req-1", "req-2"]
+    assert lines[0]["url"] == "/v1/chat/completions"
+    assert lines[0]["body"]["response_format"] == {"type": "json_object"}
+    assert results["req-1"].text == '{"ok": true}'
+    assert results["req-2"].error == "bad request"
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from trustai_core.llm.cache import CachedLLMClient, LLMResponseCache, build_cache_key
+from trustai_core.llm.streaming import complete_json_streaming
+
+
+class CountingClient:
+    def __init__(self, temperature: float = 0) -> None:
+        self.json_calls = 0
+        self.text_calls = 0
+        self.temperature = temperature
+
+    @property
+    def model_id(self) -> str:
+        return "test-model"
+
+    def cache_identity(self, method: str) -> dict[str, object]:
+        return {"provider": "test", "model": self.model_id, "temperature": self.temperature}
+
+    async def complete_json(self, prompt: str, schema: dict) -> dict:
+        self.json_calls += 1
+        return {"prompt": prompt, "call": self.json_calls}
+
+    async def complete_text(self, prompt: str) -> str:
+        self.text_calls += 1
+        return f"{prompt}:{self.text_calls}"
+
+
+@pytest.mark.asyncio
+async def test_cached_client_reuses_identical_json_calls() -> None:
+    inner = CountingClient()
+    client = CachedLLMClient(inner, LLMResponseCache())
+
+    first = await client.complete_json("prompt", {"type": "object"})
+    second = await client.complete_json("prompt", {"type": "object"})
+    await client.complete_json("prompt", {"type": "array"})
+
+    assert first == second == {"prompt": "prompt", "call": 1}
+    assert inner.json_calls == 2
+    assert client.stats.hits == 1
+    assert client.stats.misses == 2
+    assert client.model_id == "test-model"
+
+
+@pytest.mark.asyncio
+async def test_cached_client_bypasses_sampled_calls_by_default() -> None:
+    inner = CountingClient(temperature=0.2)
+    client = CachedLLMClient(inner, LLMResponseCache())
+
+    await client.complete_text("prompt")
+    await client.complete_text("prompt")
+
+    assert inner.text_calls == 2
+    assert client.stats.bypassed == 2
+
+    forced = CachedLLMClient(inner, LLMResponseCache(), cache_nondeterministic=True)
+    assert await forced.complete_text("prompt") == await forced.complete_text("prompt")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tier_survives_new_cache_instance(tmp_path) -> None:
+    path = tmp_path / "llm.sqlite"
+    first_inner = CountingClient()
+    await CachedLLMClient(first_inner, LLMResponseCache(path=path)).complete_json("p", {})
+
+    second_inner = CountingClient()
+    cache = LLMResponseCache(path=path)
+    payload = await CachedLLMClient(second_inner, cache).complete_json("p", {})
+
+    assert payload == {"prompt": "p", "call": 1}
+    assert second_inner.json_calls == 0
+    assert cache.stats.disk_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tier_runs_off_the_event_loop(tmp_path) -> None:
+    on_loop: list[bool] = []
+
+    def _on_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    class RecordingCache(LLMResponseCache):
+        def _get_disk(self, key: str):
+            on_loop.append(_on_loop())
+            return super()._get_disk(key)
+
+        def _set_disk(self, key: str, expires_at: float, payload: bytes) -> None:
+            on_loop.append(_on_loop())
+            super()._set_disk(key, expires_at, payload)
+
+    client = CachedLLMClient(CountingClient(), RecordingCache(path=tmp_path / "llm.sqlite"))
+    await client.complete_json("p", {})
+
+    assert on_loop == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_cached_client_replays_streamed_json() -> None:
+    class StreamingClient(CountingClient):
+        stream_calls = 0
+
+        async def complete_text_stream(self, prompt: str, schema: dict | None = None) -> str:
+            self.stream_calls += 1
+            return 'Sure: {"summary": "ok"}'
+
+    inner = StreamingClient()
+    client = CachedLLMClient(inner, LLMResponseCache())
+    schema = {"properties": {"summary": {}}, "required": ["summary"]}
+
+    first = await complete_json_streaming(client, "prompt", schema)
+    second = await complete_json_streaming(client, "prompt", schema)
+
+    assert first == second == {"summary": "ok"}
+    assert inner.stream_calls == 1
+    assert client.stats.hits == 1
+
+    plain = CachedLLMClient(CountingClient(), LLMResponseCache())
+    assert await plain.complete_json_stream("prompt", schema) is None
+
+
+def test_cache_entries_expire_and_evict() -> None:
+    cache = LLMResponseCache(ttl_s=0, max_entries=1)
+    cache.set("a", {"value": 1})
+    assert cache.get("a") == (False, None)
+    assert cache.stats.expired == 1
+
+    cache = LLMResponseCache(max_entries=1)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (False, None)
+    assert cache.get("b") == (True, 2)
+
+
+def test_cache_key_depends_on_identity_and_prompt() -> None:
+    identity = {"provider": "openai", "model": "m", "temperature": 0}
+    schema = {"type": "object"}
+    key = build_cache_key(identity, "complete_json", "prompt", schema)
+    assert key == build_cache_key(dict(identity), "complete_json", "prompt", dict(schema))
+    assert key != build_cache_key({**identity, "model": "other"}, "complete_json", "prompt", schema)
+    assert key != build_cache_key(identity, "complete_json", "other", schema)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from trustai_core.llm.anthropic_client import AnthropicClient, ModelNotFoundError
+from trustai_core.llm.hedging import HedgeConfig, Hedger, LatencyHistogram, reset_hedgers
+from trustai_core.llm.retry import RetryPolicy
+
+
+def test_latency_histogram_quantile_and_hedge_delay() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.quantile(0.95) is None
+    for _ in range(95):
+        histogram.record(0.1)
+    for _ in range(5):
+        histogram.record(5.0)
+    assert 0.1 <= histogram.quantile(0.95) < 0.2
+    assert histogram.quantile(0.99) >= 5.0
+
+    hedger = Hedger(HedgeConfig(enabled=True, min_samples=10, default_delay_s=3.0))
+    assert hedger.hedge_delay("m") == 3.0
+    for _ in range(10):
+        hedger.record("m", 0.5)
+    assert 0.5 <= hedger.hedge_delay("m") < 0.7
+
+
+@pytest.mark.asyncio
+async def test_hedger_takes_first_result_and_cancels_loser() -> None:
+    hedger = Hedger(HedgeConfig(enabled=True, default_delay_s=0.01))
+    cancelled: list[str] = []
+
+    async def _call(model: str) -> str:
+        try:
+            await asyncio.sleep(1.0 if model == "slow" else 0.0)
+        except asyncio.CancelledError:
+            cancelled.append(model)
+            raise
+        return model
+
+    attempted: list[str] = []
+    result = await hedger.run(["slow", "fast"], _call, attempted=attempted)
+
+    assert result == "fast"
+    assert attempted == ["slow", "fast"]
+    assert cancelled == ["slow"]
+    assert hedger.hedges_fired == 1
+    assert hedger.hedge_wins == 1
+    # The cancelled primary still contributes a (lower-bound) latency sample.
+    assert hedger.histogram("slow").count == 1
+
+
+@pytest.mark.asyncio
+async def test_hedger_falls_through_immediately_on_fallback_error() -> None:
+    hedger = Hedger(HedgeConfig(enabled=True, default_delay_s=10.0))
+
+    async def _call(model: str) -> str:
+        if model == "missing":
+            raise ModelNotFoundError("missing")
+        return model
+
+    result = await asyncio.wait_for(
+        hedger.run(["missing", "ok"], _call, fallback_on=(ModelNotFoundError,)),
+        timeout=1.0,
+    )
+    assert result == "ok"
+    assert hedger.hedges_fired == 0
+    assert hedger.hedge_wins == 0
+
+
+@pytest.mark.asyncio
+async def test_anthropic_client_hedges_slow_primary(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("TRUSTAI_ANTHROPIC_MODEL", "CLAUDE_MODEL", "ANTHROPIC_MODEL"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("TRUSTAI_ANTHROPIC_HEDGE", "1")
+    monkeypatch.setenv("TRUSTAI_LLM_HEDGE_DEFAULT_DELAY_S", "0.01")
+    reset_hedgers()
+    client = AnthropicClient(api_key="test-key", retry_policy=RetryPolicy(max_attempts=1))
+    primary = client.model_id
+
+    async def _create(**kwargs: object) -> object:
+        if kwargs["model"] == primary:
+            await asyncio.sleep(1.0)
+        return SimpleNamespace(content=[SimpleNamespace(text=f"from {kwargs['model']}")])
+
+    client._client = SimpleNamespace(messages=SimpleNamespace(create=_create))
+    try:
+        text = await client.complete_text("prompt")
+    finally:
+        reset_hedgers()
+
+    assert text == f"from {client._models[1]}"
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from trustai_core.llm.anthropic_client import AnthropicClient
+from trustai_core.llm.base import LLMError
+from trustai_core.llm.openai_client import OpenAIClient
+from trustai_core.llm.pool import LLMClientPool, PoolConfig
+
+
+def _pool() -> LLMClientPool:
+    return LLMClientPool(PoolConfig(max_connections=8, max_keepalive_connections=4))
+
+
+def test_pool_reuses_clients_per_provider_model_and_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-anthropic-key")
+    pool = _pool()
+
+    first = pool.openai(model="gpt-4o-mini")
+    assert isinstance(first, OpenAIClient)
+    assert pool.openai(model="gpt-4o-mini") is first
+    assert pool.openai(model="gpt-4.1-mini") is not first
+    assert pool.openai(model="gpt-4o-mini", api_key="other-key") is not first
+    assert pool.openai(model="gpt-4o-mini", timeout_s=5.0) is not first
+    assert isinstance(pool.anthropic(), AnthropicClient)
+    assert pool.anthropic() is pool.anthropic()
+    assert pool.created == 5
+    assert pool.size() == 5
+
+
+def test_pool_scopes_clients_to_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+    pool = _pool()
+
+    async def _get() -> OpenAIClient:
+        return pool.openai()
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+
+    assert first is not second
+
+
+def test_pool_requires_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("OPEN_AI_KEY", raising=False)
+    with pytest.raises(LLMError):
+        _pool().openai()
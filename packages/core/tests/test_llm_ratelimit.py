@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from trustai_core.llm.ratelimit import (
+    ProviderRateLimiter,
+    RateLimitConfig,
+    TokenBucket,
+    get_rate_limiter,
+    parse_retry_after,
+    reset_rate_limiters,
+)
+
+
+def test_token_bucket_queues_once_capacity_is_spent() -> None:
+    bucket = TokenBucket(per_minute=600)
+    assert bucket.reserve(600) == 0.0
+    wait_s = bucket.reserve(6)
+    assert 0.5 < wait_s <= 0.6
+    assert bucket.reserve(6) > wait_s
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_in_flight_requests() -> None:
+    limiter = ProviderRateLimiter(RateLimitConfig(max_in_flight=2))
+    active = 0
+    peak = 0
+
+    async def _call() -> None:
+        nonlocal active, peak
+        async with limiter.limit():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*[_call() for _ in range(6)])
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_throttles_requests_per_minute() -> None:
+    limiter = ProviderRateLimiter(RateLimitConfig(requests_per_minute=1200))
+    started = time.monotonic()
+
+    for _ in range(1202):
+        async with limiter.limit():
+            pass
+
+    assert time.monotonic() - started >= 0.08
+    assert limiter.throttled >= 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_honors_retry_after_penalty() -> None:
+    limiter = ProviderRateLimiter(RateLimitConfig())
+    limiter.penalize(0.05)
+    started = time.monotonic()
+
+    async with limiter.limit():
+        pass
+
+    assert time.monotonic() - started >= 0.04
+    assert limiter.penalties == 1
+
+
+def test_parse_retry_after_headers() -> None:
+    exc = SimpleNamespace(response=SimpleNamespace(headers={"retry-after": "2"}))
+    assert parse_retry_after(exc) == 2.0
+    exc = SimpleNamespace(response=SimpleNamespace(headers={"retry-after-ms": "250"}))
+    assert parse_retry_after(exc) == 0.25
+    assert parse_retry_after(ValueError("no response")) is None
+
+
+def test_rate_limiters_are_shared_and_configured_from_env(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("TRUSTAI_LLM_RPM", "100")
+    monkeypatch.setenv("TRUSTAI_LLM_RPM_OPENAI", "500")
+    monkeypatch.setenv("TRUSTAI_LLM_MAX_IN_FLIGHT_ANTHROPIC", "4")
+    reset_rate_limiters()
+    try:
+        openai_limiter = get_rate_limiter("openai", "gpt-4o-mini")
+        assert get_rate_limiter("openai", "gpt-4o-mini") is openai_limiter
+        assert openai_limiter.config.requests_per_minute == 500
+        anthropic_limiter = get_rate_limiter("anthropic", "claude")
+        assert anthropic_limiter.config.requests_per_minute == 100
+        assert anthropic_limiter.config.max_in_flight == 4
+    finally:
+        reset_rate_limiters()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from trustai_core.llm.base import LLMError
+from trustai_core.llm.retry import SingleFlight, SingleFlightLLMClient
+from trustai_core.llm.streaming import complete_json_streaming
+
+
+class SlowClient:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    @property
+    def model_id(self) -> str:
+        return "slow-model"
+
+    async def complete_json(self, prompt: str, schema: dict) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise LLMError("provider down")
+        return {"prompt": prompt, "items": []}
+
+    async def complete_text(self, prompt: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return prompt.upper()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_request() -> None:
+    inner = SlowClient()
+    group = SingleFlight()
+    client = SingleFlightLLMClient(inner, group)
+
+    results = await asyncio.gather(*[client.complete_json("same", {}) for _ in range(5)])
+
+    assert inner.calls == 1
+    assert group.leaders == 1
+    assert group.followers == 4
+    assert all(result == {"prompt": "same", "items": []} for result in results)
+    results[0]["items"].append("mutated")
+    assert results[1]["items"] == []
+    assert group.inflight() == 0
+
+
+@pytest.mark.asyncio
+async def test_distinct_and_sequential_calls_are_not_coalesced() -> None:
+    inner = SlowClient()
+    client = SingleFlightLLMClient(inner, SingleFlight())
+
+    await asyncio.gather(client.complete_text("a"), client.complete_text("b"))
+    await client.complete_text("a")
+
+    assert inner.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter() -> None:
+    inner = SlowClient(fail=True)
+    client = SingleFlightLLMClient(inner, SingleFlight())
+
+    results = await asyncio.gather(
+        *[client.complete_json("same", {}) for _ in range(3)],
+        return_exceptions=True,
+    )
+
+    assert inner.calls == 1
+    assert all(isinstance(result, LLMError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call() -> None:
+    inner = SlowClient()
+    group = SingleFlight()
+    client = SingleFlightLLMClient(inner, group)
+
+    first = asyncio.ensure_future(client.complete_text("x"))
+    second = asyncio.ensure_future(client.complete_text("x"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "X"
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streamed_calls_share_one_request() -> None:
+    class StreamingClient(SlowClient):
+        async def complete_json_stream(self, prompt: str, schema: dict) -> dict:
+            return await self.complete_json(prompt, schema)
+
+    inner = StreamingClient()
+    client = SingleFlightLLMClient(inner, SingleFlight())
+
+    results = await asyncio.gather(
+        *[complete_json_streaming(client, "same", {}) for _ in range(3)]
+    )
+
+    assert inner.calls == 1
+    assert all(result == {"prompt": "same", "items": []} for result in results)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from trustai_core.llm.anthropic_client import AnthropicClient
+from trustai_core.llm.openai_client import OpenAIClient
+from trustai_core.llm.retry import RetryPolicy
+from trustai_core.llm.streaming import (
+    JSONObjectStreamValidator,
+    StreamValidationError,
+    complete_json_streaming,
+)
+
+SCHEMA = {
+    "properties": {"summary": {}, "gri_trace": {}, "notes": {}},
+    "required": ["summary", "gri_trace"],
+}
+
+
+class FakeStream:
+    def __init__(self, items: list[object]) -> None:
+        self._items = items
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self) -> FakeStream:
+        return self
+
+    async def __anext__(self) -> object:
+        if self.consumed >= len(self._items):
+            raise StopAsyncIteration
+        item = self._items[self.consumed]
+        self.consumed += 1
+        return item
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _openai_chunk(text: str) -> object:
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+def _anthropic_event(text: str) -> object:
+    return SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text=text))
+
+
+class FakeCompletions:
+    def __init__(self, attempts: list[list[str]]) -> None:
+        self._attempts = attempts
+        self.streams: list[FakeStream] = []
+
+    async def create(self, **kwargs: object) -> FakeStream:
+        assert kwargs["stream"] is True
+        chunks = self._attempts[len(self.streams)]
+        stream = FakeStream([_openai_chunk(chunk) for chunk in chunks])
+        self.streams.append(stream)
+        return stream
+
+
+def test_validator_accepts_object_and_ignores_nested_keys() -> None:
+    validator = JSONObjectStreamValidator.from_schema(SCHEMA)
+    assert not validator.feed('{"summary": "a \\"quoted\\" {x}", ')
+    assert validator.feed('"gri_trace": {"other": [1, {"deep": 2}]}} trailing')
+    assert validator.keys == ["summary", "gri_trace"]
+    assert validator.payload()["gri_trace"]["other"][1] == {"deep": 2}
+
+
+def test_validator_rejects_unexpected_key_mid_stream() -> None:
+    validator = JSONObjectStreamValidator.from_schema(SCHEMA)
+    with pytest.raises(StreamValidationError, match="unexpected key: answer"):
+        validator.feed('{"answer": ')
+
+
+def test_validator_rejects_missing_required_keys_and_truncation() -> None:
+    validator = JSONObjectStreamValidator.from_schema(SCHEMA)
+    with pytest.raises(StreamValidationError, match="gri_trace"):
+        validator.feed('{"summary": "x"}')
+    truncated = JSONObjectStreamValidator.from_schema(SCHEMA)
+    truncated.feed('{"summary": "x", "gri')
+    with pytest.raises(StreamValidationError, match="truncated"):
+        truncated.payload()
+
+
+def test_validator_requires_object_start_unless_preamble_allowed() -> None:
+    with pytest.raises(StreamValidationError):
+        JSONObjectStreamValidator().feed("Sure! {")
+    validator = JSONObjectStreamValidator(allow_preamble=True)
+    assert validator.feed('Sure! {"a": 1}')
+    assert validator.payload() == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_cancels_bad_generation_and_retries() -> None:
+    client = OpenAIClient(api_key="test-key", retry_policy=RetryPolicy(min_wait=0, max_wait=0))
+    completions = FakeCompletions(
+        [
+            ['{"answer": ', '"never read"', "}"],
+            ['{"summary": "ok", ', '"gri_trace": {}}'],
+        ]
+    )
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    payload = await client.complete_json_stream("prompt", SCHEMA)
+
+    assert payload == {"summary": "ok", "gri_trace": {}}
+    assert completions.streams[0].closed
+    assert completions.streams[0].consumed == 1
+    assert completions.streams[1].closed
+
+
+@pytest.mark.asyncio
+async def test_anthropic_text_stream_feeds_json_helper(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TRUSTAI_ANTHROPIC_MODEL", raising=False)
+    monkeypatch.delenv("CLAUDE_MODEL", raising=False)
+    monkeypatch.delenv("ANTHROPIC_MODEL", raising=False)
+    client = AnthropicClient(api_key="test-key")
+    stream = FakeStream(
+        [
+            SimpleNamespace(type="message_start"),
+            _anthropic_event('Here it is: {"summary": "ok", '),
+            _anthropic_event('"gri_trace": {}}'),
+            _anthropic_event(" extra"),
+        ]
+    )
+
+    async def _create(**kwargs: object) -> FakeStream:
+        return stream
+
+    client._client = SimpleNamespace(messages=SimpleNamespace(create=_create))
+
+    payload = await complete_json_streaming(client, "prompt", SCHEMA)
+
+    assert payload == {"summary": "ok", "gri_trace": {}}
+    assert stream.closed
+    assert stream.consumed == 3
+
+
+@pytest.mark.asyncio
+async def test_streaming_helper_skips_clients_without_stream_support() -> None:
+    class PlainClient:
+        async def complete_json(self, prompt: str, schema: dict) -> dict:
+            return {}
+
+        async def complete_text(self, prompt: str) -> str:
+            return ""
+
+    assert await complete_json_streaming(PlainClient(), "prompt", SCHEMA) is None
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from trustai_core.agents.reasoner import Reasoner
+from trustai_core.arbiter.evaluator import Evaluator
+from trustai_core.core.encoder import AtomEncoder
+from trustai_core.core.memory import ItemMemory
+from trustai_core.llm.cache import CachedLLMClient, LLMResponseCache
+from trustai_core.llm.retry import SingleFlight, SingleFlightLLMClient
+from trustai_core.orchestrator.loop import verify_and_fix
+from trustai_core.packs.loader import load_pack
+from trustai_core.schemas.atoms import AtomModel, ManifestModel
+from trustai_core.utils.canonicalize import sort_atoms
+
+
+def _status(value: str) -> ManifestModel:
+    atom = AtomModel(
+        subject="bridge",
+        predicate="status",
+        obj=value,
+        is_true=True,
+        confidence=1.0,
+    )
+    return ManifestModel(atoms=sort_atoms([atom]))
+
+
+class KeywordPerceiver:
+    async def extract_evidence_atoms(self, text: str, pack) -> ManifestModel:
+        return _status("safe")
+
+    async def extract_claim_atoms(self, answer: str, pack) -> ManifestModel:
+        return _status("unsafe" if "unsafe" in answer else "safe")
+
+
+class RotatingReasoner:
+    def __init__(self, answers: list[str]) -> None:
+        self._answers = answers
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_answer(self, user_text: str, pack, evidence=None, feedback=None) -> str:
+        answer = self._answers[self.calls % len(self._answers)]
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return answer
+
+
+async def _verify(reasoner, num_candidates: int, max_iters: int):
+    memory = ItemMemory()
+    pack = load_pack("general", memory)
+    return await verify_and_fix(
+        user_text="Is the bridge safe?",
+        pack_name=pack.name,
+        perceiver=KeywordPerceiver(),
+        reasoner=reasoner,
+        arbiter=Evaluator(AtomEncoder(memory)),
+        max_iters=max_iters,
+        num_candidates=num_candidates,
+    )
+
+
+@pytest.mark.asyncio
+async def test_best_of_concurrent_candidates_converges_in_one_iteration() -> None:
+    reasoner = RotatingReasoner(["The bridge is unsafe.", "The bridge is unsafe.", "It is safe."])
+
+    result = await _verify(reasoner, num_candidates=3, max_iters=1)
+
+    assert result.status == "verified"
+    assert result.final_answer == "It is safe."
+    assert len(result.iterations) == 1
+    assert reasoner.calls == 3
+    assert reasoner.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_single_candidate_is_default() -> None:
+    reasoner = RotatingReasoner(["It is safe."])
+
+    result = await _verify(reasoner, num_candidates=1, max_iters=1)
+
+    assert result.status == "verified"
+    assert reasoner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_num_candidates_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="num_candidates"):
+        await _verify(RotatingReasoner(["x"]), num_candidates=0, max_iters=1)
+
+
+class RotatingTextClient:
+    def __init__(self, answers: list[str]) -> None:
+        self._answers = answers
+        self.calls = 0
+
+    @property
+    def model_id(self) -> str:
+        return "rotating"
+
+    async def complete_json(self, prompt: str, schema: dict) -> dict:
+        raise AssertionError("not used")
+
+    async def complete_text(self, prompt: str) -> str:
+        answer = self._answers[self.calls % len(self._answers)]
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return answer
+
+
+@pytest.mark.asyncio
+async def test_candidates_bypass_single_flight_and_cache() -> None:
+    inner = RotatingTextClient(["The bridge is unsafe.", "The bridge is unsafe.", "It is safe."])
+    cache = LLMResponseCache(ttl_s=60)
+    client = SingleFlightLLMClient(
+        CachedLLMClient(inner, cache, cache_nondeterministic=True), SingleFlight()
+    )
+
+    result = await _verify(Reasoner(client), num_candidates=3, max_iters=1)
+
+    assert inner.calls == 3
+    assert result.final_answer == "It is safe."
+    assert cache.stats.bypassed == 3
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+from trustai_core.duty.models import DutyFlow
+from trustai_core.duty.scenarios import DutyScenario, build_scenario_grid, sweep_duty_scenarios
 from trustai_core.packs.tariff.evidence.models import EvidenceSource
-from trustai_core.packs.tariff.mutations.engine import build_lever_proof
 from trustai_core.packs.tariff.models import (
     CompositionComponent,
     EssentialCharacter,
     GriStep,
     GriStepResult,
     GriTrace,
+    Mutation,
     TariffBaseline,
     TariffCitation,
     TariffDossier,
     TariffOptimized,
     WhatIfCandidate,
 )
+from trustai_core.packs.tariff.mutations.engine import build_lever_proof
 from trustai_core.packs.tariff.mutations.models import ProductDossier
+from trustai_core.packs.tariff_us.duty.calculator import USDutyCalculator
 
 
 def _evidence_bundle() -> list[EvidenceSource]:
@@ -175,3 +179,98 @@ def test_no_product_dossier_returns_no_levers() -> None:
     evidence_payload = [source.model_dump() for source in evidence]
     proof = build_lever_proof(None, dossier, evidence, evidence_payload, top_k=3)
     assert proof.selected_levers == []
+
+
+def _mutation(mutation_id: str, category: str, expected_hts_change: str) -> Mutation:
+    return Mutation(
+        id=mutation_id,
+        title=mutation_id,
+        category=category,
+        change="Change",
+        expected_effect="Effect",
+        expected_hts_change=expected_hts_change,
+        expected_savings_note="Note",
+        rationale="Rationale",
+        legal_rationale="Legal rationale",
+        risk_level="low",
+        constraints=[],
+        required_evidence=[],
+    )
+
+
+def _footwear_sweep():
+    flow = DutyFlow(importing_country="US", origin_country="VN", effective_date="2024-06-01")
+    return sweep_duty_scenarios(
+        USDutyCalculator(),
+        flow,
+        build_scenario_grid(["6404.11.90", "6402.99"], origins=["VN"]),
+        baseline=DutyScenario(line_id="6404.11.90", origin_country="VN"),
+    )
+
+
+def test_lever_savings_use_matching_duty_sweep_scenario() -> None:
+    product = ProductDossier(
+        product_summary="Athletic footwear",
+        upper_materials=[
+            {"material": "textile", "pct": 60.0},
+            {"material": "leather", "pct": 40.0},
+        ],
+    )
+    dossier = _tariff_dossier().model_copy(
+        update={"mutations": [_mutation("m1", "materials", "6402.99")]}
+    )
+    evidence = _evidence_bundle()
+    evidence_payload = [source.model_dump() for source in evidence]
+    sweep = _footwear_sweep()
+
+    proof = build_lever_proof(
+        product,
+        dossier,
+        evidence,
+        evidence_payload,
+        top_k=3,
+        duty_sweep=sweep,
+    )
+
+    assert proof.duty_sweep is not None
+    assert proof.duty_sweep.best().scenario.line_id == "6402.99"
+    savings = {
+        _sequence_ids(lever): lever.savings_estimate.duty_savings_pct
+        for lever in proof.selected_levers
+    }
+    assert savings[("op64_upper_material_shift",)] == 15.0
+
+
+def test_lever_savings_without_matching_scenario_fall_back_to_dossier_rates() -> None:
+    product = ProductDossier(
+        product_summary="Athletic footwear",
+        upper_materials=[
+            {"material": "textile", "pct": 60.0},
+            {"material": "leather", "pct": 40.0},
+        ],
+    )
+    # A construction mutation does not describe the material levers the search selects.
+    dossier = _tariff_dossier().model_copy(
+        update={"mutations": [_mutation("m1", "construction", "6402.99")]}
+    )
+    evidence = _evidence_bundle()
+    evidence_payload = [source.model_dump() for source in evidence]
+
+    proof = build_lever_proof(
+        product,
+        dossier,
+        evidence,
+        evidence_payload,
+        top_k=3,
+        duty_sweep=_footwear_sweep(),
+    )
+
+    assert proof.selected_levers
+    for lever in proof.selected_levers:
+        # Baseline 20.0 minus optimized 10.0 from the dossier.
+        assert lever.savings_estimate.duty_savings_pct == 10.0
+        assert lever.savings_estimate.savings_estimate_type == "duty_savings"
+
+
+def _sequence_ids(lever) -> tuple[str, ...]:
+    return tuple(step.operator_id for step in lever.sequence)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import orjson
+import pytest
+from trustai_core.llm.base import LLMError
+from trustai_core.packs.registry import PackContext, get_pack_runner
+
+
+def _rejected_proposal() -> dict:
+    fixture = Path("storage/benchmarks/tariff/fixtures/fixture_positive.json")
+    proposal = orjson.loads(fixture.read_bytes())["proposals"][0]
+    proposal["mutations"] = []
+    return proposal
+
+
+class _ScriptedClient:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+        self._proposal = _rejected_proposal()
+
+    async def complete_json(self, prompt: str, schema: dict) -> dict:
+        if not prompt.startswith("You are a compliance critic"):
+            self.events.append("propose")
+            await asyncio.sleep(0)
+            return self._proposal
+        self.events.append("critic:start")
+        await asyncio.sleep(0.01)
+        self.events.append("critic:end")
+        return {
+            "unsupported": [],
+            "missing": ["origin certificate"],
+            "conflicts": [],
+            "suggested_fixes": [],
+            "revised_questions_for_user": [],
+        }
+
+    async def complete_text(self, prompt: str) -> str:
+        raise LLMError("text completions are not scripted")
+
+
+def _run(pack: str, pipeline: str) -> tuple[object, list[str]]:
+    client = _ScriptedClient()
+
+    def _no_anthropic() -> _ScriptedClient:
+        raise LLMError("Anthropic API key is missing")
+
+    runner = get_pack_runner(
+        pack,
+        PackContext(
+            llm_mode="live",
+            openai_model="scripted",
+            claude_model="scripted",
+            openai_client_factory=lambda: client,
+            anthropic_client_factory=_no_anthropic,
+        ),
+    )
+    assert runner is not None
+    result = asyncio.run(
+        runner.run("Textile upper sneaker with rubber sole", {"max_iters": 2, "pipeline": pipeline})
+    )
+    return result, client.events
+
+
+@pytest.mark.parametrize("pack", ["tariff", "tariff_us"])
+def test_sequential_loop_waits_for_critic(pack: str) -> None:
+    result, events = _run(pack, "off")
+    assert events == ["propose", "critic:start", "critic:end"] * 2
+    assert "insufficient_mutations" in result.iterations[0].rejected_because
+    assert result.critic_outputs[0].missing == ["origin certificate"]
+
+
+@pytest.mark.parametrize("pack", ["tariff", "tariff_us"])
+def test_skip_critic_when_local_gates_reject(pack: str) -> None:
+    result, events = _run(pack, "skip_critic")
+    assert events == ["propose", "propose"]
+    assert len(result.iterations) == 2
+    assert "insufficient_mutations" in result.iterations[0].rejected_because
+    assert all(not critique.missing for critique in result.critic_outputs)
+
+
+@pytest.mark.parametrize("pack", ["tariff", "tariff_us"])
+def test_speculative_revision_overlaps_critic(pack: str) -> None:
+    result, events = _run(pack, "speculative")
+    assert events[:4] == ["propose", "critic:start", "propose", "critic:end"]
+    assert events.count("propose") == 2
+    assert len(result.iterations) == 2
+    assert result.critic_outputs[0].missing == ["origin certificate"]
+    assert "missing" in result.iterations[0].rejected_because
+
+
+def test_invalid_pipeline_mode_is_rejected() -> None:
+    with pytest.raises(ValueError, match="pipeline"):
+        _run("tariff_us", "eager")
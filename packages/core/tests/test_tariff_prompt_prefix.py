@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from trustai_core.llm.anthropic_client import _user_content
+from trustai_core.llm.openai_client import OpenAIClient
+from trustai_core.llm.prompt import PromptWithPrefix, prompt_parts
+from trustai_core.packs.tariff.evidence.models import EvidenceSource
+from trustai_core.packs.tariff.models import TariffDossier
+from trustai_core.packs.tariff_us.pack import _tariff_dossier_schema
+from trustai_core.packs.tariff_us.prompts import (
+    build_tariff_critic_prompt,
+    build_tariff_proposal_prompt,
+    build_tariff_revision_prompt,
+)
+
+EVIDENCE = [
+    EvidenceSource(
+        source_id="HTS.6404",
+        source_type="hts",
+        title="Heading 6404",
+        effective_date="2025-01-01",
+        text="Footwear with outer soles of rubber and uppers of textile materials",
+    )
+]
+
+
+def _dossier() -> TariffDossier:
+    fixture = Path("storage/benchmarks/tariff/fixtures/fixture_positive.json")
+    payload = orjson.loads(fixture.read_bytes())
+    return TariffDossier.model_validate(payload["proposals"][0])
+
+
+def test_prompts_keep_schema_and_evidence_in_stable_prefix() -> None:
+    schema = _tariff_dossier_schema()
+    first = build_tariff_proposal_prompt("Sneaker A", None, EVIDENCE, schema)
+    second = build_tariff_proposal_prompt("Sneaker B", "fix GRI", EVIDENCE, schema)
+
+    assert isinstance(first, PromptWithPrefix)
+    assert first.prefix == second.prefix
+    assert "HTS.6404" in first.prefix
+    assert "Sneaker A" not in first.prefix
+    assert second.suffix.startswith("Input:\nSneaker B")
+    assert "fix GRI" in second.suffix
+    assert str(first) == first.prefix + first.suffix
+
+    dossier = _dossier()
+    revisions = [
+        build_tariff_revision_prompt("Sneaker", dossier, {"round": i}, f"m{i}", EVIDENCE, schema)
+        for i in range(2)
+    ]
+    critiques = [
+        build_tariff_critic_prompt(text, dossier, EVIDENCE, schema) for text in ("a", "b")
+    ]
+    assert revisions[0].prefix == revisions[1].prefix
+    assert critiques[0].prefix == critiques[1].prefix
+    assert dossier.model_dump_json() in critiques[0].suffix
+
+
+def test_dossier_schema_is_memoized() -> None:
+    assert _tariff_dossier_schema() is _tariff_dossier_schema()
+
+
+def test_anthropic_marks_prefix_for_prompt_caching(monkeypatch: pytest.MonkeyPatch) -> None:
+    prompt = PromptWithPrefix("instructions\n\n", "Input:\nx")
+    blocks = _user_content(prompt)
+    assert blocks == [
+        {"type": "text", "text": "instructions\n\n", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "Input:\nx"},
+    ]
+    assert _user_content("plain prompt") == "plain prompt"
+    assert prompt_parts("plain prompt") == ("", "plain prompt")
+
+    monkeypatch.setenv("TRUSTAI_ANTHROPIC_PROMPT_CACHE", "0")
+    assert _user_content(prompt) == "instructions\n\nInput:\nx"
+
+
+@pytest.mark.asyncio
+async def test_openai_routes_shared_prefix_to_same_cache_key() -> None:
+    calls: list[dict] = []
+
+    async def _create(**kwargs: object) -> object:
+        calls.append(kwargs)
+        message = SimpleNamespace(content='{"ok": true}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    client = OpenAIClient(api_key="test-key")
+    completions = SimpleNamespace(create=_create)
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    await client.complete_json(PromptWithPrefix("shared\n\n", "one"), {})
+    await client.complete_json(PromptWithPrefix("shared\n\n", "two"), {})
+    await client.complete_json("no prefix", {})
+
+    assert calls[0]["prompt_cache_key"] == calls[1]["prompt_cache_key"]
+    assert calls[0]["messages"][1]["content"] == "shared\n\none"
+    assert "prompt_cache_key" not in calls[2]
@@ -56,8 +56,8 @@ def main() -> None:
     parser.add_argument(
         "--mode",
         default="fixture",
-        choices=["fixture", "live"],
-        help="Runner mode (fixture or live)",
+        choices=["fixture", "live", "batch"],
+        help="Runner mode (fixture, live, or batch for provider batch APIs)",
     )
     args = parser.parse_args()
 